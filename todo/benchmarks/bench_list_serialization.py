@@ -0,0 +1,57 @@
+"""
+Compares the two GET /todos serialization paths over in-memory rows:
+Pydantic models + model_dump + json.dumps versus the direct row encoder.
+
+    python -m todo.benchmarks.bench_list_serialization [--limit 100] [--repeat 2000]
+"""
+import argparse
+import json
+import timeit
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+from uuid import uuid4
+from todo.read.src.app.queries import ListTodosQuery, ListTodosQueryHandler
+
+def make_rows(count: int):
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "id": uuid4(),
+            "title": f"Todo number {i}",
+            "description": "Benchmark row with a short description" if i % 2 else None,
+            "priority": ("Low", "Medium", "High", None)[i % 4],
+            "due_date": now + timedelta(days=i) if i % 3 else None,
+            "is_completed": bool(i % 5 == 0),
+            "created_at": now - timedelta(minutes=i),
+            "updated_at": now - timedelta(minutes=i)
+        }
+        for i in range(count)
+    ]
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    repo = MagicMock()
+    repo.list_todos.return_value = {"items": make_rows(args.limit), "total_count": 10_000}
+    handler = ListTodosQueryHandler(repo)
+    query = ListTodosQuery(limit=args.limit)
+
+    model_body = json.dumps(handler.handle(query).model_dump())
+    fast_body = handler.handle_json(query)
+    if model_body != fast_body:
+        raise SystemExit("Serialization paths disagree")
+
+    model = timeit.timeit(lambda: json.dumps(handler.handle(query).model_dump()), number=args.repeat)
+    fast = timeit.timeit(lambda: handler.handle_json(query), number=args.repeat)
+    print(json.dumps({
+        "rows": args.limit,
+        "model_us_per_request": round(model / args.repeat * 1e6, 1),
+        "fast_us_per_request": round(fast / args.repeat * 1e6, 1),
+        "speedup": round(model / fast, 2)
+    }))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Database benchmarks: command throughput on the write side, list latency by
+table size and page depth, and projection throughput on the read side. Run
+explicitly (the file is not part of the default test collection):
+
+    python -m pytest -q todo/benchmarks/bench_macro.py
+
+Sizes are tuned through BENCHMARK_COMMANDS, BENCHMARK_EVENTS,
+BENCHMARK_REQUESTS, BENCHMARK_TABLE_SIZES and BENCHMARK_PAGE_DEPTHS. The JSON
+report is printed at the end and written to BENCHMARK_RESULTS if set.
+"""
+import json
+import os
+import time
+from typing import List
+from uuid import uuid4
+import pytest
+from todo.write.src.app.commands import CommandEnvelope
+from todo.write.src.app.create_todo_command import CreateTodoCommandHandler, todo_from_payload
+from todo.write.src.app.create_todos_batch_command import CreateTodosBatchCommandHandler
+from todo.write.src.domain.events import TodoCreated
+from todo.write.src.infra.repo import TodoRepository
+from todo.read.src.app.projections import TodoProjectionHandler
+from todo.read.src.app.queries import ListTodosQuery, ListTodosQueryHandler, encode_cursor
+from todo.read.src.infra.repo import TodoReadRepository
+from .bench_list_serialization import make_rows
+from .timing import rate, summarize, time_each
+
+def _env_ints(name: str, default: str) -> List[int]:
+    return [int(v) for v in os.environ.get(name, default).split(",") if v]
+
+COMMANDS = _env_ints("BENCHMARK_COMMANDS", "500")[0]
+EVENTS = _env_ints("BENCHMARK_EVENTS", "5000")[0]
+REQUESTS = _env_ints("BENCHMARK_REQUESTS", "100")[0]
+TABLE_SIZES = _env_ints("BENCHMARK_TABLE_SIZES", "1000,10000,100000")
+PAGE_DEPTHS = _env_ints("BENCHMARK_PAGE_DEPTHS", "1,10,100")
+PAGE_LIMIT = 20
+BATCH_SIZE = 100
+
+def _payload(i: int) -> dict:
+    return {"title": f"Benchmark todo {i}", "description": "Created by the benchmark suite", "priority": "Medium"}
+
+def _seed_read_todos(conn, count: int) -> None:
+    with conn.cursor() as cur:
+        with cur.copy(
+            "COPY santiago_munoz_read.todos "
+            "(id, title, description, priority, due_date, is_completed, created_at, updated_at) FROM STDIN"
+        ) as copy:
+            for row in make_rows(count):
+                copy.write_row((
+                    row["id"], row["title"], row["description"], row["priority"],
+                    row["due_date"], row["is_completed"], row["created_at"], row["updated_at"]
+                ))
+    conn.execute("""
+        UPDATE santiago_munoz_read.todo_counts c
+        SET total = (SELECT COUNT(*) FROM santiago_munoz_read.todos t WHERE t.is_completed = c.is_completed)
+    """)
+    conn.execute("ANALYZE santiago_munoz_read.todos")
+
+def _cursor_at(conn, offset: int) -> str:
+    if offset == 0:
+        return ""
+    row = conn.execute(
+        "SELECT id, created_at FROM santiago_munoz_read.todos ORDER BY created_at DESC, id DESC OFFSET %s LIMIT 1",
+        (offset - 1,)
+    ).fetchone()
+    return encode_cursor("created_at", "desc", {"id": row[0], "created_at": row[1]})
+
+def test_create_throughput(bench_db, record_benchmark):
+    handler = CreateTodoCommandHandler(TodoRepository())
+    envelopes = [CommandEnvelope(command_id=uuid4(), payload=_payload(i)) for i in range(COMMANDS)]
+
+    start = time.perf_counter()
+    durations = time_each(handler.handle, envelopes)
+    elapsed = time.perf_counter() - start
+
+    assert bench_db.execute("SELECT COUNT(*) FROM santiago_munoz_write.todos").fetchone()[0] == COMMANDS
+    record_benchmark("create_single", creates_per_sec=rate(COMMANDS, elapsed), latency=summarize(durations))
+
+    # Replays are answered from processed_commands
+    durations = time_each(handler.handle, envelopes[:REQUESTS])
+    record_benchmark("create_replay", latency=summarize(durations))
+
+def test_batch_create_throughput(bench_db, record_benchmark):
+    handler = CreateTodosBatchCommandHandler(TodoRepository())
+    batches = COMMANDS // BATCH_SIZE or 1
+    envelopes = [
+        CommandEnvelope(command_id=uuid4(), payload=[_payload(i) for i in range(BATCH_SIZE)])
+        for _ in range(batches)
+    ]
+
+    start = time.perf_counter()
+    durations = time_each(handler.handle, envelopes)
+    elapsed = time.perf_counter() - start
+
+    assert bench_db.execute("SELECT COUNT(*) FROM santiago_munoz_write.todos").fetchone()[0] == batches * BATCH_SIZE
+    record_benchmark(
+        "create_batch", batch_size=BATCH_SIZE,
+        creates_per_sec=rate(batches * BATCH_SIZE, elapsed), latency=summarize(durations)
+    )
+
+@pytest.mark.parametrize("table_size", TABLE_SIZES)
+def test_list_latency(bench_db, record_benchmark, table_size):
+    _seed_read_todos(bench_db, table_size)
+    handler = ListTodosQueryHandler(TodoReadRepository())
+
+    for depth in PAGE_DEPTHS:
+        offset = (depth - 1) * PAGE_LIMIT
+        if offset >= table_size:
+            continue
+
+        offset_query = ListTodosQuery(page=depth, limit=PAGE_LIMIT)
+        durations = time_each(handler.handle_json, [offset_query] * REQUESTS)
+        record_benchmark("list_offset", table_size=table_size, page=depth, limit=PAGE_LIMIT, latency=summarize(durations))
+
+        keyset_query = ListTodosQuery(limit=PAGE_LIMIT, cursor=_cursor_at(bench_db, offset))
+        durations = time_each(handler.handle_json, [keyset_query] * REQUESTS)
+        assert len(json.loads(handler.handle_json(keyset_query))["items"]) == min(PAGE_LIMIT, table_size - offset)
+        record_benchmark("list_keyset", table_size=table_size, page=depth, limit=PAGE_LIMIT, latency=summarize(durations))
+
+    # Word-prefix search (full-text index) and in-word substring (trigram index)
+    for q in ("number 42", "mber 42"):
+        search_query = ListTodosQuery(limit=PAGE_LIMIT, q=q, count="estimate")
+        durations = time_each(handler.handle_json, [search_query] * REQUESTS)
+        record_benchmark("list_search", table_size=table_size, q=q, limit=PAGE_LIMIT, latency=summarize(durations))
+
+def _events(count: int) -> List[dict]:
+    events = []
+    for i in range(count):
+        todo = todo_from_payload(_payload(i))
+        events.append({
+            "event_id": str(uuid4()),
+            "event_type": "TodoCreated",
+            "payload": json.loads(TodoCreated.from_todo(todo).payload_json())
+        })
+    return events
+
+def test_projection_throughput(bench_db, record_benchmark):
+    handler = TodoProjectionHandler(TodoReadRepository())
+    events = _events(EVENTS)
+    batches = [events[i:i + BATCH_SIZE] for i in range(0, EVENTS, BATCH_SIZE)]
+
+    start = time.perf_counter()
+    durations = time_each(handler.handle_batch, batches)
+    elapsed = time.perf_counter() - start
+
+    assert bench_db.execute("SELECT COUNT(*) FROM santiago_munoz_read.todos").fetchone()[0] == EVENTS
+    record_benchmark(
+        "projection_batch", batch_size=BATCH_SIZE,
+        events_per_sec=rate(EVENTS, elapsed), batch_latency=summarize(durations)
+    )
+
+    singles = _events(min(EVENTS, COMMANDS))
+    start = time.perf_counter()
+    durations = time_each(lambda e: handler.handle(e["event_id"], e["event_type"], e["payload"]), singles)
+    elapsed = time.perf_counter() - start
+    record_benchmark("projection_single", events_per_sec=rate(len(singles), elapsed), latency=summarize(durations))
+
+    # Redelivered batches are filtered by processed_events
+    start = time.perf_counter()
+    time_each(handler.handle_batch, batches)
+    record_benchmark("projection_redelivery", events_per_sec=rate(EVENTS, time.perf_counter() - start))
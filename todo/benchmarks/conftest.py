@@ -0,0 +1,75 @@
+"""
+Fixtures for the database benchmarks (bench_*.py, run explicitly with
+pytest). They need either BENCHMARK_DATABASE_URL pointing at an empty
+database the suite may take over, or pytest-postgresql with a local
+PostgreSQL install to spin up a throwaway server. Without either they skip.
+"""
+import json
+import os
+import platform
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+import pytest
+from .schema import scratch_database
+
+_results: List[Dict[str, Any]] = []
+
+@pytest.fixture(scope="session")
+def bench_db_url(request):
+    """
+    URL of a database with the full schema deployed.
+    """
+    with scratch_database(request, "BENCHMARK_DATABASE_URL", "todo_bench") as url:
+        yield url
+
+@pytest.fixture
+def bench_db(bench_db_url, monkeypatch):
+    """
+    Points both sides at the benchmark database with fresh pools and empty
+    tables. Yields an autocommit connection for seeding and inspection.
+    """
+    import psycopg
+    from todo.write.src.infra import db as write_db
+    from todo.read.src.infra import db as read_db
+
+    monkeypatch.setenv("DATABASE_URL", bench_db_url)
+    monkeypatch.delenv("READ_DATABASE_URL", raising=False)
+    with psycopg.connect(bench_db_url, autocommit=True) as conn:
+        conn.execute("""
+            TRUNCATE santiago_munoz_write.todos, santiago_munoz_write.processed_commands,
+                santiago_munoz_write.outbox, santiago_munoz_read.todos,
+                santiago_munoz_read.processed_events
+        """)
+        conn.execute("UPDATE santiago_munoz_read.todo_counts SET total = 0")
+        write_db.close_pool()
+        read_db.close_pools()
+        yield conn
+        write_db.close_pool()
+        read_db.close_pools()
+
+@pytest.fixture
+def record_benchmark(bench_db):
+    """
+    `record_benchmark(name, **metrics)` adds an entry to the JSON report
+    written at the end of the session.
+    """
+    server_version = bench_db.info.server_version
+
+    def record(name: str, **metrics: Any) -> None:
+        _results.append({"name": name, "postgres": server_version, **metrics})
+    return record
+
+def pytest_terminal_summary(terminalreporter):
+    if not _results:
+        return
+    report = json.dumps({
+        "suite": "macro",
+        "finished_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "results": _results,
+    }, indent=2)
+    path = os.environ.get("BENCHMARK_RESULTS")
+    if path:
+        with open(path, "w") as f:
+            f.write(report + "\n")
+    terminalreporter.write_line(report)
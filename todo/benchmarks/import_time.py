@@ -0,0 +1,78 @@
+"""
+Cold-start import budget for the Lambda entrypoints, measured with
+`python -X importtime` in a fresh interpreter per module. Exits non-zero
+when any entrypoint takes longer than the budget to import or pulls in a
+module that should only be loaded on demand.
+
+    python -m todo.benchmarks.import_time [--budget-ms 450] [--runs 5] [--top 10]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+ENTRYPOINTS = [
+    "todo.write.src.entrypoints.api",
+    "todo.read.src.entrypoints.api",
+]
+
+# Loaded on first request (or first traced request) instead of at import
+DEFERRED_MODULES = ["psycopg", "psycopg_pool", "aws_xray_sdk"]
+
+def measure(module: str) -> Tuple[int, List[Tuple[int, str]], List[str]]:
+    """
+    Imports `module` in a fresh interpreter. Returns its cumulative import
+    time in microseconds, (cumulative us, name) for each module it imports
+    directly, and which DEFERRED_MODULES ended up loaded.
+    """
+    probe = f"import sys, {module}; print(','.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", probe],
+        capture_output=True, text=True, check=True
+    )
+    total = 0
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        # importtime indents nested imports by two spaces per level
+        depth = (len(name) - len(name.lstrip())) // 2
+        if name.strip() == module:
+            total = int(cumulative)
+        elif depth == 1:
+            imports.append((int(cumulative), name.strip()))
+    loaded = [m for m in result.stdout.strip().split(",") if m]
+    return total, imports, loaded
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=float(os.environ.get("IMPORT_TIME_BUDGET_MS", "450")))
+    parser.add_argument("--runs", type=int, default=5, help="Best of N runs is reported, to damp noise")
+    parser.add_argument("--top", type=int, default=10, help="Heaviest top-level imports to list per entrypoint")
+    args = parser.parse_args()
+
+    report: Dict[str, Dict] = {}
+    failed = False
+    for module in ENTRYPOINTS:
+        runs = [measure(module) for _ in range(args.runs)]
+        total, imports, loaded = min(runs, key=lambda r: r[0])
+        heaviest = sorted(imports, reverse=True)
+        over_budget = total / 1000 > args.budget_ms
+        failed = failed or over_budget or bool(loaded)
+        report[module] = {
+            "import_ms": round(total / 1000, 1),
+            "budget_ms": args.budget_ms,
+            "over_budget": over_budget,
+            "eagerly_loaded": loaded,
+            "heaviest": [{"module": name, "ms": round(us / 1000, 1)} for us, name in heaviest[:args.top]]
+        }
+
+    print(json.dumps(report, indent=2))
+    if failed:
+        raise SystemExit("Cold-start import budget exceeded")
+
+if __name__ == "__main__":
+    main()
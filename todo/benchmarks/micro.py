@@ -0,0 +1,142 @@
+"""
+In-process micro-benchmarks of the create and list hot paths: domain object
+construction, outbox/command payload building and list serialization, plus
+the memory a create command allocates. No database is needed. Results are printed as one JSON document so runs can be
+stored and compared over time.
+
+    python -m todo.benchmarks.micro [--repeat 5] [--number 2000] [--rows 100] [--output results.json]
+"""
+import argparse
+import json
+import platform
+import timeit
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Any
+from unittest.mock import MagicMock
+from uuid import uuid4
+from todo.write.src.app.commands import CommandEnvelope
+from todo.write.src.app.create_todo_command import CreateTodoCommandHandler, todo_from_payload, todo_response_body
+from todo.write.src.domain.events import TodoCreated
+from todo.write.src.domain.model import Todo, Priority
+from todo.write.src.infra import instrumentation
+from todo.write.src.entrypoints.routes import _create_response
+from todo.write.src.infra.repo import TodoRepository, _create_params
+from todo.read.src.app.queries import ListTodosQuery, ListTodosQueryHandler
+from .bench_list_serialization import make_rows
+
+PAYLOAD = {
+    "title": "Benchmark todo",
+    "description": "A short description of the thing to do",
+    "priority": "High",
+    "due_date": "2030-01-01T12:00:00Z"
+}
+
+class _ParamsOnlyRepository(TodoRepository):
+    """
+    TodoRepository that builds the statement parameters of a create but
+    never sends them, leaving only the in-process cost of a command.
+    """
+    def _create(self, items, command_id, status_code, result_body) -> None:
+        _create_params(items, command_id, status_code, result_body)
+
+def _cases(rows: int) -> Dict[str, Callable[[], Any]]:
+    todo = Todo.create(
+        title=PAYLOAD["title"],
+        description=PAYLOAD["description"],
+        priority=Priority.HIGH,
+        due_date=datetime.now(timezone.utc) + timedelta(days=7)
+    )
+    event = TodoCreated.from_todo(todo)
+    batch = [(todo, event)] * 100
+    command_id = uuid4()
+    body = todo_response_body(todo)
+
+    repo = MagicMock()
+    repo.list_todos.return_value = {"items": make_rows(rows), "total_count": 10_000}
+    list_handler = ListTodosQueryHandler(repo)
+    query = ListTodosQuery(limit=rows)
+
+    command_handler = CreateTodoCommandHandler(_ParamsOnlyRepository())
+
+    def create_command():
+        # Everything a POST /todos does in-process: envelope, domain objects,
+        # outbox payload, idempotency record and response body
+        envelope = CommandEnvelope(command_id=command_id, payload=PAYLOAD)
+        return _create_response(command_handler.handle(envelope))
+
+    def todo_and_event():
+        todo = todo_from_payload(PAYLOAD)
+        return todo, TodoCreated.from_todo(todo)
+
+    def disabled_stage():
+        with instrumentation.stage("domain"):
+            pass
+
+    return {
+        "instrumentation_stage_disabled": disabled_stage,
+        "create_command": create_command,
+        "todo_and_event": todo_and_event,
+        "todo_create": lambda: Todo.create(title=PAYLOAD["title"], description=PAYLOAD["description"], priority=Priority.HIGH),
+        "todo_from_payload": lambda: todo_from_payload(PAYLOAD),
+        "todo_created_from_todo": lambda: TodoCreated.from_todo(todo),
+        "event_payload_json": lambda: TodoCreated.from_todo(todo).payload_json(),
+        "todo_response_body": lambda: todo_response_body(todo),
+        "create_params_single": lambda: _create_params([(todo, event)], command_id, 201, body),
+        "create_params_batch_100": lambda: _create_params(batch, command_id, 201, {"items": [body] * 100}),
+        f"list_handle_json_{rows}_rows": lambda: list_handler.handle_json(query),
+        f"list_handle_model_{rows}_rows": lambda: json.dumps(list_handler.handle(query).model_dump()),
+    }
+
+# Cases whose memory use is reported as well: what one call allocates at
+# its peak and how much its result keeps alive
+MEMORY_CASES = ("todo_and_event", "create_command")
+
+def _memory(fn: Callable[[], Any], number: int) -> Dict[str, float]:
+    fn()  # warm up caches so they are not counted
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        fn()
+        peak = tracemalloc.get_traced_memory()[1] - base
+        kept = [fn() for _ in range(number)]
+        retained = tracemalloc.get_traced_memory()[0] - base
+    finally:
+        tracemalloc.stop()
+    del kept
+    return {"peak_bytes_per_op": peak, "retained_bytes_per_op": round(retained / number, 1)}
+
+def run(repeat: int, number: int, rows: int) -> Dict[str, Any]:
+    results = {}
+    cases = _cases(rows)
+    for name, fn in cases.items():
+        # Best of `repeat` rounds; the minimum is the least noisy estimate
+        best = min(timeit.repeat(fn, repeat=repeat, number=number)) / number
+        results[name] = {"us_per_op": round(best * 1e6, 3), "ops_per_sec": round(1 / best, 1)}
+    for name in MEMORY_CASES:
+        results[name].update(_memory(cases[name], number))
+    return {
+        "suite": "micro",
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "repeat": repeat,
+        "number": number,
+        "results": results,
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=2000, help="Calls per round")
+    parser.add_argument("--rows", type=int, default=100, help="Rows per list response")
+    parser.add_argument("--output", help="Also write the JSON report to this file")
+    args = parser.parse_args()
+
+    report = json.dumps(run(args.repeat, args.number, args.rows), indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report + "\n")
+    print(report)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Deploys the sqitch migrations in todo/db to a scratch database without
+needing sqitch itself: changes are read from sqitch.plan and their deploy
+scripts are run in plan order.
+"""
+import os
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Generator, List
+
+if TYPE_CHECKING:
+    import psycopg
+
+DB_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "db")
+
+def plan_changes(plan_path: str = os.path.join(DB_DIR, "sqitch.plan")) -> List[str]:
+    """
+    Change names in deployment order. Pragmas (%...), tags (@...) and blank
+    or comment lines are skipped.
+    """
+    changes = []
+    with open(plan_path) as f:
+        for line in f:
+            line = line.strip()
+            if not line or line[0] in "%@#":
+                continue
+            changes.append(line.split()[0])
+    return changes
+
+def deploy_scripts(db_dir: str = DB_DIR) -> List[str]:
+    return [os.path.join(db_dir, "deploy", f"{name}.sql") for name in plan_changes(os.path.join(db_dir, "sqitch.plan"))]
+
+def load_schema(conn: "psycopg.Connection") -> None:
+    """
+    Runs every deploy script on `conn`, which must be in autocommit mode:
+    the scripts manage their own BEGIN/COMMIT.
+    """
+    for path in deploy_scripts():
+        with open(path) as f:
+            conn.execute(f.read())
+
+def _url(host: str, port: int, user: str, password: str, dbname: str) -> str:
+    auth = f"{user}:{password}" if password else user
+    return f"postgresql://{auth}@{host}:{port}/{dbname}"
+
+@contextmanager
+def scratch_database(request, url_env: str, dbname: str) -> Generator[str, None, None]:
+    """
+    For pytest fixtures: yields the URL of a database with the schema
+    deployed. Uses the database named by the `url_env` environment variable
+    (which must be empty or disposable), otherwise a throwaway
+    pytest-postgresql server, and skips the test when neither is available.
+    """
+    import pytest
+
+    psycopg = pytest.importorskip("psycopg")
+
+    url = os.environ.get(url_env)
+    if url:
+        with psycopg.connect(url, autocommit=True) as conn:
+            load_schema(conn)
+        yield url
+        return
+
+    try:
+        from pytest_postgresql.janitor import DatabaseJanitor
+    except ImportError:
+        pytest.skip(f"Set {url_env} or install pytest-postgresql")
+    try:
+        proc = request.getfixturevalue("postgresql_proc")
+    except Exception as e:
+        pytest.skip(f"Could not start PostgreSQL: {e}")
+
+    with DatabaseJanitor(
+        user=proc.user, host=proc.host, port=proc.port, dbname=dbname,
+        version=proc.version, password=proc.password
+    ):
+        url = _url(proc.host, proc.port, proc.user, proc.password, dbname)
+        with psycopg.connect(url, autocommit=True) as conn:
+            load_schema(conn)
+        yield url
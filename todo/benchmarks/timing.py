@@ -0,0 +1,39 @@
+"""
+Latency and throughput summaries shared by the benchmark modules.
+"""
+import time
+from typing import Any, Callable, Dict, List, Sequence
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of `samples` (0 < pct <= 100).
+    """
+    ordered = sorted(samples)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+def summarize(samples: Sequence[float]) -> Dict[str, float]:
+    """
+    p50/p99/mean/max in milliseconds for per-operation durations in seconds.
+    """
+    return {
+        "count": len(samples),
+        "p50_ms": round(percentile(samples, 50) * 1000, 3),
+        "p99_ms": round(percentile(samples, 99) * 1000, 3),
+        "mean_ms": round(sum(samples) / len(samples) * 1000, 3),
+        "max_ms": round(max(samples) * 1000, 3),
+    }
+
+def time_each(fn: Callable[[Any], Any], args: List[Any]) -> List[float]:
+    """
+    Calls `fn(arg)` for every arg and returns each call's wall-clock duration.
+    """
+    durations = []
+    for arg in args:
+        start = time.perf_counter()
+        fn(arg)
+        durations.append(time.perf_counter() - start)
+    return durations
+
+def rate(count: int, seconds: float) -> float:
+    return round(count / seconds, 1) if seconds > 0 else float("inf")
@@ -0,0 +1,270 @@
+import os
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Generator, Optional
+
+# Per-request stage timings and database counters, enabled with
+# INSTRUMENTATION_SINK=emf (CloudWatch embedded metric format on stdout) or
+# INSTRUMENTATION_SINK=log (one structured log line per request), or by
+# installing a sink with set_sink(). When no sink is configured no request
+# scope is opened, and every hook below is a ContextVar lookup that returns
+# a shared no-op.
+#
+# Shared by both sides; each side's infra.instrumentation binds its service
+# name, which labels the EMF metrics unless POWERTOOLS_SERVICE_NAME is set.
+
+class RequestMetrics:
+    """
+    Everything measured while serving one request. Times are accumulated in
+    milliseconds under `stage_<name>`, `db_acquire`, `db_query` and `total`;
+    counts under `db_queries` and `db_round_trips`.
+    """
+    __slots__ = ("operation", "service", "timings", "counts")
+
+    def __init__(self, operation: str, service: str = "todo"):
+        self.operation = operation
+        self.service = service
+        self.timings: Dict[str, float] = {}
+        self.counts: Dict[str, int] = {}
+
+    def add_time(self, name: str, seconds: float) -> None:
+        self.timings[name] = self.timings.get(name, 0.0) + seconds * 1000
+
+    def incr(self, name: str, amount: int = 1) -> None:
+        self.counts[name] = self.counts.get(name, 0) + amount
+
+Sink = Callable[[RequestMetrics], None]
+
+_current: ContextVar[Optional[RequestMetrics]] = ContextVar("todo_request_metrics", default=None)
+_NOOP = nullcontext()
+_UNSET: Any = object()
+_sink: Optional[Sink] = _UNSET
+_emf: Dict[str, Any] = {}
+
+def _emf_sink(metrics: RequestMetrics) -> None:
+    from aws_lambda_powertools.metrics import Metrics, MetricUnit
+
+    emf = _emf.get(metrics.service)
+    if emf is None:
+        emf = _emf[metrics.service] = Metrics(
+            namespace=os.environ.get("POWERTOOLS_METRICS_NAMESPACE", "TodoApp"),
+            service=os.environ.get("POWERTOOLS_SERVICE_NAME", metrics.service)
+        )
+    emf.add_dimension(name="operation", value=metrics.operation)
+    for name, value in metrics.timings.items():
+        emf.add_metric(name=name, unit=MetricUnit.Milliseconds, value=value)
+    for name, value in metrics.counts.items():
+        emf.add_metric(name=name, unit=MetricUnit.Count, value=value)
+    emf.flush_metrics()
+
+def _log_sink(metrics: RequestMetrics) -> None:
+    from aws_lambda_powertools import Logger
+
+    Logger(child=True).info("Request metrics", extra={
+        "operation": metrics.operation,
+        "service": metrics.service,
+        "timings_ms": {k: round(v, 3) for k, v in metrics.timings.items()},
+        "counts": metrics.counts
+    })
+
+def _sink_from_env() -> Optional[Sink]:
+    return {"emf": _emf_sink, "log": _log_sink}.get(os.environ.get("INSTRUMENTATION_SINK", "").lower())
+
+def set_sink(sink: Optional[Sink]) -> None:
+    """
+    Replaces the configured sink, e.g. with `list.append` in tests and
+    benchmarks. None disables instrumentation.
+    """
+    global _sink
+    _sink = sink
+
+def _get_sink() -> Optional[Sink]:
+    global _sink
+    if _sink is _UNSET:
+        _sink = _sink_from_env()
+    return _sink
+
+@contextmanager
+def _request_scope(operation: str, service: str, sink: Sink) -> Generator[RequestMetrics, None, None]:
+    metrics = RequestMetrics(operation, service)
+    token = _current.set(metrics)
+    start = time.perf_counter()
+    try:
+        yield metrics
+    finally:
+        metrics.add_time("total", time.perf_counter() - start)
+        _current.reset(token)
+        sink(metrics)
+
+def request(operation: str, service: str = "todo"):
+    """
+    Opens the measurement scope for one request of `service`; its metrics go
+    to the sink on exit. Async tasks spawned inside the scope report into it
+    as well.
+    """
+    sink = _get_sink()
+    return _NOOP if sink is None else _request_scope(operation, service, sink)
+
+def current() -> Optional[RequestMetrics]:
+    return _current.get()
+
+class _Stage:
+    __slots__ = ("metrics", "name", "start")
+
+    def __init__(self, metrics: RequestMetrics, name: str):
+        self.metrics = metrics
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc) -> None:
+        self.metrics.add_time(self.name, time.perf_counter() - self.start)
+
+def stage(name: str):
+    """
+    Times the enclosed block as `stage_<name>` of the current request.
+    """
+    metrics = _current.get()
+    return _NOOP if metrics is None else _Stage(metrics, f"stage_{name}")
+
+def record_acquire(started: float) -> None:
+    """
+    Records a pool checkout that began at perf_counter() value `started`.
+    """
+    metrics = _current.get()
+    if metrics is not None:
+        metrics.add_time("db_acquire", time.perf_counter() - started)
+
+def _statement(cursor, elapsed: float) -> None:
+    metrics = _current.get()
+    if metrics is None:
+        return
+    metrics.add_time("db_query", elapsed)
+    metrics.incr("db_queries")
+    if cursor.connection.pgconn.pipeline_status:
+        # Queued client-side; the round trip happens when a result is fetched
+        cursor._round_trip_pending = True
+    else:
+        metrics.incr("db_round_trips")
+
+def _fetched(cursor, elapsed: float) -> None:
+    metrics = _current.get()
+    if metrics is None:
+        return
+    metrics.add_time("db_query", elapsed)
+    if cursor._round_trip_pending:
+        cursor._round_trip_pending = False
+        metrics.incr("db_round_trips")
+
+_timed_cursors: Dict[type, type] = {}
+
+def _timed_cursor(base: type) -> type:
+    """
+    Subclass of psycopg's (Async)Cursor `base` that reports execute and fetch
+    times. A statement outside pipeline mode counts as one round trip; in
+    pipeline mode the first fetch after queued statements does.
+    """
+    timed = _timed_cursors.get(base)
+    if timed is not None:
+        return timed
+
+    import psycopg
+
+    if issubclass(base, psycopg.AsyncCursor):
+        class TimedCursor(base):
+            _round_trip_pending = False
+
+            async def execute(self, *args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return await super().execute(*args, **kwargs)
+                finally:
+                    _statement(self, time.perf_counter() - start)
+
+            async def executemany(self, *args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return await super().executemany(*args, **kwargs)
+                finally:
+                    _statement(self, time.perf_counter() - start)
+
+            async def fetchone(self):
+                start = time.perf_counter()
+                try:
+                    return await super().fetchone()
+                finally:
+                    _fetched(self, time.perf_counter() - start)
+
+            async def fetchmany(self, size: int = 0):
+                start = time.perf_counter()
+                try:
+                    return await super().fetchmany(size)
+                finally:
+                    _fetched(self, time.perf_counter() - start)
+
+            async def fetchall(self):
+                start = time.perf_counter()
+                try:
+                    return await super().fetchall()
+                finally:
+                    _fetched(self, time.perf_counter() - start)
+    else:
+        class TimedCursor(base):
+            _round_trip_pending = False
+
+            def execute(self, *args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return super().execute(*args, **kwargs)
+                finally:
+                    _statement(self, time.perf_counter() - start)
+
+            def executemany(self, *args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return super().executemany(*args, **kwargs)
+                finally:
+                    _statement(self, time.perf_counter() - start)
+
+            def fetchone(self):
+                start = time.perf_counter()
+                try:
+                    return super().fetchone()
+                finally:
+                    _fetched(self, time.perf_counter() - start)
+
+            def fetchmany(self, size: int = 0):
+                start = time.perf_counter()
+                try:
+                    return super().fetchmany(size)
+                finally:
+                    _fetched(self, time.perf_counter() - start)
+
+            def fetchall(self):
+                start = time.perf_counter()
+                try:
+                    return super().fetchall()
+                finally:
+                    _fetched(self, time.perf_counter() - start)
+
+    _timed_cursors[base] = TimedCursor
+    return TimedCursor
+
+@contextmanager
+def _swap_cursor_factory(conn) -> Generator[None, None, None]:
+    original = conn.cursor_factory
+    conn.cursor_factory = _timed_cursor(original)
+    try:
+        yield
+    finally:
+        conn.cursor_factory = original
+
+def timed_cursors(conn):
+    """
+    While a request is being measured, cursors opened on the pooled `conn`
+    (including `conn.execute`) report their statements. The connection's
+    own cursor factory is restored before it goes back to the pool.
+    """
+    return _NOOP if _current.get() is None else _swap_cursor_factory(conn)
@@ -0,0 +1,14 @@
+from typing import Callable
+
+def purge_in_batches(delete_batch: Callable[[int], int], batch_size: int, keep_going: Callable[[], bool] = lambda: True) -> int:
+    """
+    Calls `delete_batch(batch_size)` until a batch comes back short or
+    `keep_going` returns False. Returns the total number of rows deleted.
+    """
+    total = 0
+    while keep_going():
+        deleted = delete_batch(batch_size)
+        total += deleted
+        if deleted < batch_size:
+            break
+    return total
@@ -0,0 +1,41 @@
+import os
+from functools import wraps
+from typing import Callable, Optional
+
+# Built on first traced invocation. Constructing a Tracer loads the X-Ray SDK
+# (and botocore with it), which is most of this package's import time.
+_tracer = None
+
+def tracing_enabled() -> bool:
+    """
+    Mirrors Powertools' own switch: tracing is off when
+    POWERTOOLS_TRACE_DISABLED is set or when running outside Lambda.
+    """
+    if os.environ.get("POWERTOOLS_TRACE_DISABLED", "").lower() in ("1", "true"):
+        return False
+    return bool(os.environ.get("AWS_LAMBDA_FUNCTION_NAME"))
+
+def get_tracer():
+    global _tracer
+    if _tracer is None:
+        from aws_lambda_powertools import Tracer
+        _tracer = Tracer()
+    return _tracer
+
+def capture_lambda_handler(lambda_handler: Callable) -> Callable:
+    """
+    Deferred `Tracer.capture_lambda_handler`: nothing is imported when the
+    module is loaded, and nothing at all when tracing is disabled.
+    """
+    traced: Optional[Callable] = None
+
+    @wraps(lambda_handler)
+    def wrapper(event, context):
+        nonlocal traced
+        if not tracing_enabled():
+            return lambda_handler(event, context)
+        if traced is None:
+            traced = get_tracer().capture_lambda_handler(lambda_handler)
+        return traced(event, context)
+
+    return wrapper
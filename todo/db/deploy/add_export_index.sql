@@ -0,0 +1,7 @@
+BEGIN;
+
+-- Exports stream rows in (updated_at, id) order and resume from an updated_at
+-- watermark; this index serves both without sorting the table.
+CREATE INDEX idx_read_todos_updated_at_id ON santiago_munoz_read.todos(updated_at, id);
+
+COMMIT;
@@ -0,0 +1,9 @@
+BEGIN;
+
+-- Keyset pagination compares (sort key, id) row values, so each sort needs an
+-- index on exactly that pair. A single ascending index serves both
+-- directions through backward scans. NULL due dates sort as 'infinity'.
+CREATE INDEX idx_read_todos_created_at_id ON santiago_munoz_read.todos(created_at, id);
+CREATE INDEX idx_read_todos_due_date_key_id ON santiago_munoz_read.todos((COALESCE(due_date, 'infinity'::timestamptz)), id);
+
+COMMIT;
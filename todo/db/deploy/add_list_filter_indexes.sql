@@ -0,0 +1,27 @@
+BEGIN;
+
+-- Every list sort is ORDER BY <key> <dir>, id <dir>, so (key, id) indexes
+-- return rows already ordered in either direction (backward scans cover
+-- DESC) and LIMIT stops after one page. A leading is_completed serves the
+-- status and overdue filters; other filters are applied during the same
+-- ordered scan.
+--
+-- Priority sorts High > Medium > Low > unset through an expression index
+-- rather than a stored column, which would rewrite the whole table. The
+-- repository orders by the same expression (PRIORITY_RANK_SQL).
+CREATE INDEX idx_read_todos_status_created_at_id ON santiago_munoz_read.todos(is_completed, created_at, id);
+CREATE INDEX idx_read_todos_status_due_date_id ON santiago_munoz_read.todos(is_completed, due_date, id);
+CREATE INDEX idx_read_todos_status_priority_rank_id ON santiago_munoz_read.todos(
+    is_completed, (CASE priority WHEN 'High' THEN 3 WHEN 'Medium' THEN 2 WHEN 'Low' THEN 1 ELSE 0 END), id
+);
+CREATE INDEX idx_read_todos_due_date_id ON santiago_munoz_read.todos(due_date, id);
+CREATE INDEX idx_read_todos_priority_rank_id ON santiago_munoz_read.todos(
+    (CASE priority WHEN 'High' THEN 3 WHEN 'Medium' THEN 2 WHEN 'Low' THEN 1 ELSE 0 END), id
+);
+
+-- Superseded by the composites above and by idx_read_todos_created_at_id
+DROP INDEX santiago_munoz_read.idx_read_todos_is_completed;
+DROP INDEX santiago_munoz_read.idx_read_todos_created_at;
+DROP INDEX santiago_munoz_read.idx_read_todos_due_date;
+
+COMMIT;
@@ -0,0 +1,7 @@
+BEGIN;
+
+-- The relay only ever reads pending rows in id order. A partial index keeps
+-- that lookup proportional to the backlog rather than to all of history.
+CREATE INDEX idx_write_outbox_pending ON santiago_munoz_write.outbox(id) WHERE published_at IS NULL;
+
+COMMIT;
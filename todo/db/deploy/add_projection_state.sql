@@ -0,0 +1,12 @@
+BEGIN;
+
+-- Single-row version stamp bumped by every projection write. Readers compare
+-- it with the version their cached results were computed at.
+CREATE TABLE santiago_munoz_read.projection_state (
+    id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+    version BIGINT NOT NULL DEFAULT 0
+);
+
+INSERT INTO santiago_munoz_read.projection_state (id, version) VALUES (TRUE, 0);
+
+COMMIT;
@@ -0,0 +1,7 @@
+BEGIN;
+
+-- Retention deletes expired idempotency records oldest first, in small batches
+CREATE INDEX idx_write_processed_commands_processed_at ON santiago_munoz_write.processed_commands(processed_at);
+CREATE INDEX idx_read_processed_events_processed_at ON santiago_munoz_read.processed_events(processed_at);
+
+COMMIT;
@@ -0,0 +1,17 @@
+BEGIN;
+
+-- Projection version at which each todo last changed. Every projection
+-- write bumps projection_state.version under its row lock, so versions are
+-- assigned (and committed) in order: a reader that sees a version also
+-- sees every earlier one, which makes it a safe change-feed watermark.
+-- Existing rows start at 0 and are all delivered to a client's first sync.
+ALTER TABLE santiago_munoz_read.todos ADD COLUMN change_seq BIGINT NOT NULL DEFAULT 0;
+
+-- Watermarks below the floor predate the last rebuild, which replaced the
+-- table without per-row change versions; such clients must sync again
+-- from the start.
+ALTER TABLE santiago_munoz_read.projection_state ADD COLUMN changes_floor BIGINT NOT NULL DEFAULT 0;
+
+CREATE INDEX idx_read_todos_change_seq_id ON santiago_munoz_read.todos(change_seq, id);
+
+COMMIT;
@@ -0,0 +1,19 @@
+BEGIN;
+
+-- Per-status row counts maintained by the projection upsert, so listing
+-- never has to COUNT(*) the todos table.
+CREATE TABLE santiago_munoz_read.todo_counts (
+    is_completed BOOLEAN PRIMARY KEY,
+    total BIGINT NOT NULL DEFAULT 0
+);
+
+-- Block projection writes while seeding so no upsert is missed
+LOCK TABLE santiago_munoz_read.todos IN SHARE MODE;
+
+INSERT INTO santiago_munoz_read.todo_counts (is_completed, total)
+SELECT s.is_completed, COUNT(t.id)
+FROM (VALUES (FALSE), (TRUE)) AS s(is_completed)
+LEFT JOIN santiago_munoz_read.todos t ON t.is_completed = s.is_completed
+GROUP BY s.is_completed;
+
+COMMIT;
@@ -0,0 +1,22 @@
+BEGIN;
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Search document kept in step by Postgres itself: the projection upsert
+-- writes title and description and the generated column follows. The
+-- 'simple' configuration does no stemming, so prefix queries ('plan:*')
+-- match exactly what users typed. Titles weigh more than descriptions in
+-- ranking.
+ALTER TABLE santiago_munoz_read.todos ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+    setweight(to_tsvector('simple', COALESCE(title, '')), 'A') ||
+    setweight(to_tsvector('simple', COALESCE(description, '')), 'B')
+) STORED;
+
+CREATE INDEX idx_read_todos_search ON santiago_munoz_read.todos USING GIN (search_vector);
+
+-- Substring matches inside words (ILIKE '%...%'); the expression must match
+-- the one used by TodoReadRepository for the planner to use this index.
+CREATE INDEX idx_read_todos_search_trgm ON santiago_munoz_read.todos
+    USING GIN ((title || ' ' || COALESCE(description, '')) gin_trgm_ops);
+
+COMMIT;
@@ -0,0 +1,60 @@
+BEGIN;
+
+-- Monthly range partitions on created_at let retention drop a whole month of
+-- published events at once instead of deleting it row by row. The partition
+-- key has to be part of the primary key; ids keep coming from the same
+-- sequence, so they stay unique on their own.
+LOCK TABLE santiago_munoz_write.outbox IN ACCESS EXCLUSIVE MODE;
+
+ALTER TABLE santiago_munoz_write.outbox RENAME TO outbox_unpartitioned;
+ALTER INDEX santiago_munoz_write.outbox_pkey RENAME TO outbox_unpartitioned_pkey;
+ALTER INDEX santiago_munoz_write.idx_write_outbox_pending RENAME TO idx_write_outbox_unpartitioned_pending;
+
+CREATE TABLE santiago_munoz_write.outbox (
+    id BIGINT NOT NULL DEFAULT nextval('santiago_munoz_write.outbox_id_seq'),
+    aggregate_id UUID NOT NULL,
+    event_type VARCHAR(100) NOT NULL,
+    payload JSONB NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    published_at TIMESTAMPTZ,
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+
+ALTER SEQUENCE santiago_munoz_write.outbox_id_seq OWNED BY santiago_munoz_write.outbox.id;
+
+CREATE INDEX idx_write_outbox_pending ON santiago_munoz_write.outbox(id) WHERE published_at IS NULL;
+
+-- Catch-all so inserts never fail if partition maintenance falls behind
+CREATE TABLE santiago_munoz_write.outbox_default PARTITION OF santiago_munoz_write.outbox DEFAULT;
+
+-- Partitions are named outbox_pYYYYMM and bounded on UTC month starts, one
+-- for every month from the oldest existing row through next month.
+DO $$
+DECLARE
+    month TIMESTAMP;
+BEGIN
+    FOR month IN
+        SELECT generate_series(
+            date_trunc('month', COALESCE(MIN(created_at), NOW()) AT TIME ZONE 'UTC'),
+            date_trunc('month', NOW() AT TIME ZONE 'UTC') + INTERVAL '1 month',
+            INTERVAL '1 month'
+        )
+        FROM santiago_munoz_write.outbox_unpartitioned
+    LOOP
+        EXECUTE format(
+            'CREATE TABLE santiago_munoz_write.%I PARTITION OF santiago_munoz_write.outbox FOR VALUES FROM (%L) TO (%L)',
+            'outbox_p' || to_char(month, 'YYYYMM'),
+            to_char(month, 'YYYY-MM-DD') || ' 00:00:00+00',
+            to_char(month + INTERVAL '1 month', 'YYYY-MM-DD') || ' 00:00:00+00'
+        );
+    END LOOP;
+END
+$$;
+
+INSERT INTO santiago_munoz_write.outbox (id, aggregate_id, event_type, payload, created_at, published_at)
+SELECT id, aggregate_id, event_type, payload, created_at, published_at
+FROM santiago_munoz_write.outbox_unpartitioned;
+
+DROP TABLE santiago_munoz_write.outbox_unpartitioned;
+
+COMMIT;
@@ -0,0 +1,5 @@
+BEGIN;
+
+DROP INDEX santiago_munoz_read.idx_read_todos_updated_at_id;
+
+COMMIT;
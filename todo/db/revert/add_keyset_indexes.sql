@@ -0,0 +1,6 @@
+BEGIN;
+
+DROP INDEX santiago_munoz_read.idx_read_todos_due_date_key_id;
+DROP INDEX santiago_munoz_read.idx_read_todos_created_at_id;
+
+COMMIT;
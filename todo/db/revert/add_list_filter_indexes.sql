@@ -0,0 +1,13 @@
+BEGIN;
+
+CREATE INDEX idx_read_todos_is_completed ON santiago_munoz_read.todos(is_completed);
+CREATE INDEX idx_read_todos_created_at ON santiago_munoz_read.todos(created_at DESC);
+CREATE INDEX idx_read_todos_due_date ON santiago_munoz_read.todos(due_date ASC);
+
+DROP INDEX santiago_munoz_read.idx_read_todos_priority_rank_id;
+DROP INDEX santiago_munoz_read.idx_read_todos_due_date_id;
+DROP INDEX santiago_munoz_read.idx_read_todos_status_priority_rank_id;
+DROP INDEX santiago_munoz_read.idx_read_todos_status_due_date_id;
+DROP INDEX santiago_munoz_read.idx_read_todos_status_created_at_id;
+
+COMMIT;
@@ -0,0 +1,5 @@
+BEGIN;
+
+DROP INDEX santiago_munoz_write.idx_write_outbox_pending;
+
+COMMIT;
@@ -0,0 +1,5 @@
+BEGIN;
+
+DROP TABLE santiago_munoz_read.projection_state;
+
+COMMIT;
@@ -0,0 +1,6 @@
+BEGIN;
+
+DROP INDEX santiago_munoz_read.idx_read_processed_events_processed_at;
+DROP INDEX santiago_munoz_write.idx_write_processed_commands_processed_at;
+
+COMMIT;
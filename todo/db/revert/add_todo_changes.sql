@@ -0,0 +1,7 @@
+BEGIN;
+
+DROP INDEX santiago_munoz_read.idx_read_todos_change_seq_id;
+ALTER TABLE santiago_munoz_read.projection_state DROP COLUMN changes_floor;
+ALTER TABLE santiago_munoz_read.todos DROP COLUMN change_seq;
+
+COMMIT;
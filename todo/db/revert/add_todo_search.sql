@@ -0,0 +1,7 @@
+BEGIN;
+
+DROP INDEX santiago_munoz_read.idx_read_todos_search_trgm;
+DROP INDEX santiago_munoz_read.idx_read_todos_search;
+ALTER TABLE santiago_munoz_read.todos DROP COLUMN search_vector;
+
+COMMIT;
@@ -0,0 +1,27 @@
+BEGIN;
+
+LOCK TABLE santiago_munoz_write.outbox IN ACCESS EXCLUSIVE MODE;
+
+CREATE TABLE santiago_munoz_write.outbox_unpartitioned (
+    id BIGINT PRIMARY KEY DEFAULT nextval('santiago_munoz_write.outbox_id_seq'),
+    aggregate_id UUID NOT NULL,
+    event_type VARCHAR(100) NOT NULL,
+    payload JSONB NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    published_at TIMESTAMPTZ
+);
+
+INSERT INTO santiago_munoz_write.outbox_unpartitioned (id, aggregate_id, event_type, payload, created_at, published_at)
+SELECT id, aggregate_id, event_type, payload, created_at, published_at
+FROM santiago_munoz_write.outbox;
+
+ALTER SEQUENCE santiago_munoz_write.outbox_id_seq OWNED BY santiago_munoz_write.outbox_unpartitioned.id;
+
+-- Drops every partition along with the parent
+DROP TABLE santiago_munoz_write.outbox;
+
+ALTER TABLE santiago_munoz_write.outbox_unpartitioned RENAME TO outbox;
+ALTER INDEX santiago_munoz_write.outbox_unpartitioned_pkey RENAME TO outbox_pkey;
+CREATE INDEX idx_write_outbox_pending ON santiago_munoz_write.outbox(id) WHERE published_at IS NULL;
+
+COMMIT;
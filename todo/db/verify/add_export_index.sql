@@ -0,0 +1,5 @@
+BEGIN;
+
+SELECT 1/COUNT(*) FROM pg_indexes WHERE schemaname = 'santiago_munoz_read' AND indexname = 'idx_read_todos_updated_at_id';
+
+ROLLBACK;
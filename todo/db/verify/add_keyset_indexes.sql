@@ -0,0 +1,6 @@
+BEGIN;
+
+SELECT 1/COUNT(*) FROM pg_indexes WHERE schemaname = 'santiago_munoz_read' AND indexname = 'idx_read_todos_created_at_id';
+SELECT 1/COUNT(*) FROM pg_indexes WHERE schemaname = 'santiago_munoz_read' AND indexname = 'idx_read_todos_due_date_key_id';
+
+ROLLBACK;
@@ -0,0 +1,9 @@
+BEGIN;
+
+SELECT 1/COUNT(*) FROM pg_indexes WHERE schemaname = 'santiago_munoz_read' AND indexname = 'idx_read_todos_status_created_at_id';
+SELECT 1/COUNT(*) FROM pg_indexes WHERE schemaname = 'santiago_munoz_read' AND indexname = 'idx_read_todos_status_due_date_id';
+SELECT 1/COUNT(*) FROM pg_indexes WHERE schemaname = 'santiago_munoz_read' AND indexname = 'idx_read_todos_status_priority_rank_id';
+SELECT 1/COUNT(*) FROM pg_indexes WHERE schemaname = 'santiago_munoz_read' AND indexname = 'idx_read_todos_due_date_id';
+SELECT 1/COUNT(*) FROM pg_indexes WHERE schemaname = 'santiago_munoz_read' AND indexname = 'idx_read_todos_priority_rank_id';
+
+ROLLBACK;
@@ -0,0 +1,5 @@
+BEGIN;
+
+SELECT 1/COUNT(*) FROM pg_indexes WHERE schemaname = 'santiago_munoz_write' AND indexname = 'idx_write_outbox_pending';
+
+ROLLBACK;
@@ -0,0 +1,5 @@
+BEGIN;
+
+SELECT 1/COUNT(*) FROM santiago_munoz_read.projection_state;
+
+ROLLBACK;
@@ -0,0 +1,6 @@
+BEGIN;
+
+SELECT 1/COUNT(*) FROM pg_indexes WHERE schemaname = 'santiago_munoz_write' AND indexname = 'idx_write_processed_commands_processed_at';
+SELECT 1/COUNT(*) FROM pg_indexes WHERE schemaname = 'santiago_munoz_read' AND indexname = 'idx_read_processed_events_processed_at';
+
+ROLLBACK;
@@ -0,0 +1,7 @@
+BEGIN;
+
+SELECT change_seq FROM santiago_munoz_read.todos WHERE FALSE;
+SELECT changes_floor FROM santiago_munoz_read.projection_state WHERE FALSE;
+SELECT 1/COUNT(*) FROM pg_indexes WHERE schemaname = 'santiago_munoz_read' AND indexname = 'idx_read_todos_change_seq_id';
+
+ROLLBACK;
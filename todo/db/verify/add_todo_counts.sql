@@ -0,0 +1,5 @@
+BEGIN;
+
+SELECT is_completed, total FROM santiago_munoz_read.todo_counts WHERE FALSE;
+
+ROLLBACK;
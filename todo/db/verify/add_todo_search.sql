@@ -0,0 +1,7 @@
+BEGIN;
+
+SELECT search_vector FROM santiago_munoz_read.todos WHERE FALSE;
+SELECT 1/COUNT(*) FROM pg_indexes WHERE schemaname = 'santiago_munoz_read' AND indexname = 'idx_read_todos_search';
+SELECT 1/COUNT(*) FROM pg_indexes WHERE schemaname = 'santiago_munoz_read' AND indexname = 'idx_read_todos_search_trgm';
+
+ROLLBACK;
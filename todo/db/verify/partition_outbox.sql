@@ -0,0 +1,7 @@
+BEGIN;
+
+SELECT 1/COUNT(*) FROM pg_partitioned_table WHERE partrelid = 'santiago_munoz_write.outbox'::regclass;
+SELECT 1/COUNT(*) FROM pg_indexes WHERE schemaname = 'santiago_munoz_write' AND indexname = 'idx_write_outbox_pending';
+SELECT id, aggregate_id, event_type, payload, created_at, published_at FROM santiago_munoz_write.outbox WHERE FALSE;
+
+ROLLBACK;
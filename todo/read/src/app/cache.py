@@ -0,0 +1,135 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Callable, Hashable, Tuple
+from .queries import ListTodosQuery, ListTodosQueryHandler
+
+class QueryResultCache:
+    """
+    Bounded LRU cache whose entries expire after `ttl_seconds` and are only
+    served while the projection version they were computed at is current.
+    Not thread-safe; each Lambda container / worker process owns one.
+    """
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 5.0, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[int, float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    def get(self, key: Hashable, version: int) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        entry_version, expires_at, value = entry
+        if entry_version != version or self.clock() >= expires_at:
+            del self._entries[key]
+            self.stale += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, version: int, value: Any) -> None:
+        self._entries[key] = (version, self.clock() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale": self.stale,
+            "evictions": self.evictions,
+            "size": len(self._entries)
+        }
+
+def cache_key(query: ListTodosQuery) -> Hashable:
+    """
+    Normalized key: every query parameter, with order case-folded the same
+    way the repository treats it, plus the overdue reference minute.
+    """
+    params = query.model_dump()
+    params["order"] = params["order"].lower()
+    if query.as_of is not None:
+        params["as_of"] = query.as_of
+    return tuple(params.items())
+
+def list_etag(query: ListTodosQuery, version: int) -> str:
+    """
+    Entity tag for a list response: the projection version it reflects plus a
+    digest of the normalized query parameters.
+    """
+    digest = hashlib.sha1(repr(cache_key(query)).encode()).hexdigest()[:16]
+    return f'"{version}-{digest}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Weak comparison as required for If-None-Match, over a comma-separated list.
+    """
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+class CachedListTodosQueryHandler:
+    """
+    Serves list responses from a QueryResultCache. Each request costs one
+    cheap projection-version lookup; the page and count queries only run on
+    a miss or once a projection has applied new events.
+    """
+    def __init__(self, handler: ListTodosQueryHandler, cache: QueryResultCache):
+        self.handler = handler
+        self.cache = cache
+
+    def handle_json(self, query: ListTodosQuery, version: Optional[int] = None) -> str:
+        """
+        `version` may be passed when the caller already looked it up.
+        """
+        if not self.cache.enabled:
+            return self.handler.handle_json(query)
+
+        if version is None:
+            version = self.handler.repo.get_projection_version()
+        key = cache_key(query)
+        body = self.cache.get(key, version)
+        if body is None:
+            body = self.handler.handle_json(query)
+            self.cache.put(key, version, body)
+        return body
+
+    async def handle_json_async(self, query: ListTodosQuery, version: Optional[int] = None) -> str:
+        """
+        `handle_json` for a handler over an AsyncTodoReadRepository. The cache
+        itself is only touched between awaits, so it needs no locking.
+        """
+        if not self.cache.enabled:
+            return await self.handler.handle_json_async(query)
+
+        if version is None:
+            version = await self.handler.repo.get_projection_version()
+        key = cache_key(query)
+        body = self.cache.get(key, version)
+        if body is None:
+            body = await self.handler.handle_json_async(query)
+            self.cache.put(key, version, body)
+        return body
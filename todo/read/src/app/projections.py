@@ -1,8 +1,31 @@
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 from uuid import UUID
 from datetime import datetime
 from ..infra.repo import TodoReadRepository
 
+def read_model_row(event_type: str, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    The read-model columns an event sets (keyed like the repository's upsert
+    arguments, without event_id), or None for events that do not touch the
+    todos table. Shared by live projection and rebuilds.
+    """
+    if event_type == "TodoCreated":
+        # Parsing dates from ISO strings in the event payload
+        created_at = datetime.fromisoformat(payload["created_at"])
+        due_date = datetime.fromisoformat(payload["due_date"]) if payload.get("due_date") else None
+
+        return dict(
+            todo_id=UUID(payload["id"]),
+            title=payload["title"],
+            description=payload.get("description"),
+            priority=payload.get("priority"),
+            due_date=due_date,
+            is_completed=False,
+            created_at=created_at,
+            updated_at=created_at
+        )
+    return None
+
 class TodoProjectionHandler:
     def __init__(self, repo: TodoReadRepository):
         self.repo = repo
@@ -14,23 +37,50 @@ class TodoProjectionHandler:
         if event_type == "TodoCreated":
             self._project_todo_created(event_id, payload)
         # Add cases for updated/deleted here in the future
-    
+
+    def handle_batch(self, events: List[Dict[str, Any]]) -> List[str]:
+        """
+        Projects a batch of events ({'event_id', 'event_type', 'payload'}) in a
+        single read-side transaction. Returns the ids of the events that could
+        not be applied so that only those are retried. If the batch write
+        fails as a whole, events are re-applied one by one to isolate the bad
+        ones.
+        """
+        rows = []
+        failed = []
+        for event in events:
+            try:
+                row = self._to_row(event["event_id"], event["event_type"], event["payload"])
+            except (KeyError, TypeError, ValueError):
+                failed.append(str(event.get("event_id")))
+                continue
+            if row is not None:
+                rows.append(row)
+
+        if not rows:
+            return failed
+
+        try:
+            self.repo.upsert_many(rows)
+        except Exception:
+            for row in rows:
+                try:
+                    self.repo.upsert(**row)
+                except Exception:
+                    failed.append(str(row["event_id"]))
+        return failed
+
+    def _to_row(self, event_id: str, event_type: str, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        row = read_model_row(event_type, payload)
+        if row is not None:
+            row["event_id"] = UUID(event_id)
+        return row
+
+    def _todo_created_row(self, event_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        return self._to_row(event_id, "TodoCreated", payload)
+
     def _project_todo_created(self, event_id: str, payload: Dict[str, Any]) -> None:
         """
         Maps TodoCreated event to the read model.
         """
-        # Parsing dates from ISO strings in the event payload
-        created_at = datetime.fromisoformat(payload["created_at"])
-        due_date = datetime.fromisoformat(payload["due_date"]) if payload.get("due_date") else None
-        
-        self.repo.upsert(
-            todo_id=UUID(payload["id"]),
-            title=payload["title"],
-            description=payload.get("description"),
-            priority=payload.get("priority"),
-            due_date=due_date,
-            is_completed=False,
-            created_at=created_at,
-            updated_at=created_at,
-            event_id=UUID(event_id)
-        )
+        self.repo.upsert(**self._todo_created_row(event_id, payload))
@@ -1,6 +1,52 @@
-from pydantic import BaseModel, Field
-from typing import List, Optional, Any
+from pydantic import AwareDatetime, BaseModel, Field, PrivateAttr, model_validator
+from typing import List, Optional, Any, Dict, Tuple
+from datetime import datetime, timezone
+from uuid import UUID
+import base64
+import json
 import math
+from ..infra.instrumentation import stage
+
+KEYSET_SORTS = ("created_at", "due_date")
+
+def encode_cursor(sort: str, order: str, row: Dict[str, Any]) -> str:
+    """
+    Opaque continuation token holding the (sort key, id) of the last row of a
+    page, plus the sort it was produced for.
+    """
+    value = row[sort].isoformat() if row[sort] else None
+    raw = json.dumps([sort, order, value, str(row["id"])]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(token: str) -> Tuple[str, str, Optional[datetime], UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        sort, order, value, todo_id = json.loads(raw)
+        return sort, order, datetime.fromisoformat(value) if value else None, UUID(todo_id)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+
+def todo_json_item(row: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    JSON-ready dict for a read-model row, with the keys of TodoReadModel in
+    the same order.
+    """
+    # isoformat() dominates serialization; most rows were never updated, so
+    # reuse the created_at string when the values are identical.
+    created_at = row["created_at"]
+    updated_at = row["updated_at"]
+    created_iso = created_at.isoformat()
+    same = updated_at == created_at and updated_at.tzinfo is created_at.tzinfo
+    return {
+        "id": str(row["id"]),
+        "title": row["title"],
+        "description": row["description"],
+        "priority": row["priority"],
+        "due_date": row["due_date"].isoformat() if row["due_date"] else None,
+        "is_completed": row["is_completed"],
+        "created_at": created_iso,
+        "updated_at": created_iso if same else updated_at.isoformat()
+    }
 
 class TodoReadModel(BaseModel):
     """
@@ -19,14 +65,17 @@ class PaginationMetadata(BaseModel):
     """
     Standard metadata for paginated responses.
     """
-    total_count: int
+    total_count: Optional[int]
     page: int
     limit: int
-    total_pages: int
+    total_pages: Optional[int]
 
     @classmethod
-    def create(cls, total_count: int, page: int, limit: int) -> 'PaginationMetadata':
-        total_pages = math.ceil(total_count / limit) if total_count > 0 else 0
+    def create(cls, total_count: Optional[int], page: int, limit: int) -> 'PaginationMetadata':
+        if total_count is None:
+            total_pages = None
+        else:
+            total_pages = math.ceil(total_count / limit) if total_count > 0 else 0
         return cls(
             total_count=total_count,
             page=page,
@@ -40,33 +89,151 @@ class PaginatedResponse(BaseModel):
     """
     items: List[TodoReadModel]
     metadata: PaginationMetadata
+    next_cursor: Optional[str] = None
 
-class ListTodosQuery(BaseModel):
+class TodoFilters(BaseModel):
     """
-    Validated query parameters for listing todos.
+    Filter parameters shared by listing and exporting todos.
+    """
+    status: Optional[str] = None # 'completed' or 'pending'
+    # Search over title and description
+    q: Optional[str] = Field(default=None, max_length=200)
+    # Filters; due_after is inclusive, due_before exclusive
+    priority: Optional[str] = Field(default=None, pattern="^(Low|Medium|High)$")
+    due_before: Optional[AwareDatetime] = None
+    due_after: Optional[AwareDatetime] = None
+    overdue: Optional[bool] = None
+
+    _as_of: Optional[datetime] = PrivateAttr(default=None)
+
+    @model_validator(mode="after")
+    def _pin_overdue_reference(self) -> 'TodoFilters':
+        # Overdue results change with the clock, not only with the projection
+        # version. Pinning "now" to the minute makes them cacheable (and
+        # their ETag valid) for at most a minute.
+        if self.overdue is not None:
+            self._as_of = datetime.now(timezone.utc).replace(second=0, microsecond=0)
+        if self.q is not None:
+            self.q = self.q.strip() or None
+        return self
+
+    @property
+    def as_of(self) -> Optional[datetime]:
+        """
+        Reference time for the overdue filter, if one is applied.
+        """
+        return self._as_of
+
+    def filter_args(self) -> Dict[str, Any]:
+        """
+        Repository keyword arguments for the filters beyond status that are
+        set; status is always passed.
+        """
+        options = {}
+        if self.q:
+            options["search"] = self.q
+        for name in ("priority", "due_before", "due_after", "overdue"):
+            if getattr(self, name) is not None:
+                options[name] = getattr(self, name)
+        if self.as_of is not None:
+            options["now"] = self.as_of
+        return options
+
+class ListTodosQuery(TodoFilters):
+    """
+    Validated query parameters for listing todos. Results are ranked by
+    relevance when `q` is given and no other sort is requested.
     """
     page: int = Field(default=1, ge=1)
     limit: int = Field(default=10, ge=1, le=100)
-    status: Optional[str] = None # 'completed' or 'pending'
     sort: str = Field(default="created_at")
     order: str = Field(default="desc")
+    # Keyset pagination: pass an empty cursor for the first page, then the
+    # `next_cursor` of the previous response. `page` is ignored in this mode.
+    cursor: Optional[str] = None
+    # How total_count is computed: 'exact', 'estimate' or 'none' (skipped)
+    count: str = Field(default="exact", pattern="^(exact|estimate|none)$")
+
+    _after: Optional[Tuple[Optional[datetime], UUID]] = PrivateAttr(default=None)
+
+    @model_validator(mode="after")
+    def _default_to_relevance(self) -> 'ListTodosQuery':
+        if self.q and "sort" not in self.model_fields_set and self.cursor is None:
+            self.sort = "relevance"
+        return self
+
+    @model_validator(mode="after")
+    def _decode_cursor(self) -> 'ListTodosQuery':
+        if self.cursor is None:
+            return self
+        if self.sort not in KEYSET_SORTS or self.order.lower() not in ("asc", "desc"):
+            raise ValueError("cursor pagination requires sort in created_at, due_date and order in asc, desc")
+        if self.cursor:
+            sort, order, value, todo_id = decode_cursor(self.cursor)
+            if (sort, order) != (self.sort, self.order.lower()):
+                raise ValueError("cursor does not match the requested sort and order")
+            self._after = (value, todo_id)
+        return self
+
+    @property
+    def after(self) -> Optional[Tuple[Optional[datetime], UUID]]:
+        """
+        Decoded (sort key, id) of the last row already seen, if any.
+        """
+        return self._after
 
 class ListTodosQueryHandler:
     def __init__(self, repo):
         self.repo = repo
 
-    def handle(self, query: ListTodosQuery) -> PaginatedResponse:
-        """
-        Executes the list query and formats the response.
-        """
-        result = self.repo.list_todos(
+    def _list_args(self, query: ListTodosQuery) -> Dict[str, Any]:
+        # Optional modes are only passed when requested
+        options = {}
+        if query.cursor is not None:
+            options.update(keyset=True, after=query.after)
+        if query.count != "exact":
+            options["count"] = query.count
+        options.update(query.filter_args())
+
+        return dict(
             page=query.page,
             limit=query.limit,
             status=query.status,
             sort_by=query.sort,
-            order=query.order
+            order=query.order,
+            **options
         )
-        
+
+    def _fetch(self, query: ListTodosQuery) -> Dict[str, Any]:
+        with stage("fetch"):
+            return self.repo.list_todos(**self._list_args(query))
+
+    async def _fetch_async(self, query: ListTodosQuery) -> Dict[str, Any]:
+        with stage("fetch"):
+            return await self.repo.list_todos(**self._list_args(query))
+
+    def _next_cursor(self, query: ListTodosQuery, result: Dict[str, Any]) -> Optional[str]:
+        if result.get("has_more") and result["items"]:
+            return encode_cursor(query.sort, query.order.lower(), result["items"][-1])
+        return None
+
+    def handle(self, query: ListTodosQuery) -> PaginatedResponse:
+        """
+        Executes the list query and formats the response.
+        """
+        result = self._fetch(query)
+        with stage("serialize"):
+            return self._to_response(query, result)
+
+    async def handle_async(self, query: ListTodosQuery) -> PaginatedResponse:
+        """
+        `handle` for an AsyncTodoReadRepository.
+        """
+        result = await self._fetch_async(query)
+        with stage("serialize"):
+            return self._to_response(query, result)
+
+    def _to_response(self, query: ListTodosQuery, result: Dict[str, Any]) -> PaginatedResponse:
         items = []
         for row in result["items"]:
             items.append(
@@ -88,4 +255,44 @@ class ListTodosQueryHandler:
             limit=query.limit
         )
         
-        return PaginatedResponse(items=items, metadata=metadata)
+        return PaginatedResponse(items=items, metadata=metadata, next_cursor=self._next_cursor(query, result))
+
+    def handle_json(self, query: ListTodosQuery) -> str:
+        """
+        Fast path for the HTTP API: serializes DB rows straight to the JSON
+        body without building a Pydantic model per row. The output is
+        byte-identical to json.dumps(self.handle(query).model_dump()); keep
+        the key order below and in todo_json_item in sync with
+        PaginatedResponse and TodoReadModel.
+        """
+        result = self._fetch(query)
+        with stage("serialize"):
+            return self._to_json(query, result)
+
+    async def handle_json_async(self, query: ListTodosQuery) -> str:
+        """
+        `handle_json` for an AsyncTodoReadRepository.
+        """
+        result = await self._fetch_async(query)
+        with stage("serialize"):
+            return self._to_json(query, result)
+
+    def _to_json(self, query: ListTodosQuery, result: Dict[str, Any]) -> str:
+        items = [todo_json_item(row) for row in result["items"]]
+
+        total_count = result["total_count"]
+        if total_count is None:
+            total_pages = None
+        else:
+            total_pages = math.ceil(total_count / query.limit) if total_count > 0 else 0
+
+        return json.dumps({
+            "items": items,
+            "metadata": {
+                "total_count": total_count,
+                "page": query.page,
+                "limit": query.limit,
+                "total_pages": total_pages
+            },
+            "next_cursor": self._next_cursor(query, result)
+        })
@@ -0,0 +1,103 @@
+import argparse
+from typing import Awaitable, Callable, Dict, List, Tuple
+from urllib.parse import parse_qsl
+from aws_lambda_powertools import Logger
+from . import routes
+from ..infra.db import get_async_replica_pool, close_async_pools
+
+logger = Logger()
+
+# path -> method -> route. Routes run on the async pools, so one worker keeps
+# many queries in flight while the event loop stays free.
+ROUTES: Dict[str, Dict[str, Callable[[Dict[str, str], Dict[str, str]], Awaitable[dict]]]] = {
+    "/todos": {"GET": routes.list_todos_async},
+    "/todos/export": {"GET": routes.export_todos_async},
+    "/todos/changes": {"GET": routes.list_changes_async},
+}
+
+def _headers(scope: dict) -> Dict[str, str]:
+    return {k.decode("latin-1"): v.decode("latin-1") for k, v in scope["headers"]}
+
+def _query_params(scope: dict) -> Dict[str, str]:
+    # Single-valued like API Gateway's queryStringParameters: the last one wins
+    return dict(parse_qsl(scope.get("query_string", b"").decode("latin-1")))
+
+async def _send_response(send, response: dict) -> None:
+    headers: List[Tuple[bytes, bytes]] = [
+        (k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in response["headers"].items()
+    ]
+    stream = response.get("stream")
+    if stream is not None:
+        # Chunked: the length is unknown until the last chunk has been sent
+        await send({"type": "http.response.start", "status": response["statusCode"], "headers": headers})
+        try:
+            async for chunk in stream:
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        finally:
+            await stream.aclose()
+        await send({"type": "http.response.body", "body": b""})
+        return
+
+    body = response["body"].encode()
+    headers.append((b"content-length", str(len(body)).encode()))
+    await send({"type": "http.response.start", "status": response["statusCode"], "headers": headers})
+    await send({"type": "http.response.body", "body": body})
+
+async def _lifespan(receive, send) -> None:
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            # Open the pools before the first request instead of during it
+            try:
+                await get_async_replica_pool()
+            except Exception as e:
+                logger.exception("Failed to open connection pool")
+                await send({"type": "lifespan.startup.failed", "message": str(e)})
+                return
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await close_async_pools()
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+async def app(scope, receive, send) -> None:
+    """
+    ASGI application for the read API: GET /todos, /todos/export and
+    /todos/changes.
+    """
+    if scope["type"] == "lifespan":
+        await _lifespan(receive, send)
+        return
+
+    methods = ROUTES.get(scope["path"])
+    if methods is None:
+        await _send_response(send, routes.response(404, {"error": "Not found"}))
+        return
+    route = methods.get(scope["method"])
+    if route is None:
+        await _send_response(send, routes.response(405, {"error": "Method not allowed"}))
+        return
+
+    response = await route(_query_params(scope), _headers(scope))
+    await _send_response(send, response)
+
+def main() -> None:
+    """
+    Long-running HTTP server. Each worker process keeps its own pools and
+    list cache.
+    """
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Serve the read API over HTTP")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    uvicorn.run(
+        "todo.read.src.entrypoints.asgi:app",
+        host=args.host, port=args.port, workers=args.workers, log_level="warning"
+    )
+
+if __name__ == "__main__":
+    main()
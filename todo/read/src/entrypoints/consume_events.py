@@ -1,27 +1,74 @@
+import base64
 import json
+from typing import Dict, Any, List, Tuple
 from aws_lambda_powertools import Logger
 from ..app.projections import TodoProjectionHandler
 from ..infra.repo import TodoReadRepository
 
 logger = Logger()
 
+# Reused across warm invocations
+repo = TodoReadRepository()
+handler = TodoProjectionHandler(repo)
+
+def _decode_record(record: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+    """
+    Extracts (item identifier, event) from an SQS or Kinesis record.
+    SNS notifications delivered through SQS are unwrapped as well.
+    """
+    if "kinesis" in record:
+        identifier = record["kinesis"]["sequenceNumber"]
+        event = json.loads(base64.b64decode(record["kinesis"]["data"]))
+    else:
+        identifier = record["messageId"]
+        event = json.loads(record["body"])
+        if event.get("Type") == "Notification" and "Message" in event:
+            event = json.loads(event["Message"])
+    return identifier, event
+
+def _handle_records(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    failures = []
+    events = []
+    identifiers: Dict[str, List[str]] = {}
+    for record in records:
+        try:
+            identifier, event = _decode_record(record)
+            event_id = str(event["event_id"])
+        except (KeyError, TypeError, ValueError):
+            logger.exception("Skipping undecodable record")
+            failures.append(record.get("messageId") or record.get("kinesis", {}).get("sequenceNumber"))
+            continue
+        events.append(event)
+        identifiers.setdefault(event_id, []).append(identifier)
+
+    for event_id in handler.handle_batch(events):
+        logger.warning(f"Failed to project event {event_id}")
+        failures.extend(identifiers.get(event_id, []))
+
+    logger.info(f"Projected {len(records) - len(failures)} of {len(records)} records")
+    return {"batchItemFailures": [{"itemIdentifier": i} for i in failures if i is not None]}
+
 def lambda_handler(event, context):
     """
     Consumer for outbox events (simulated via manual trigger or SNS/EventBridge).
     Processes events to update the read side projections.
+
+    Accepts either a single event or an SQS/Kinesis batch ({'Records': [...]}).
+    Batches are applied in one transaction and answered with
+    `batchItemFailures`, so only the records that failed are redelivered.
     """
-    repo = TodoReadRepository()
-    handler = TodoProjectionHandler(repo)
-    
+    if "Records" in event:
+        return _handle_records(event["Records"])
+
     try:
         # Expected format: {'event_id': '...', 'event_type': '...', 'payload': {...}}
         event_id = event['event_id']
         event_type = event['event_type']
         payload = event['payload']
-        
+
         logger.info(f"Processing event {event_id} of type {event_type}")
         handler.handle(event_id, event_type, payload)
-        
+
         return {"status": "success"}
     except Exception as e:
         logger.exception("Failed to project event")
@@ -0,0 +1,56 @@
+import argparse
+import os
+import sys
+import time
+from datetime import timedelta
+from contextlib import ExitStack
+from typing import BinaryIO, Dict, Any
+from aws_lambda_powertools import Logger
+from ..app.export import ExportTodosQuery, ExportTodosQueryHandler
+from ..infra.repo import TodoReadRepository, EXPORT_BATCH_SIZE
+
+logger = Logger()
+
+def run_export(params: Dict[str, str], output: BinaryIO) -> Dict[str, Any]:
+    """
+    Writes the export selected by `params` (the GET /todos/export query
+    parameters) to `output`, fetching EXPORT_BATCH_SIZE rows at a time
+    (default 5000). `since` is moved back by EXPORT_SINCE_OVERLAP_SECONDS
+    (default 300) to cover projection lag.
+    """
+    query = ExportTodosQuery(**params)
+    handler = ExportTodosQueryHandler(
+        TodoReadRepository(),
+        batch_size=int(os.environ.get("EXPORT_BATCH_SIZE", EXPORT_BATCH_SIZE)),
+        since_overlap=timedelta(seconds=float(os.environ.get("EXPORT_SINCE_OVERLAP_SECONDS", "300")))
+    )
+
+    start = time.perf_counter()
+    written = 0
+    for chunk in handler.handle(query):
+        output.write(chunk)
+        written += len(chunk)
+    return {"format": query.format, "bytes": written, "seconds": round(time.perf_counter() - start, 3)}
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Export the read model as NDJSON or CSV")
+    parser.add_argument("--format", choices=["ndjson", "csv"], default="ndjson")
+    parser.add_argument("--since", help="ISO-8601 updated_at watermark for incremental exports; rows within the overlap window before it are repeated")
+    parser.add_argument("--status", choices=["completed", "pending"])
+    parser.add_argument("--q", help="Search over title and description")
+    parser.add_argument("--priority", choices=["Low", "Medium", "High"])
+    parser.add_argument("--due-before")
+    parser.add_argument("--due-after")
+    parser.add_argument("--overdue", choices=["true", "false"])
+    parser.add_argument("--output", default="-", help="Output file, or - for stdout")
+    args = vars(parser.parse_args())
+
+    output_path = args.pop("output")
+    params = {name: value for name, value in args.items() if value is not None}
+    with ExitStack() as stack:
+        output = sys.stdout.buffer if output_path == "-" else stack.enter_context(open(output_path, "wb"))
+        result = run_export(params, output)
+    logger.info("Export finished", extra=result)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+import argparse
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Any
+from aws_lambda_powertools import Logger
+from todo.common.retention import purge_in_batches
+from ..infra.retention import ReadRetention
+
+logger = Logger()
+
+def run_maintenance(now: datetime, keep_going: Callable[[], bool] = lambda: True) -> Dict[str, Any]:
+    """
+    One maintenance pass over the read schema: deletes processed-event
+    markers older than PROCESSED_EVENTS_RETENTION_DAYS (default 30) in
+    batches of RETENTION_BATCH_SIZE rows (default 1000).
+    """
+    retention = ReadRetention()
+    batch_size = int(os.environ.get("RETENTION_BATCH_SIZE", "1000"))
+    cutoff = now - timedelta(days=float(os.environ.get("PROCESSED_EVENTS_RETENTION_DAYS", 30)))
+
+    deleted = purge_in_batches(
+        lambda limit: retention.delete_processed_events(cutoff, limit), batch_size, keep_going
+    )
+    return {"processed_events_deleted": deleted}
+
+@logger.inject_lambda_context
+def lambda_handler(event: dict, context) -> dict:
+    """
+    Scheduled AWS Lambda entrypoint. Deleting stops early, leaving the rest
+    for the next run, when the invocation is about to run out of time.
+    """
+    result = run_maintenance(
+        datetime.now(timezone.utc),
+        keep_going=lambda: context.get_remaining_time_in_millis() > 5000
+    )
+    logger.info("Read-side maintenance finished", extra=result)
+    return result
+
+def main() -> None:
+    """
+    Runs a single maintenance pass, e.g. from cron.
+    """
+    parser = argparse.ArgumentParser(description="Apply retention to the read schema")
+    parser.parse_args()
+    result = run_maintenance(datetime.now(timezone.utc))
+    logger.info("Read-side maintenance finished", extra=result)
+
+if __name__ == "__main__":
+    main()
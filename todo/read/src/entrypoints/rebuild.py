@@ -0,0 +1,39 @@
+import argparse
+import os
+from typing import Dict, Any
+from aws_lambda_powertools import Logger
+from ..app.projections import read_model_row
+from ..infra.db import get_direct_connection, get_outbox_db_url, get_primary_db_url
+from ..infra.rebuild import ProjectionRebuild
+
+logger = Logger()
+
+def run_rebuild(restart: bool = False, allow_partial: bool = False) -> Dict[str, Any]:
+    """
+    Rebuilds the read model from the outbox at OUTBOX_DATABASE_URL into the
+    read primary, in batches of REBUILD_BATCH_SIZE events (default 10000).
+    An interrupted rebuild resumes from its last committed batch.
+    """
+    with get_direct_connection(get_outbox_db_url()) as source, get_direct_connection(get_primary_db_url()) as target:
+        rebuild = ProjectionRebuild(
+            source,
+            target,
+            read_model_row,
+            batch_size=int(os.environ.get("REBUILD_BATCH_SIZE", "10000")),
+            catch_up_overlap=int(os.environ.get("REBUILD_CATCH_UP_OVERLAP", "10000"))
+        )
+        return rebuild.run(restart=restart, allow_partial=allow_partial)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rebuild the read model from the outbox history")
+    parser.add_argument("--restart", action="store_true", help="Discard staged progress and start from the first event")
+    parser.add_argument(
+        "--allow-partial", action="store_true",
+        help="Rebuild even though retention already purged the oldest outbox events"
+    )
+    args = parser.parse_args()
+    result = run_rebuild(restart=args.restart, allow_partial=args.allow_partial)
+    logger.info("Read model rebuilt", extra=result)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+import json
+import os
+from contextlib import ExitStack
+from datetime import timedelta
+from typing import AsyncIterator, Optional, Dict, Tuple, Type
+from aws_lambda_powertools import Logger
+from pydantic import BaseModel
+from ..app.queries import ListTodosQuery, ListTodosQueryHandler
+from ..app.export import ExportTodosQuery, ExportTodosQueryHandler
+from ..app.changes import ListChangesQuery, ListChangesQueryHandler, ChangesResetError
+from ..app.cache import QueryResultCache, CachedListTodosQueryHandler, list_etag, etag_matches
+from ..infra.repo import TodoReadRepository, AsyncTodoReadRepository
+from ..infra import instrumentation
+from ..infra.instrumentation import stage
+
+# Transport-independent request handling shared by the Lambda (api.py) and
+# ASGI (asgi.py) adapters. Routes take query parameters and headers and
+# return a response dict in the API Gateway proxy shape.
+
+logger = Logger(child=True)
+
+# Result cache shared by warm requests; LIST_CACHE_TTL_SECONDS=0 disables it
+cache = QueryResultCache(
+    max_entries=int(os.environ.get("LIST_CACHE_MAX_ENTRIES", "256")),
+    ttl_seconds=float(os.environ.get("LIST_CACHE_TTL_SECONDS", "5"))
+)
+
+# Built on first request so that loading the module does as little as possible
+repo: Optional[TodoReadRepository] = None
+cached_handler: Optional[CachedListTodosQueryHandler] = None
+changes_handler: Optional[ListChangesQueryHandler] = None
+
+def _init_handlers() -> None:
+    global repo, cached_handler, changes_handler
+    if repo is None:
+        repo = TodoReadRepository()
+        cached_handler = CachedListTodosQueryHandler(ListTodosQueryHandler(repo), cache)
+        changes_handler = ListChangesQueryHandler(repo)
+
+# The same handler over the async repository, used by the ASGI server. Both
+# flavours share one result cache.
+async_repo: Optional[AsyncTodoReadRepository] = None
+async_cached_handler: Optional[CachedListTodosQueryHandler] = None
+async_changes_handler: Optional[ListChangesQueryHandler] = None
+
+def _init_async_handlers() -> None:
+    global async_repo, async_cached_handler, async_changes_handler
+    if async_repo is None:
+        async_repo = AsyncTodoReadRepository()
+        async_cached_handler = CachedListTodosQueryHandler(ListTodosQueryHandler(async_repo), cache)
+        async_changes_handler = ListChangesQueryHandler(async_repo)
+
+async_export_handler: Optional[ExportTodosQueryHandler] = None
+
+def _init_async_export_handler() -> None:
+    global async_export_handler
+    _init_async_handlers()
+    if async_export_handler is None:
+        async_export_handler = ExportTodosQueryHandler(
+            async_repo,
+            batch_size=int(os.environ.get("EXPORT_BATCH_SIZE", "5000")),
+            since_overlap=timedelta(seconds=float(os.environ.get("EXPORT_SINCE_OVERLAP_SECONDS", "300")))
+        )
+
+class _BadRequest(Exception):
+    pass
+
+def _parse_query(params: Dict[str, str], model: Type[BaseModel] = ListTodosQuery) -> BaseModel:
+    try:
+        # Pydantic will auto-convert string params to int/bool as needed
+        with stage("validate"):
+            return model(**params)
+    except Exception as e:
+        raise _BadRequest(str(e))
+
+def _conditional(query: ListTodosQuery, version: int, headers: Dict[str, str]) -> Tuple[str, bool]:
+    """
+    Returns the response ETag and whether the client's copy is still current.
+    """
+    etag = list_etag(query, version)
+    headers = {k.lower(): v for k, v in headers.items()}
+    return etag, etag_matches(headers.get("if-none-match"), etag)
+
+def _error_response(e: Exception, action: str = "list todos") -> dict:
+    if isinstance(e, _BadRequest):
+        return response(400, {"error": str(e)})
+    if isinstance(e, ChangesResetError):
+        return response(410, {"error": str(e)})
+    logger.exception(f"Failed to process {action} request")
+    return response(500, {"error": "Internal server error"})
+
+def list_todos(params: Dict[str, str], headers: Dict[str, str]) -> dict:
+    """
+    GET /todos
+    Supports pagination, filtering, and sorting.
+    """
+    with instrumentation.request("ListTodos"):
+        try:
+            # 1. Validate Input
+            query = _parse_query(params)
+
+            # 2. Conditional GET: unchanged data is answered without running the query
+            _init_handlers()
+            with stage("version"):
+                version = repo.get_projection_version()
+            etag, current = _conditional(query, version, headers)
+            if current:
+                return not_modified(etag)
+
+            # 3. Return Response, serialized straight from the rows
+            body = cached_handler.handle_json(query, version=version)
+            logger.debug("List cache stats", extra={"cache": cache.stats()})
+            return json_response(200, body, etag=etag)
+        except Exception as e:
+            return _error_response(e)
+
+async def list_todos_async(params: Dict[str, str], headers: Dict[str, str]) -> dict:
+    """
+    GET /todos on the async repository.
+    """
+    with instrumentation.request("ListTodos"):
+        try:
+            query = _parse_query(params)
+
+            _init_async_handlers()
+            with stage("version"):
+                version = await async_repo.get_projection_version()
+            etag, current = _conditional(query, version, headers)
+            if current:
+                return not_modified(etag)
+
+            body = await async_cached_handler.handle_json_async(query, version=version)
+            return json_response(200, body, etag=etag)
+        except Exception as e:
+            return _error_response(e)
+
+def list_changes(params: Dict[str, str], headers: Dict[str, str]) -> dict:
+    """
+    GET /todos/changes
+    Todos changed since the `since` token, oldest change first.
+    """
+    with instrumentation.request("ListChanges"):
+        try:
+            query = _parse_query(params, ListChangesQuery)
+            _init_handlers()
+            return json_response(200, changes_handler.handle_json(query))
+        except Exception as e:
+            return _error_response(e, "list changes")
+
+async def list_changes_async(params: Dict[str, str], headers: Dict[str, str]) -> dict:
+    """
+    GET /todos/changes on the async repository.
+    """
+    with instrumentation.request("ListChanges"):
+        try:
+            query = _parse_query(params, ListChangesQuery)
+            _init_async_handlers()
+            return json_response(200, await async_changes_handler.handle_json_async(query))
+        except Exception as e:
+            return _error_response(e, "list changes")
+
+async def _logged_stream(stream: AsyncIterator[bytes], scope: ExitStack) -> AsyncIterator[bytes]:
+    """
+    Passes `stream` through, logging failures, and closes the request's
+    metrics `scope` once the body has been sent.
+    """
+    try:
+        with stage("stream"):
+            async for chunk in stream:
+                yield chunk
+    except Exception:
+        # The status line is already sent; the client sees a truncated body
+        logger.exception("Export stream failed")
+        raise
+    finally:
+        # Returns the replica connection promptly if the client went away
+        await stream.aclose()
+        scope.close()
+
+async def export_todos_async(params: Dict[str, str], headers: Dict[str, str]) -> dict:
+    """
+    GET /todos/export
+    Streams every todo matching the list filters as NDJSON (default) or CSV
+    (`format=csv`); `since` makes the export incremental. The response
+    carries an async iterator of body chunks under "stream" instead of a
+    "body". Request metrics cover the whole body, so their scope is closed
+    by the stream.
+    """
+    scope = ExitStack()
+    scope.enter_context(instrumentation.request("ExportTodos"))
+    try:
+        query = _parse_query(params, ExportTodosQuery)
+        _init_async_export_handler()
+        stream = async_export_handler.handle_async(query)
+    except Exception as e:
+        with scope:
+            return _error_response(e, "export todos")
+    return {
+        "statusCode": 200,
+        "headers": {
+            "Content-Type": query.content_type,
+            "Content-Disposition": f'attachment; filename="todos.{query.format}"',
+            "Access-Control-Allow-Origin": "*"
+        },
+        "stream": _logged_stream(stream, scope)
+    }
+
+def response(status_code: int, body: dict) -> dict:
+    return json_response(status_code, json.dumps(body))
+
+def json_response(status_code: int, body: str, etag: Optional[str] = None) -> dict:
+    headers = {
+        "Content-Type": "application/json",
+        "Access-Control-Allow-Origin": "*"
+    }
+    if etag:
+        # Clients may keep the page but must revalidate it with If-None-Match
+        headers["ETag"] = etag
+        headers["Cache-Control"] = "no-cache"
+    return {
+        "statusCode": status_code,
+        "headers": headers,
+        "body": body
+    }
+
+def not_modified(etag: str) -> dict:
+    return {
+        "statusCode": 304,
+        "headers": {
+            "ETag": etag,
+            "Cache-Control": "no-cache",
+            "Access-Control-Allow-Origin": "*"
+        },
+        "body": ""
+    }
@@ -1,8 +1,33 @@
 import os
-from contextlib import contextmanager
-from typing import Generator
-import psycopg
-from psycopg.rows import dict_row
+import time
+from contextlib import contextmanager, asynccontextmanager
+from typing import TYPE_CHECKING, AsyncGenerator, Generator, Optional, Dict, Any, Tuple
+from aws_lambda_powertools import Logger
+from . import instrumentation
+
+# psycopg is imported when the first pool is opened, keeping the driver out
+# of cold-start import time.
+if TYPE_CHECKING:
+    import psycopg
+    from psycopg_pool import ConnectionPool, AsyncConnectionPool
+
+logger = Logger(child=True)
+
+# Process-wide pools, opened lazily on first use. Queries go to the replica
+# pool, projection writes to the primary pool. When both URLs point at the
+# same database only the primary pool is created.
+_primary_pool: Optional["ConnectionPool"] = None
+_replica_pool: Optional["ConnectionPool"] = None
+
+# Async counterparts for the ASGI server, owned by the event loop that opened
+# them. Replica health below is shared with the sync pools.
+_async_primary_pool: Optional["AsyncConnectionPool"] = None
+_async_replica_pool: Optional["AsyncConnectionPool"] = None
+
+# Replica health, shared by every request served by this process.
+_replica_down_until = 0.0
+_replica_lag_checked_at = 0.0
+_replica_lagging = False
 
 def get_db_url() -> str:
     # Favor READ_DATABASE_URL if present (e.g. for RDS Reader endpoint)
@@ -11,29 +36,323 @@ def get_db_url() -> str:
         raise ValueError("DATABASE_URL environment variable is not set")
     return url
 
+def get_primary_db_url() -> str:
+    """
+    URL of the writable instance. Falls back to the read URL for
+    deployments that only configure a single endpoint.
+    """
+    return os.environ.get("DATABASE_URL") or get_db_url()
+
+def get_outbox_db_url() -> str:
+    """
+    URL of the write database, read by projection rebuilds only.
+    """
+    url = os.environ.get("OUTBOX_DATABASE_URL")
+    if not url:
+        raise ValueError("OUTBOX_DATABASE_URL environment variable is not set")
+    return url
+
 @contextmanager
-def get_db_connection(autocommit: bool = False) -> Generator[psycopg.Connection, None, None]:
-    url = get_db_url()
-    with psycopg.connect(url, row_factory=dict_row, autocommit=autocommit) as conn:
+def get_direct_connection(url: str) -> Generator["psycopg.Connection", None, None]:
+    """
+    Dedicated (unpooled) connection for long-running jobs such as rebuilds,
+    which would otherwise hold a pooled connection for minutes.
+    """
+    import psycopg
+    from psycopg.rows import dict_row
+
+    with psycopg.connect(url, row_factory=dict_row) as conn:
         yield conn
 
+def _env_int(name: str, default: int) -> int:
+    value = os.environ.get(name)
+    return int(value) if value else default
+
+def _env_float(name: str, default: float) -> float:
+    value = os.environ.get(name)
+    return float(value) if value else default
+
+def _pool_settings() -> Dict[str, Any]:
+    return dict(
+        min_size=_env_int("DB_POOL_MIN_SIZE", 1),
+        max_size=_env_int("DB_POOL_MAX_SIZE", 5),
+        timeout=_env_float("DB_POOL_TIMEOUT", 10.0),
+        max_lifetime=_env_float("DB_POOL_MAX_LIFETIME", 1800.0),
+        max_idle=_env_float("DB_POOL_MAX_IDLE", 300.0),
+    )
+
+def _make_pool(url: str, name: str, autocommit: bool) -> "ConnectionPool":
+    from psycopg.rows import dict_row
+    from psycopg_pool import ConnectionPool
+
+    return ConnectionPool(
+        url,
+        **_pool_settings(),
+        check=ConnectionPool.check_connection,
+        kwargs={"row_factory": dict_row, "autocommit": autocommit},
+        name=name,
+        open=True,
+    )
+
+def _replica_enabled() -> bool:
+    return get_db_url() != get_primary_db_url()
+
+def get_primary_pool() -> "ConnectionPool":
+    global _primary_pool
+    if _primary_pool is None:
+        _primary_pool = _make_pool(get_primary_db_url(), "todo-read-primary", autocommit=False)
+    return _primary_pool
+
+def get_replica_pool() -> "ConnectionPool":
+    global _replica_pool
+    if not _replica_enabled():
+        return get_primary_pool()
+    if _replica_pool is None:
+        _replica_pool = _make_pool(get_db_url(), "todo-read-replica", autocommit=True)
+    return _replica_pool
+
+def close_pools() -> None:
+    global _primary_pool, _replica_pool
+    for pool in (_replica_pool, _primary_pool):
+        if pool is not None:
+            pool.close()
+    _primary_pool = None
+    _replica_pool = None
+
+async def _make_async_pool(url: str, name: str, autocommit: bool) -> "AsyncConnectionPool":
+    from psycopg.rows import dict_row
+    from psycopg_pool import AsyncConnectionPool
+
+    pool = AsyncConnectionPool(
+        url,
+        **_pool_settings(),
+        check=AsyncConnectionPool.check_connection,
+        kwargs={"row_factory": dict_row, "autocommit": autocommit},
+        name=name,
+        open=False,
+    )
+    await pool.open()
+    return pool
+
+async def get_async_primary_pool() -> "AsyncConnectionPool":
+    global _async_primary_pool
+    if _async_primary_pool is None:
+        _async_primary_pool = await _make_async_pool(get_primary_db_url(), "todo-read-primary-async", autocommit=False)
+    return _async_primary_pool
+
+async def get_async_replica_pool() -> "AsyncConnectionPool":
+    global _async_replica_pool
+    if not _replica_enabled():
+        return await get_async_primary_pool()
+    if _async_replica_pool is None:
+        _async_replica_pool = await _make_async_pool(get_db_url(), "todo-read-replica-async", autocommit=True)
+    return _async_replica_pool
+
+async def close_async_pools() -> None:
+    global _async_primary_pool, _async_replica_pool
+    for pool in (_async_replica_pool, _async_primary_pool):
+        if pool is not None:
+            await pool.close()
+    _async_primary_pool = None
+    _async_replica_pool = None
+
+def get_pool_stats() -> Dict[str, Any]:
+    """
+    Counters for each open pool, keyed by role. Empty until first use.
+    """
+    stats = {}
+    if _replica_pool is not None:
+        stats["replica"] = _replica_pool.get_stats()
+    if _primary_pool is not None:
+        stats["primary"] = _primary_pool.get_stats()
+    return stats
+
+def _mark_replica_down() -> None:
+    global _replica_down_until
+    _replica_down_until = time.monotonic() + _env_float("READ_REPLICA_RETRY_SECONDS", 30.0)
+
+REPLICA_LAG_SQL = """
+    SELECT CASE WHEN pg_is_in_recovery()
+        THEN COALESCE(EXTRACT(EPOCH FROM NOW() - pg_last_xact_replay_timestamp()), 0)
+        ELSE 0 END AS lag
+"""
+
+def _lag_check_due(now: float) -> bool:
+    return now - _replica_lag_checked_at >= _env_float("READ_REPLICA_LAG_CHECK_SECONDS", 5.0)
+
+def _record_replica_lag(now: float, lag: float, max_lag: float) -> None:
+    global _replica_lag_checked_at, _replica_lagging
+    _replica_lag_checked_at = now
+    _replica_lagging = lag > max_lag
+    if _replica_lagging:
+        logger.warning("Read replica lag above threshold, routing reads to primary", extra={"lag": lag})
+
+def _replica_too_far_behind(conn: "psycopg.Connection") -> bool:
+    """
+    Optional lag guard, enabled by READ_REPLICA_MAX_LAG_SECONDS. The lag is
+    measured at most every READ_REPLICA_LAG_CHECK_SECONDS and cached, so
+    most requests pay nothing for it.
+    """
+    max_lag = os.environ.get("READ_REPLICA_MAX_LAG_SECONDS")
+    if not max_lag:
+        return False
+
+    now = time.monotonic()
+    if _lag_check_due(now):
+        row = conn.execute(REPLICA_LAG_SQL).fetchone()
+        _record_replica_lag(now, float(row["lag"]), float(max_lag))
+    return _replica_lagging
+
+async def _async_replica_too_far_behind(conn: "psycopg.AsyncConnection") -> bool:
+    max_lag = os.environ.get("READ_REPLICA_MAX_LAG_SECONDS")
+    if not max_lag:
+        return False
+
+    now = time.monotonic()
+    if _lag_check_due(now):
+        cur = await conn.execute(REPLICA_LAG_SQL)
+        row = await cur.fetchone()
+        _record_replica_lag(now, float(row["lag"]), float(max_lag))
+    return _replica_lagging
+
+def _checkout_for_read() -> Tuple["ConnectionPool", "psycopg.Connection"]:
+    """
+    Checks a connection out of the replica pool, failing over to the primary
+    when the replica cannot be reached (it is then skipped for
+    READ_REPLICA_RETRY_SECONDS) or is lagging beyond the configured bound.
+    """
+    if _replica_enabled() and time.monotonic() >= _replica_down_until:
+        import psycopg
+        from psycopg_pool import PoolTimeout
+
+        pool = get_replica_pool()
+        try:
+            conn = pool.getconn(timeout=_env_float("READ_REPLICA_TIMEOUT", 2.0))
+        except (PoolTimeout, psycopg.OperationalError):
+            logger.warning("Read replica unavailable, failing over to primary")
+            _mark_replica_down()
+        else:
+            try:
+                lagging = _replica_too_far_behind(conn)
+            except psycopg.OperationalError:
+                pool.putconn(conn)
+                logger.warning("Read replica unavailable, failing over to primary")
+                _mark_replica_down()
+            else:
+                if not lagging:
+                    return pool, conn
+                pool.putconn(conn)
+
+    pool = get_primary_pool()
+    return pool, pool.getconn()
+
+async def _async_checkout_for_read() -> Tuple["AsyncConnectionPool", "psycopg.AsyncConnection"]:
+    """
+    Async form of _checkout_for_read(), with the same failover rules.
+    """
+    if _replica_enabled() and time.monotonic() >= _replica_down_until:
+        import psycopg
+        from psycopg_pool import PoolTimeout
+
+        pool = await get_async_replica_pool()
+        try:
+            conn = await pool.getconn(timeout=_env_float("READ_REPLICA_TIMEOUT", 2.0))
+        except (PoolTimeout, psycopg.OperationalError):
+            logger.warning("Read replica unavailable, failing over to primary")
+            _mark_replica_down()
+        else:
+            try:
+                lagging = await _async_replica_too_far_behind(conn)
+            except psycopg.OperationalError:
+                await pool.putconn(conn)
+                logger.warning("Read replica unavailable, failing over to primary")
+                _mark_replica_down()
+            else:
+                if not lagging:
+                    return pool, conn
+                await pool.putconn(conn)
+
+    pool = await get_async_primary_pool()
+    return pool, await pool.getconn()
+
+@contextmanager
+def get_db_connection(readonly: bool = False) -> Generator["psycopg.Connection", None, None]:
+    """
+    Borrow a pooled connection. Read-only callers are routed to the replica
+    (with failover), everything else to the primary.
+    """
+    start = time.perf_counter()
+    if readonly:
+        pool, conn = _checkout_for_read()
+    else:
+        pool = get_primary_pool()
+        conn = pool.getconn()
+    instrumentation.record_acquire(start)
+    # Checked out by hand because the pool is only known after the replica
+    # checks above; commit or roll back before handing it back
+    try:
+        with instrumentation.timed_cursors(conn):
+            yield conn
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    finally:
+        pool.putconn(conn)
+
 @contextmanager
-def get_db_cursor() -> Generator[psycopg.Cursor, None, None]:
+def get_db_cursor() -> Generator["psycopg.Cursor", None, None]:
     """
-    Get a cursor with autocommit=True. Useful for read-only queries 
-    where explicit transaction management is not needed.
+    Get a cursor for read-only queries, served by the replica pool.
+    Useful for read-only queries where explicit transaction management
+    is not needed.
     """
-    with get_db_connection(autocommit=True) as conn:
+    with get_db_connection(readonly=True) as conn:
         with conn.cursor() as cur:
             yield cur
 
 @contextmanager
-def get_db_transaction() -> Generator[psycopg.Cursor, None, None]:
+def get_db_transaction() -> Generator["psycopg.Cursor", None, None]:
     """
-    Get a cursor within a transaction. Required for projections 
+    Get a cursor within a transaction on the primary. Required for projections
     to ensure atomic updates of read model and event tracking.
     """
     with get_db_connection() as conn:
         with conn.transaction():
             with conn.cursor() as cur:
                 yield cur
+
+@asynccontextmanager
+async def get_async_db_connection(readonly: bool = False) -> AsyncGenerator["psycopg.AsyncConnection", None]:
+    """
+    Async form of get_db_connection().
+    """
+    start = time.perf_counter()
+    if readonly:
+        pool, conn = await _async_checkout_for_read()
+    else:
+        pool = await get_async_primary_pool()
+        conn = await pool.getconn()
+    instrumentation.record_acquire(start)
+    try:
+        with instrumentation.timed_cursors(conn):
+            yield conn
+        await conn.commit()
+    except BaseException:
+        await conn.rollback()
+        raise
+    finally:
+        await pool.putconn(conn)
+
+@asynccontextmanager
+async def get_async_db_cursor() -> AsyncGenerator["psycopg.AsyncCursor", None]:
+    async with get_async_db_connection(readonly=True) as conn:
+        async with conn.cursor() as cur:
+            yield cur
+
+@asynccontextmanager
+async def get_async_db_transaction() -> AsyncGenerator["psycopg.AsyncCursor", None]:
+    async with get_async_db_connection() as conn:
+        async with conn.transaction():
+            async with conn.cursor() as cur:
+                yield cur
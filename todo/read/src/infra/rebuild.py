@@ -0,0 +1,339 @@
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple
+from aws_lambda_powertools import Logger
+
+if TYPE_CHECKING:
+    import psycopg
+
+logger = Logger(child=True)
+
+SCHEMA = "santiago_munoz_read"
+LIVE_TABLE = "todos"
+SHADOW_TABLE = "todos_rebuild"
+STAGING_TABLE = "todos_rebuild_events"
+SHADOW_SUFFIX = "_rebuild"
+
+# Columns a projected event writes, in COPY order
+ROW_COLUMNS = ("id", "title", "description", "priority", "due_date", "is_completed", "created_at", "updated_at")
+_COLUMNS_SQL = ", ".join(ROW_COLUMNS)
+
+# One row per applied event, in outbox order. UNLOGGED makes the bulk COPY
+# cheap; after a crash the table comes back empty, which the derived
+# checkpoint below turns into a restart from scratch rather than a gap.
+CREATE_STAGING_SQL = f"""
+    CREATE UNLOGGED TABLE IF NOT EXISTS {SCHEMA}.{STAGING_TABLE} (
+        outbox_id BIGINT NOT NULL,
+        id UUID NOT NULL,
+        title VARCHAR(500) NOT NULL,
+        description VARCHAR(500),
+        priority VARCHAR(20),
+        due_date TIMESTAMPTZ,
+        is_completed BOOLEAN NOT NULL,
+        created_at TIMESTAMPTZ NOT NULL,
+        updated_at TIMESTAMPTZ NOT NULL
+    )
+"""
+
+# The checkpoint is the last outbox id staged. It commits with the COPY of
+# its batch, so it can never point past data that is missing.
+SELECT_CHECKPOINT_SQL = f"SELECT COALESCE(MAX(outbox_id), 0) AS checkpoint FROM {SCHEMA}.{STAGING_TABLE}"
+
+COPY_STAGING_SQL = f"COPY {SCHEMA}.{STAGING_TABLE} (outbox_id, {_COLUMNS_SQL}) FROM STDIN"
+
+# The id sequence remembers how many events were ever written, so a purge
+# that emptied the outbox still shows up as missing history
+SELECT_OUTBOX_BOUNDS_SQL = """
+    SELECT MIN(o.id) AS first_id, COALESCE(MAX(o.id), 0) AS last_id,
+           (SELECT CASE WHEN is_called THEN last_value ELSE 0 END
+            FROM santiago_munoz_write.outbox_id_seq) AS issued_id
+    FROM santiago_munoz_write.outbox o
+"""
+
+SELECT_OUTBOX_EVENTS_SQL = """
+    SELECT id, event_type, payload FROM santiago_munoz_write.outbox
+    WHERE id > %s AND id <= %s
+    ORDER BY id
+"""
+
+# Same columns, defaults and generated columns as the live table; indexes
+# are added after the load, which is far cheaper than maintaining them row
+# by row.
+CREATE_SHADOW_SQL = f"""
+    CREATE TABLE {SCHEMA}.{SHADOW_TABLE}
+    (LIKE {SCHEMA}.{LIVE_TABLE} INCLUDING DEFAULTS INCLUDING GENERATED INCLUDING CONSTRAINTS)
+"""
+
+# Last event per todo wins, as with live projection
+FILL_SHADOW_SQL = f"""
+    INSERT INTO {SCHEMA}.{SHADOW_TABLE} ({_COLUMNS_SQL})
+    SELECT DISTINCT ON (id) {_COLUMNS_SQL}
+    FROM {SCHEMA}.{STAGING_TABLE}
+    ORDER BY id, outbox_id DESC
+"""
+
+CATCH_UP_SHADOW_SQL = f"""
+    INSERT INTO {SCHEMA}.{SHADOW_TABLE} ({_COLUMNS_SQL})
+    SELECT DISTINCT ON (id) {_COLUMNS_SQL}
+    FROM {SCHEMA}.{STAGING_TABLE}
+    WHERE outbox_id > %s
+    ORDER BY id, outbox_id DESC
+    ON CONFLICT (id) DO UPDATE SET
+        title = EXCLUDED.title,
+        description = EXCLUDED.description,
+        priority = EXCLUDED.priority,
+        due_date = EXCLUDED.due_date,
+        is_completed = EXCLUDED.is_completed,
+        updated_at = EXCLUDED.updated_at
+"""
+
+SELECT_LIVE_INDEXES_SQL = f"""
+    SELECT c.relname AS name, pg_get_indexdef(i.indexrelid) AS definition, i.indisprimary AS is_primary
+    FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid
+    WHERE i.indrelid = '{SCHEMA}.{LIVE_TABLE}'::regclass
+    ORDER BY i.indisprimary DESC, c.relname
+"""
+
+SELECT_LIVE_GRANTS_SQL = f"""
+    SELECT grantee, privilege_type FROM information_schema.role_table_grants
+    WHERE table_schema = '{SCHEMA}' AND table_name = '{LIVE_TABLE}' AND grantee <> current_user
+"""
+
+# The counters are computed on the shadow before the swap lock is taken;
+# under the lock only the rows touched by the catch-up are counted again.
+COUNT_SHADOW_SQL = f"SELECT is_completed, COUNT(*) AS total FROM {SCHEMA}.{SHADOW_TABLE} GROUP BY is_completed"
+
+COUNT_CAUGHT_UP_SQL = f"""
+    SELECT is_completed, COUNT(*) AS total FROM {SCHEMA}.{SHADOW_TABLE}
+    WHERE id IN (SELECT id FROM {SCHEMA}.{STAGING_TABLE} WHERE outbox_id > %s)
+    GROUP BY is_completed
+"""
+
+SET_COUNTS_SQL = f"""
+    UPDATE {SCHEMA}.todo_counts c SET total = v.total
+    FROM (VALUES (FALSE, %(pending)s::bigint), (TRUE, %(completed)s::bigint)) AS v(is_completed, total)
+    WHERE c.is_completed = v.is_completed
+"""
+
+# The rebuilt rows carry no change history (change_seq defaults to 0), so
+# the change feed is reset: watermarks from before the swap are refused and
+# those clients sync again from the start.
+BUMP_VERSION_SQL = f"UPDATE {SCHEMA}.projection_state SET version = version + 1, changes_floor = version + 1"
+
+class RebuildError(Exception):
+    pass
+
+def _status_counts(rows: Iterable[Dict[str, Any]]) -> Dict[bool, int]:
+    counts = {False: 0, True: 0}
+    for row in rows:
+        counts[row["is_completed"]] = row["total"]
+    return counts
+
+def shadow_index_sql(name: str, definition: str) -> Tuple[str, str]:
+    """
+    Rewrites a live index definition (as returned by pg_get_indexdef) to
+    create the same index on the shadow table. Returns (shadow index name,
+    CREATE INDEX statement).
+    """
+    shadow_name = f"{name}{SHADOW_SUFFIX}"
+    live = f" INDEX {name} ON {SCHEMA}.{LIVE_TABLE} "
+    if live not in definition:
+        raise RebuildError(f"Unexpected definition for index {name}: {definition}")
+    return shadow_name, definition.replace(live, f" INDEX {shadow_name} ON {SCHEMA}.{SHADOW_TABLE} ", 1)
+
+class ProjectionRebuild:
+    """
+    Rebuilds santiago_munoz_read.todos from the full outbox history:
+
+    1. stream: a server-side cursor walks the outbox in id order up to the
+       high-water mark taken at the start, and each batch of projected rows
+       is COPYed into an unlogged staging table in its own transaction.
+       A rerun resumes after the last staged outbox id.
+    2. build: the shadow table is loaded from staging (last event per todo
+       wins), then given the live table's indexes and grants.
+    3. swap: with the live table locked against projection writes, events
+       that arrived meanwhile are staged and merged into the shadow, the
+       tables are exchanged, the counters adjusted, the projection
+       version bumped and the change feed reset, all in one transaction.
+
+    Per-event upserts and processed_events bookkeeping are skipped
+    entirely. Events are converted by `to_row` (the live projection's
+    mapping), so a rebuild picks up projection logic changes.
+    """
+    def __init__(
+        self,
+        source: "psycopg.Connection",
+        target: "psycopg.Connection",
+        to_row: Callable[[str, Dict[str, Any]], Optional[Dict[str, Any]]],
+        batch_size: int = 10_000,
+        catch_up_overlap: int = 10_000
+    ):
+        self.source = source
+        self.target = target
+        self.to_row = to_row
+        self.batch_size = batch_size
+        # Outbox ids are assigned at insert but become visible at commit, so a
+        # slow transaction can commit an id below ids already streamed. The
+        # final pass re-reads this many ids before the checkpoint.
+        self.catch_up_overlap = catch_up_overlap
+        self.stats: Dict[str, Any] = {"events_read": 0, "rows_staged": 0, "batches": 0}
+        # Per-status totals of the shadow as built, see build_shadow
+        self.shadow_counts: Dict[bool, int] = {False: 0, True: 0}
+
+    def prepare(self, restart: bool = False) -> int:
+        """
+        Creates the staging table (emptied when `restart`) and returns the
+        checkpoint to resume from.
+        """
+        with self.target.transaction():
+            self.target.execute(CREATE_STAGING_SQL)
+            if restart:
+                self.target.execute(f"TRUNCATE {SCHEMA}.{STAGING_TABLE}")
+            return self.target.execute(SELECT_CHECKPOINT_SQL).fetchone()["checkpoint"]
+
+    def outbox_bounds(self) -> Tuple[int, int]:
+        """
+        Returns the first outbox id still held (the next id to be issued
+        when the outbox is empty) and the last one.
+        """
+        with self.source.transaction():
+            row = self.source.execute(SELECT_OUTBOX_BOUNDS_SQL).fetchone()
+        first_id = row["first_id"] if row["first_id"] is not None else row["issued_id"] + 1
+        return first_id, row["last_id"]
+
+    def _staging_rows(self, events: Iterable[Dict[str, Any]]) -> List[Tuple[Any, ...]]:
+        rows = []
+        for event in events:
+            row = self.to_row(event["event_type"], event["payload"])
+            if row is not None:
+                rows.append((event["id"], row["todo_id"], *(row[c] for c in ROW_COLUMNS[1:])))
+        return rows
+
+    def _copy(self, rows: List[Tuple[Any, ...]]) -> None:
+        with self.target.cursor() as cur:
+            with cur.copy(COPY_STAGING_SQL) as copy:
+                for row in rows:
+                    copy.write_row(row)
+
+    def stream(self, after_id: int, up_to_id: int, commit_batches: bool = True) -> int:
+        """
+        Stages the projected rows of outbox events in (after_id, up_to_id].
+        With `commit_batches` every batch commits on its own, which is what
+        makes the checkpoint advance; otherwise the caller's transaction
+        holds them. Returns the number of events read.
+        """
+        read = 0
+        started = time.perf_counter()
+        with self.source.transaction():
+            with self.source.cursor(name="outbox_rebuild") as cur:
+                cur.itersize = self.batch_size
+                cur.execute(SELECT_OUTBOX_EVENTS_SQL, (after_id, up_to_id))
+                while True:
+                    events = cur.fetchmany(self.batch_size)
+                    if not events:
+                        break
+                    rows = self._staging_rows(events)
+                    if commit_batches:
+                        with self.target.transaction():
+                            self._copy(rows)
+                    else:
+                        self._copy(rows)
+                    read += len(events)
+                    self.stats["events_read"] += len(events)
+                    self.stats["rows_staged"] += len(rows)
+                    self.stats["batches"] += 1
+                    elapsed = time.perf_counter() - started
+                    logger.info("Rebuild batch staged", extra={
+                        "checkpoint": events[-1]["id"],
+                        "up_to": up_to_id,
+                        "events_per_second": round(read / elapsed, 1) if elapsed > 0 else None
+                    })
+        return read
+
+    def build_shadow(self) -> None:
+        """
+        Recreates the shadow table from staging, with the live table's
+        indexes (primary key included) and grants.
+        """
+        from psycopg import sql
+
+        with self.target.transaction():
+            self.target.execute(f"DROP TABLE IF EXISTS {SCHEMA}.{SHADOW_TABLE}")
+            self.target.execute(CREATE_SHADOW_SQL)
+            self.target.execute(FILL_SHADOW_SQL)
+
+            for index in self.target.execute(SELECT_LIVE_INDEXES_SQL).fetchall():
+                shadow_name, statement = shadow_index_sql(index["name"], index["definition"])
+                self.target.execute(statement)
+                if index["is_primary"]:
+                    self.target.execute(
+                        f"ALTER TABLE {SCHEMA}.{SHADOW_TABLE} ADD CONSTRAINT {shadow_name} PRIMARY KEY USING INDEX {shadow_name}"
+                    )
+
+            for grant in self.target.execute(SELECT_LIVE_GRANTS_SQL).fetchall():
+                grantee = sql.SQL("PUBLIC") if grant["grantee"] == "PUBLIC" else sql.Identifier(grant["grantee"])
+                self.target.execute(sql.SQL("GRANT {} ON {}.{} TO {}").format(
+                    sql.SQL(grant["privilege_type"]), sql.Identifier(SCHEMA), sql.Identifier(SHADOW_TABLE), grantee
+                ))
+            self.target.execute(f"ANALYZE {SCHEMA}.{SHADOW_TABLE}")
+            self.shadow_counts = _status_counts(self.target.execute(COUNT_SHADOW_SQL).fetchall())
+
+    def swap(self, checkpoint: int) -> int:
+        """
+        Catches the shadow up and exchanges it with the live table. Returns
+        the last outbox id included.
+        """
+        with self.target.transaction():
+            # Projection writes queue behind this lock and then resolve the
+            # table name again, landing in the new table once we commit.
+            self.target.execute(f"LOCK TABLE {SCHEMA}.{LIVE_TABLE} IN ACCESS EXCLUSIVE MODE")
+
+            since = max(0, checkpoint - self.catch_up_overlap)
+            _, last_id = self.outbox_bounds()
+            self.stream(since, last_id, commit_batches=False)
+            # Counts move by what the catch-up changes: the touched rows are
+            # taken out under their old status and added back under the new
+            before = _status_counts(self.target.execute(COUNT_CAUGHT_UP_SQL, (since,)).fetchall())
+            self.target.execute(CATCH_UP_SHADOW_SQL, (since,))
+            after = _status_counts(self.target.execute(COUNT_CAUGHT_UP_SQL, (since,)).fetchall())
+            counts = {status: self.shadow_counts[status] - before[status] + after[status] for status in (False, True)}
+
+            indexes = [row["name"] for row in self.target.execute(SELECT_LIVE_INDEXES_SQL).fetchall()]
+            self.target.execute(f"DROP TABLE {SCHEMA}.{LIVE_TABLE}")
+            self.target.execute(f"ALTER TABLE {SCHEMA}.{SHADOW_TABLE} RENAME TO {LIVE_TABLE}")
+            for name in indexes:
+                # Renaming a constraint's index renames the constraint too
+                self.target.execute(f"ALTER INDEX {SCHEMA}.{name}{SHADOW_SUFFIX} RENAME TO {name}")
+
+            self.target.execute(SET_COUNTS_SQL, {"pending": counts[False], "completed": counts[True]})
+            self.target.execute(BUMP_VERSION_SQL)
+            self.target.execute(f"DROP TABLE {SCHEMA}.{STAGING_TABLE}")
+        return max(last_id, checkpoint)
+
+    def run(self, restart: bool = False, allow_partial: bool = False) -> Dict[str, Any]:
+        """
+        Runs (or resumes) a full rebuild. Refuses to start when the oldest
+        outbox events have already been purged by retention, since the
+        result would silently miss those todos, unless `allow_partial`.
+        """
+        started = time.perf_counter()
+        checkpoint = self.prepare(restart)
+        first_id, high_water = self.outbox_bounds()
+        # Events after the checkpoint are needed; a gap before first_id means
+        # retention purged them, even when it left the outbox empty
+        if not allow_partial and first_id > checkpoint + 1:
+            raise RebuildError(
+                f"Outbox history starts at id {first_id}: older events were purged, "
+                "so a rebuild would drop their todos"
+            )
+
+        logger.info("Rebuild streaming", extra={"resume_after": checkpoint, "up_to": high_water})
+        self.stream(checkpoint, high_water)
+        checkpoint = max(checkpoint, high_water)
+
+        self.build_shadow()
+        last_id = self.swap(checkpoint)
+        return {
+            **self.stats,
+            "last_outbox_id": last_id,
+            "seconds": round(time.perf_counter() - started, 1)
+        }
@@ -1,9 +1,412 @@
+import asyncio
+import json
+import re
 from uuid import UUID
-from datetime import datetime
-from typing import Optional, List, Dict, Any
-from .db import get_db_transaction, get_db_cursor
+from datetime import datetime, timezone
+from typing import Optional, List, Dict, Any, Tuple, Iterator, AsyncIterator
+from .db import (
+    get_db_connection, get_db_transaction, get_db_cursor,
+    get_async_db_connection, get_async_db_transaction, get_async_db_cursor
+)
 
-class TodoReadRepository:
+# Upserts a set of todos (passed as parallel arrays) and keeps the per-status
+# counters in todo_counts in step, all in one statement. New rows are told
+# apart from updated ones with the xmax = 0 idiom, which stays correct when a
+# concurrent transaction inserted the same todo first; `previous` provides
+# the old status so completed/pending transitions move between counters.
+# Every applied write also bumps the projection version stamp that query
+# caches compare against, and stamps the rows it writes with the new version
+# as their change_seq. The bump's row lock orders writers, so change_seq
+# values become visible in increasing order.
+UPSERT_TODOS_SQL = """
+    WITH bumped AS (
+        UPDATE santiago_munoz_read.projection_state SET version = version + 1
+        RETURNING version
+    ), previous AS (
+        SELECT id, is_completed FROM santiago_munoz_read.todos
+        WHERE id = ANY(%(ids)s::uuid[])
+        FOR UPDATE
+    ), upserted AS (
+        INSERT INTO santiago_munoz_read.todos (id, title, description, priority, due_date, is_completed, created_at, updated_at, change_seq)
+        SELECT t.*, b.version FROM unnest(
+            %(ids)s::uuid[], %(titles)s::varchar[], %(descriptions)s::varchar[], %(priorities)s::varchar[],
+            %(due_dates)s::timestamptz[], %(completed)s::boolean[], %(created)s::timestamptz[], %(updated)s::timestamptz[]
+        ) AS t CROSS JOIN bumped b
+        ON CONFLICT (id) DO UPDATE SET
+            title = EXCLUDED.title,
+            description = EXCLUDED.description,
+            priority = EXCLUDED.priority,
+            due_date = EXCLUDED.due_date,
+            is_completed = EXCLUDED.is_completed,
+            updated_at = EXCLUDED.updated_at,
+            change_seq = EXCLUDED.change_seq
+        RETURNING id, is_completed, (xmax = 0) AS inserted
+    ), deltas AS (
+        SELECT u.is_completed, 1 AS delta
+        FROM upserted u LEFT JOIN previous p USING (id)
+        WHERE u.inserted OR p.is_completed <> u.is_completed
+        UNION ALL
+        SELECT p.is_completed, -1
+        FROM upserted u JOIN previous p USING (id)
+        WHERE NOT u.inserted AND p.is_completed <> u.is_completed
+    )
+    UPDATE santiago_munoz_read.todo_counts c
+    SET total = c.total + d.delta
+    FROM (SELECT is_completed, SUM(delta) AS delta FROM deltas GROUP BY is_completed) d
+    WHERE c.is_completed = d.is_completed
+"""
+
+SELECT_PROCESSED_EVENT_SQL = "SELECT 1 FROM santiago_munoz_read.processed_events WHERE event_id = %s"
+
+INSERT_PROCESSED_EVENT_SQL = "INSERT INTO santiago_munoz_read.processed_events (event_id) VALUES (%s)"
+
+SELECT_PROCESSED_EVENTS_SQL = "SELECT event_id FROM santiago_munoz_read.processed_events WHERE event_id = ANY(%s)"
+
+INSERT_PROCESSED_EVENTS_SQL = """
+    INSERT INTO santiago_munoz_read.processed_events (event_id)
+    SELECT unnest(%s::uuid[])
+    ON CONFLICT (event_id) DO NOTHING
+"""
+
+SELECT_PROJECTION_VERSION_SQL = "SELECT version FROM santiago_munoz_read.projection_state"
+
+SELECT_CHANGES_STATE_SQL = "SELECT version, changes_floor FROM santiago_munoz_read.projection_state"
+
+# The expression the priority indexes are built on (add_list_filter_indexes);
+# ordering by anything else cannot use them
+PRIORITY_RANK_SQL = "(CASE priority WHEN 'High' THEN 3 WHEN 'Medium' THEN 2 WHEN 'Low' THEN 1 ELSE 0 END)"
+
+EXPORT_CURSOR = "todo_export"
+
+EXPORT_BATCH_SIZE = 5000
+
+def _export_csv_sql(query: str) -> str:
+    return f"COPY ({query}) TO STDOUT WITH (FORMAT csv, HEADER)"
+
+# Must stay identical to the idx_read_todos_search_trgm index expression
+SEARCH_TEXT_SQL = "(title || ' ' || COALESCE(description, ''))"
+
+# Shorter substrings have no trigram to look up, so they would scan the table
+MIN_SUBSTRING_SEARCH = 3
+
+def _prefix_tsquery(search: str) -> Optional[str]:
+    """
+    Turns free text into a tsquery matching every word as a prefix
+    ('buy mil' -> 'buy:* & mil:*'). Only word characters are kept, so the
+    result is always valid tsquery syntax. None when there are no words.
+    """
+    words = re.findall(r"\w+", search.lower())
+    return " & ".join(f"{w}:*" for w in words) if words else None
+
+def _like_pattern(search: str) -> str:
+    escaped = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+def _total(row: Dict[str, Any]) -> int:
+    """
+    Reads the count query's result: a counter or COUNT(*) total, or the row
+    estimate of an EXPLAIN (FORMAT JSON) plan.
+    """
+    if "total" in row:
+        return row["total"]
+    plan = row["QUERY PLAN"]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+def _upsert_params(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        "ids": [r["todo_id"] for r in rows],
+        "titles": [r["title"] for r in rows],
+        "descriptions": [r["description"] for r in rows],
+        "priorities": [r["priority"] for r in rows],
+        "due_dates": [r["due_date"] for r in rows],
+        "completed": [r["is_completed"] for r in rows],
+        "created": [r["created_at"] for r in rows],
+        "updated": [r["updated_at"] for r in rows],
+    }
+
+def _upsert_todos(cur, rows: List[Dict[str, Any]]) -> None:
+    cur.execute(UPSERT_TODOS_SQL, _upsert_params(rows))
+
+def _unseen_events(rows: List[Dict[str, Any]], seen: set) -> Tuple[List[UUID], List[Dict[str, Any]]]:
+    """
+    Drops events already processed (or repeated within the batch). A todo may
+    appear several times in one batch, but ON CONFLICT can only touch a row
+    once per statement: the last event wins. Returns (event ids, rows).
+    """
+    latest: Dict[UUID, Dict[str, Any]] = {}
+    event_ids = []
+    for row in rows:
+        if row["event_id"] in seen:
+            continue
+        seen.add(row["event_id"])
+        event_ids.append(row["event_id"])
+        latest[row["todo_id"]] = row
+    return event_ids, list(latest.values())
+
+def _filter_conditions(
+    status: Optional[str],
+    search: Optional[str],
+    priority: Optional[str],
+    due_before: Optional[datetime],
+    due_after: Optional[datetime],
+    overdue: Optional[bool],
+    now: Optional[datetime]
+) -> Tuple[List[str], List[Any], Optional[str], bool]:
+    """
+    WHERE conditions and their params for the list filters, shared by list
+    pages and exports. Returns (conditions, params, tsquery, whether the
+    per-status counters can answer the count).
+    """
+    conditions = []
+    params = []
+
+    if status:
+        is_completed = (status == "completed")
+        conditions.append("is_completed = %s")
+        params.append(is_completed)
+
+    # Filters beyond status are not covered by the counters
+    counters_cover = True
+    if priority:
+        conditions.append("priority = %s")
+        params.append(priority)
+        counters_cover = False
+    if due_after is not None:
+        conditions.append("due_date >= %s")
+        params.append(due_after)
+        counters_cover = False
+    if due_before is not None:
+        conditions.append("due_date < %s")
+        params.append(due_before)
+        counters_cover = False
+    if overdue is not None:
+        # Written with a literal so the status-leading indexes apply
+        if overdue:
+            conditions.append("is_completed = FALSE AND due_date < %s")
+        else:
+            conditions.append("(is_completed OR due_date IS NULL OR due_date >= %s)")
+        params.append(now or datetime.now(timezone.utc))
+        counters_cover = False
+
+    # Whole words (as prefixes) through the full-text index, fragments
+    # inside words through the trigram index; the planner ORs the two
+    # bitmap scans.
+    tsquery = _prefix_tsquery(search) if search else None
+    if search:
+        matchers = []
+        if tsquery:
+            matchers.append("search_vector @@ to_tsquery('simple', %s)")
+            params.append(tsquery)
+        if len(search) >= MIN_SUBSTRING_SEARCH:
+            matchers.append(f"{SEARCH_TEXT_SQL} ILIKE %s")
+            params.append(_like_pattern(search))
+        conditions.append(f"({' OR '.join(matchers)})" if matchers else "FALSE")
+        counters_cover = False
+
+    return conditions, params, tsquery, counters_cover
+
+def _caught_up(after: Optional[Tuple[int, Optional[UUID]]], version: int) -> bool:
+    # A position at the end of the current version has nothing left to read
+    return after is not None and after[1] is None and after[0] >= version
+
+def _changes_result(state: Dict[str, Any], items: List[Dict[str, Any]], limit: int) -> Dict[str, Any]:
+    return {
+        "items": items[:limit],
+        "has_more": len(items) > limit,
+        "version": state["version"],
+        "floor": state["changes_floor"]
+    }
+
+def _list_result(items: List[Dict[str, Any]], total_count: Optional[int], keyset: bool, limit: int) -> Dict[str, Any]:
+    result = {
+        "items": items,
+        "total_count": total_count
+    }
+    if keyset:
+        # One extra row was fetched to learn whether another page exists
+        result["has_more"] = len(items) > limit
+        result["items"] = items[:limit]
+    return result
+
+class _ListStatements:
+    """
+    SQL building shared by the blocking and async repositories.
+    """
+    def _list_statements(
+        self,
+        page: int,
+        limit: int,
+        status: Optional[str],
+        sort_by: str,
+        order: str,
+        keyset: bool,
+        after: Optional[Tuple[Optional[datetime], UUID]],
+        search: Optional[str] = None,
+        count: str = "exact",
+        priority: Optional[str] = None,
+        due_before: Optional[datetime] = None,
+        due_after: Optional[datetime] = None,
+        overdue: Optional[bool] = None,
+        now: Optional[datetime] = None
+    ) -> Tuple[str, List[Any], str, List[Any]]:
+        """
+        Builds (page query, page params, count query, count params).
+        """
+        offset = (page - 1) * limit
+
+        conditions, params, tsquery, counters_cover = _filter_conditions(
+            status, search, priority, due_before, due_after, overdue, now
+        )
+        where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        
+        # Validate sort field. Relevance needs a search; relevance and
+        # priority cannot be keyset-paginated.
+        allowed_sort = ["created_at", "due_date"]
+        if not keyset:
+            allowed_sort.append("priority")
+            if tsquery:
+                allowed_sort.append("relevance")
+        if sort_by not in allowed_sort:
+            sort_by = "created_at"
+        
+        allowed_order = ["asc", "desc"]
+        if order.lower() not in allowed_order:
+            order = "desc"
+
+        if counters_cover:
+            # Status filters map directly onto the counter rows
+            count_query = f"SELECT COALESCE(SUM(total), 0) AS total FROM santiago_munoz_read.todo_counts {where_clause}"
+        elif count == "estimate":
+            # The planner's row estimate costs no scan at all
+            count_query = f"EXPLAIN (FORMAT JSON) SELECT 1 FROM santiago_munoz_read.todos {where_clause}"
+        else:
+            count_query = f"SELECT COUNT(*) AS total FROM santiago_munoz_read.todos {where_clause}"
+
+        if keyset:
+            query, page_params = self._keyset_page_query(where_clause, params, limit, sort_by, order.lower(), after)
+        elif sort_by == "relevance":
+            query = f"""
+                SELECT id, title, description, priority, due_date, is_completed, created_at, updated_at
+                FROM santiago_munoz_read.todos
+                {where_clause}
+                ORDER BY ts_rank(search_vector, to_tsquery('simple', %s)) DESC, created_at DESC, id ASC
+                LIMIT %s OFFSET %s
+            """
+            page_params = params + [tsquery, limit, offset]
+        else:
+            # PRIORITY_RANK_SQL orders High > Medium > Low > none. The id
+            # tie-break follows the sort direction so a (key, id) index serves
+            # both directions without a sort step.
+            sort_expr = PRIORITY_RANK_SQL if sort_by == "priority" else sort_by
+            query = f"""
+                SELECT id, title, description, priority, due_date, is_completed, created_at, updated_at
+                FROM santiago_munoz_read.todos
+                {where_clause}
+                ORDER BY {sort_expr} {order}, id {order}
+                LIMIT %s OFFSET %s
+            """
+            page_params = params + [limit, offset]
+        return query, page_params, count_query, params
+
+    def _export_statement(
+        self,
+        since: Optional[datetime],
+        status: Optional[str],
+        search: Optional[str],
+        priority: Optional[str],
+        due_before: Optional[datetime],
+        due_after: Optional[datetime],
+        overdue: Optional[bool],
+        now: Optional[datetime]
+    ) -> Tuple[str, List[Any]]:
+        """
+        Builds (query, params) selecting every row that matches the list
+        filters, in (updated_at, id) order.
+        """
+        conditions, params, _, _ = _filter_conditions(status, search, priority, due_before, due_after, overdue, now)
+        if since is not None:
+            # Inclusive: a todo updated in the same instant as the previous
+            # export's last row is repeated rather than lost
+            conditions.append("updated_at >= %s")
+            params.append(since)
+        where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        query = f"""
+            SELECT id, title, description, priority, due_date, is_completed, created_at, updated_at
+            FROM santiago_munoz_read.todos
+            {where_clause}
+            ORDER BY updated_at, id
+        """
+        return query, params
+
+    def _changes_statement(self, after: Optional[Tuple[int, Optional[UUID]]], limit: int) -> Tuple[str, List[Any]]:
+        """
+        Builds (query, params) for the rows changed after the `after`
+        (change_seq, id) position, in change order. Without an id the
+        position is the end of change_seq: a change version is committed
+        all at once, so nothing can be added to it later.
+        """
+        params: List[Any] = []
+        if after is None:
+            where_clause = ""
+        elif after[1] is None:
+            where_clause = "WHERE change_seq > %s"
+            params.append(after[0])
+        else:
+            where_clause = "WHERE (change_seq, id) > (%s, %s)"
+            params.extend(after)
+
+        query = f"""
+            SELECT id, title, description, priority, due_date, is_completed, created_at, updated_at, change_seq
+            FROM santiago_munoz_read.todos
+            {where_clause}
+            ORDER BY change_seq, id
+            LIMIT %s
+        """
+        # One extra row tells whether another page exists
+        params.append(limit + 1)
+        return query, params
+
+    def _keyset_page_query(
+        self,
+        where_clause: str,
+        params: List[Any],
+        limit: int,
+        sort_by: str,
+        order: str,
+        after: Optional[Tuple[Optional[datetime], UUID]]
+    ) -> Tuple[str, List[Any]]:
+        # NULL due dates sort as 'infinity', which matches Postgres' default
+        # NULLS LAST/FIRST placement while keeping row comparisons well defined.
+        # Both expressions are served by the (sort key, id) composite indexes.
+        if sort_by == "due_date":
+            sort_expr = "COALESCE(due_date, 'infinity'::timestamptz)"
+            value_expr = "COALESCE(%s::timestamptz, 'infinity'::timestamptz)"
+        else:
+            sort_expr = "created_at"
+            value_expr = "%s::timestamptz"
+
+        conditions = [where_clause[len("WHERE "):]] if where_clause else []
+        page_params = list(params)
+        if after is not None:
+            comparator = ">" if order == "asc" else "<"
+            conditions.append(f"({sort_expr}, id) {comparator} ({value_expr}, %s)")
+            page_params.extend(after)
+        keyset_where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        query = f"""
+            SELECT id, title, description, priority, due_date, is_completed, created_at, updated_at
+            FROM santiago_munoz_read.todos
+            {keyset_where}
+            ORDER BY {sort_expr} {order}, id {order}
+            LIMIT %s
+        """
+        page_params.append(limit + 1)
+        return query, page_params
+
+class TodoReadRepository(_ListStatements):
     def upsert(
         self, 
         todo_id: UUID, 
@@ -21,28 +424,47 @@ class TodoReadRepository:
         """
         with get_db_transaction() as cur:
             # 1. Idempotency check for the event
-            cur.execute("SELECT 1 FROM santiago_munoz_read.processed_events WHERE event_id = %s", (event_id,))
+            cur.execute(SELECT_PROCESSED_EVENT_SQL, (event_id,))
             if cur.fetchone():
                 return
 
-            # 2. Upsert into read model
-            cur.execute(
-                """
-                INSERT INTO santiago_munoz_read.todos (id, title, description, priority, due_date, is_completed, created_at, updated_at)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (id) DO UPDATE SET
-                    title = EXCLUDED.title,
-                    description = EXCLUDED.description,
-                    priority = EXCLUDED.priority,
-                    due_date = EXCLUDED.due_date,
-                    is_completed = EXCLUDED.is_completed,
-                    updated_at = EXCLUDED.updated_at
-                """,
-                (todo_id, title, description, priority, due_date, is_completed, created_at, updated_at)
-            )
+            # 2. Upsert into read model (and status counters)
+            _upsert_todos(cur, [dict(
+                todo_id=todo_id, title=title, description=description, priority=priority,
+                due_date=due_date, is_completed=is_completed, created_at=created_at, updated_at=updated_at
+            )])
 
             # 3. Mark event as processed
-            cur.execute("INSERT INTO santiago_munoz_read.processed_events (event_id) VALUES (%s)", (event_id,))
+            cur.execute(INSERT_PROCESSED_EVENT_SQL, (event_id,))
+
+    def upsert_many(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Batch form of `upsert`: takes dicts with the same keys as its arguments
+        and applies them in one transaction with three statements regardless
+        of batch size. Returns the number of events actually applied.
+        """
+        with get_db_transaction() as cur:
+            # 1. Idempotency check for the whole batch
+            cur.execute(SELECT_PROCESSED_EVENTS_SQL, ([row["event_id"] for row in rows],))
+            event_ids, latest = _unseen_events(rows, {r["event_id"] for r in cur.fetchall()})
+            if not event_ids:
+                return 0
+
+            # 2. Multi-row upsert into read model (and status counters)
+            _upsert_todos(cur, latest)
+
+            # 3. Mark events as processed
+            cur.execute(INSERT_PROCESSED_EVENTS_SQL, (event_ids,))
+            return len(event_ids)
+
+    def get_projection_version(self) -> int:
+        """
+        Current projection version stamp; it changes whenever the read model
+        changes, so results computed at the same version are still fresh.
+        """
+        with get_db_cursor() as cur:
+            cur.execute(SELECT_PROJECTION_VERSION_SQL)
+            return cur.fetchone()["version"]
 
     def list_todos(
         self, 
@@ -50,49 +472,263 @@ class TodoReadRepository:
         limit: int = 10, 
         status: Optional[str] = None, 
         sort_by: str = "created_at", 
-        order: str = "desc"
+        order: str = "desc",
+        keyset: bool = False,
+        after: Optional[Tuple[Optional[datetime], UUID]] = None,
+        count: str = "exact",
+        search: Optional[str] = None,
+        priority: Optional[str] = None,
+        due_before: Optional[datetime] = None,
+        due_after: Optional[datetime] = None,
+        overdue: Optional[bool] = None,
+        now: Optional[datetime] = None
     ) -> Dict[str, Any]:
         """
         Query side: Lists todos with pagination, filtering, and sorting.
-        """
-        offset = (page - 1) * limit
-        
-        # Base queries
-        where_clause = ""
-        params = []
-        
-        if status:
-            is_completed = (status == "completed")
-            where_clause = "WHERE is_completed = %s"
-            params.append(is_completed)
-        
-        # Validate sort field
-        allowed_sort = ["created_at", "due_date"]
-        if sort_by not in allowed_sort:
-            sort_by = "created_at"
-        
-        allowed_order = ["asc", "desc"]
-        if order.lower() not in allowed_order:
-            order = "desc"
 
-        query = f"""
-            SELECT id, title, description, priority, due_date, is_completed, created_at, updated_at
-            FROM santiago_munoz_read.todos
-            {where_clause}
-            ORDER BY {sort_by} {order}, id ASC
-            LIMIT %s OFFSET %s
+        With `keyset=True` the page starts right after the `after`
+        (sort key, id) position instead of skipping `offset` rows, so every
+        page costs the same index range scan. The result then also carries
+        `has_more`.
+
+        `search` filters on title and description: every word as a prefix
+        (full-text index) or the whole string as a substring (trigram index).
+        `sort_by="relevance"` ranks matches, title hits first.
+
+        `priority`, `due_after` (inclusive) and `due_before` (exclusive)
+        filter on those columns; `overdue=True` keeps open todos due before
+        `now` (default: the current time), `overdue=False` the rest.
+        `sort_by="priority"` orders High, Medium, Low, then unset.
+
+        `count` selects how `total_count` is produced: "exact" and "estimate"
+        read the per-status counters maintained by the projection (exact, and
+        cheaper than any estimate); "none" skips counting and returns None.
+        Searches and the filters above are not covered by the counters:
+        "exact" runs COUNT(*) over the matches and "estimate" takes the
+        planner's row estimate.
         """
-        
-        count_query = f"SELECT COUNT(*) as total FROM santiago_munoz_read.todos {where_clause}"
-        
+        page_query, page_params, count_query, params = self._list_statements(
+            page, limit, status, sort_by, order, keyset, after, search, count,
+            priority, due_before, due_after, overdue, now
+        )
+
         with get_db_cursor() as cur:
-            cur.execute(query, tuple(params + [limit, offset]))
+            cur.execute(page_query, tuple(page_params))
             items = cur.fetchall()
             
-            cur.execute(count_query, tuple(params))
-            total_count = cur.fetchone()["total"]
+            total_count = None
+            if count != "none":
+                cur.execute(count_query, tuple(params))
+                total_count = _total(cur.fetchone())
             
-        return {
-            "items": items,
-            "total_count": total_count
-        }
+        return _list_result(items, total_count, keyset, limit)
+
+    def list_changes(self, after: Optional[Tuple[int, Optional[UUID]]] = None, limit: int = 100) -> Dict[str, Any]:
+        """
+        Todos whose projection changed after the `after` (change_seq, id)
+        position, oldest change first, at most `limit` of them. The result
+        also carries `has_more`, the projection `version` and the change
+        feed's `floor` (see the add_todo_changes migration).
+
+        The version is read before the rows: every change up to it is
+        visible to the row query, so it is a safe position to resume from.
+        Clients that are caught up cost only that first lookup.
+        """
+        with get_db_cursor() as cur:
+            cur.execute(SELECT_CHANGES_STATE_SQL)
+            state = cur.fetchone()
+            items = []
+            if not _caught_up(after, state["version"]):
+                query, params = self._changes_statement(after, limit)
+                cur.execute(query, tuple(params))
+                items = cur.fetchall()
+        return _changes_result(state, items, limit)
+
+    def export_rows(
+        self,
+        batch_size: int = EXPORT_BATCH_SIZE,
+        since: Optional[datetime] = None,
+        status: Optional[str] = None,
+        search: Optional[str] = None,
+        priority: Optional[str] = None,
+        due_before: Optional[datetime] = None,
+        due_after: Optional[datetime] = None,
+        overdue: Optional[bool] = None,
+        now: Optional[datetime] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Streams every todo matching the `list_todos` filters in batches of
+        `batch_size` rows, fetched from a server-side cursor so memory stays
+        flat however many rows match. Rows come in (updated_at, id) order.
+
+        updated_at is the event's time, not when the row was projected: a
+        row applied late (relay or projection lag) can carry an updated_at
+        older than rows an earlier export already returned. Callers resuming
+        from the last updated_at must move `since` back by more than that
+        lag, as ExportTodosQueryHandler does.
+
+        The replica connection is held until the iterator is exhausted or
+        closed.
+        """
+        query, params = self._export_statement(since, status, search, priority, due_before, due_after, overdue, now)
+        with get_db_connection(readonly=True) as conn, conn.transaction():
+            with conn.cursor(name=EXPORT_CURSOR) as cur:
+                cur.execute(query, tuple(params))
+                while True:
+                    rows = cur.fetchmany(batch_size)
+                    if not rows:
+                        return
+                    yield rows
+
+    def export_csv(
+        self,
+        since: Optional[datetime] = None,
+        status: Optional[str] = None,
+        search: Optional[str] = None,
+        priority: Optional[str] = None,
+        due_before: Optional[datetime] = None,
+        due_after: Optional[datetime] = None,
+        overdue: Optional[bool] = None,
+        now: Optional[datetime] = None
+    ) -> Iterator[bytes]:
+        """
+        `export_rows` as CSV with a header line, formatted by the server with
+        COPY TO STDOUT and passed through in the chunks it arrives in.
+        """
+        query, params = self._export_statement(since, status, search, priority, due_before, due_after, overdue, now)
+        with get_db_connection(readonly=True) as conn, conn.cursor() as cur:
+            with cur.copy(_export_csv_sql(query), tuple(params)) as copy:
+                for data in copy:
+                    yield bytes(data)
+
+class AsyncTodoReadRepository(_ListStatements):
+    """
+    TodoReadRepository on the async pools, for the ASGI server. Statements
+    are shared with the blocking repository; `list_todos` runs the page and
+    count queries concurrently on two connections.
+    """
+    async def upsert(
+        self, 
+        todo_id: UUID, 
+        title: str, 
+        description: Optional[str], 
+        priority: Optional[str], 
+        due_date: Optional[datetime], 
+        is_completed: bool, 
+        created_at: datetime, 
+        updated_at: datetime,
+        event_id: UUID
+    ) -> None:
+        async with get_async_db_transaction() as cur:
+            await cur.execute(SELECT_PROCESSED_EVENT_SQL, (event_id,))
+            if await cur.fetchone():
+                return
+
+            await cur.execute(UPSERT_TODOS_SQL, _upsert_params([dict(
+                todo_id=todo_id, title=title, description=description, priority=priority,
+                due_date=due_date, is_completed=is_completed, created_at=created_at, updated_at=updated_at
+            )]))
+            await cur.execute(INSERT_PROCESSED_EVENT_SQL, (event_id,))
+
+    async def upsert_many(self, rows: List[Dict[str, Any]]) -> int:
+        async with get_async_db_transaction() as cur:
+            await cur.execute(SELECT_PROCESSED_EVENTS_SQL, ([row["event_id"] for row in rows],))
+            event_ids, latest = _unseen_events(rows, {r["event_id"] for r in await cur.fetchall()})
+            if not event_ids:
+                return 0
+
+            await cur.execute(UPSERT_TODOS_SQL, _upsert_params(latest))
+            await cur.execute(INSERT_PROCESSED_EVENTS_SQL, (event_ids,))
+            return len(event_ids)
+
+    async def get_projection_version(self) -> int:
+        async with get_async_db_cursor() as cur:
+            await cur.execute(SELECT_PROJECTION_VERSION_SQL)
+            return (await cur.fetchone())["version"]
+
+    async def list_todos(
+        self, 
+        page: int = 1, 
+        limit: int = 10, 
+        status: Optional[str] = None, 
+        sort_by: str = "created_at", 
+        order: str = "desc",
+        keyset: bool = False,
+        after: Optional[Tuple[Optional[datetime], UUID]] = None,
+        count: str = "exact",
+        search: Optional[str] = None,
+        priority: Optional[str] = None,
+        due_before: Optional[datetime] = None,
+        due_after: Optional[datetime] = None,
+        overdue: Optional[bool] = None,
+        now: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        page_query, page_params, count_query, params = self._list_statements(
+            page, limit, status, sort_by, order, keyset, after, search, count,
+            priority, due_before, due_after, overdue, now
+        )
+
+        async def fetch_page() -> List[Dict[str, Any]]:
+            async with get_async_db_cursor() as cur:
+                await cur.execute(page_query, tuple(page_params))
+                return await cur.fetchall()
+
+        async def fetch_count() -> Optional[int]:
+            if count == "none":
+                return None
+            async with get_async_db_cursor() as cur:
+                await cur.execute(count_query, tuple(params))
+                return _total(await cur.fetchone())
+
+        items, total_count = await asyncio.gather(fetch_page(), fetch_count())
+        return _list_result(items, total_count, keyset, limit)
+
+    async def list_changes(self, after: Optional[Tuple[int, Optional[UUID]]] = None, limit: int = 100) -> Dict[str, Any]:
+        async with get_async_db_cursor() as cur:
+            await cur.execute(SELECT_CHANGES_STATE_SQL)
+            state = await cur.fetchone()
+            items = []
+            if not _caught_up(after, state["version"]):
+                query, params = self._changes_statement(after, limit)
+                await cur.execute(query, tuple(params))
+                items = await cur.fetchall()
+        return _changes_result(state, items, limit)
+
+    async def export_rows(
+        self,
+        batch_size: int = EXPORT_BATCH_SIZE,
+        since: Optional[datetime] = None,
+        status: Optional[str] = None,
+        search: Optional[str] = None,
+        priority: Optional[str] = None,
+        due_before: Optional[datetime] = None,
+        due_after: Optional[datetime] = None,
+        overdue: Optional[bool] = None,
+        now: Optional[datetime] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        query, params = self._export_statement(since, status, search, priority, due_before, due_after, overdue, now)
+        async with get_async_db_connection(readonly=True) as conn, conn.transaction():
+            async with conn.cursor(name=EXPORT_CURSOR) as cur:
+                await cur.execute(query, tuple(params))
+                while True:
+                    rows = await cur.fetchmany(batch_size)
+                    if not rows:
+                        return
+                    yield rows
+
+    async def export_csv(
+        self,
+        since: Optional[datetime] = None,
+        status: Optional[str] = None,
+        search: Optional[str] = None,
+        priority: Optional[str] = None,
+        due_before: Optional[datetime] = None,
+        due_after: Optional[datetime] = None,
+        overdue: Optional[bool] = None,
+        now: Optional[datetime] = None
+    ) -> AsyncIterator[bytes]:
+        query, params = self._export_statement(since, status, search, priority, due_before, due_after, overdue, now)
+        async with get_async_db_connection(readonly=True) as conn, conn.cursor() as cur:
+            async with cur.copy(_export_csv_sql(query), tuple(params)) as copy:
+                async for data in copy:
+                    yield bytes(data)
@@ -0,0 +1,29 @@
+from datetime import datetime
+from .db import get_db_transaction
+
+DELETE_PROCESSED_EVENTS_SQL = """
+    DELETE FROM santiago_munoz_read.processed_events
+    WHERE event_id IN (
+        SELECT event_id FROM santiago_munoz_read.processed_events
+        WHERE processed_at < %(cutoff)s
+        ORDER BY processed_at
+        LIMIT %(limit)s
+        FOR UPDATE SKIP LOCKED
+    )
+"""
+
+class ReadRetention:
+    """
+    Housekeeping for the read schema. Deletes run on the primary, each in its
+    own short transaction over at most `limit` rows.
+    """
+    def delete_processed_events(self, cutoff: datetime, limit: int) -> int:
+        """
+        Deletes up to `limit` processed-event markers older than `cutoff`,
+        oldest first. The retention window must outlast the longest possible
+        redelivery delay; an event redelivered after its marker is gone is
+        applied again.
+        """
+        with get_db_transaction() as cur:
+            cur.execute(DELETE_PROCESSED_EVENTS_SQL, {"cutoff": cutoff, "limit": limit})
+            return cur.rowcount
@@ -0,0 +1,91 @@
+"""
+Checks the list query plans against a real Postgres (TEST_DATABASE_URL or a
+pytest-postgresql server; skipped otherwise): every filter and sort
+combination, and every export, must have an ordered index path, i.e. no Sort
+node.
+"""
+import itertools
+import json
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+import pytest
+from todo.benchmarks.schema import scratch_database
+from todo.read.src.infra.repo import TodoReadRepository
+
+NOW = datetime.now(timezone.utc)
+
+FILTERS = [
+    {},
+    {"priority": "High"},
+    {"due_after": NOW - timedelta(days=30), "due_before": NOW + timedelta(days=30)},
+    {"overdue": True, "now": NOW},
+    {"overdue": False, "now": NOW},
+]
+
+@pytest.fixture(scope="module")
+def plan_db(request):
+    import psycopg
+
+    with scratch_database(request, "TEST_DATABASE_URL", "todo_plans") as url:
+        with psycopg.connect(url, autocommit=True) as conn:
+            conn.execute("TRUNCATE santiago_munoz_read.todos")
+            conn.execute("""
+                INSERT INTO santiago_munoz_read.todos (id, title, description, priority, due_date, is_completed, created_at, updated_at)
+                SELECT gen_random_uuid(), 'Todo ' || i, NULL, (ARRAY['Low', 'Medium', 'High', NULL])[1 + i % 4],
+                    CASE WHEN i % 3 = 0 THEN NULL ELSE NOW() + (i % 200 - 100) * INTERVAL '1 day' END,
+                    i % 5 = 0, NOW() - i * INTERVAL '1 minute', NOW() - i * INTERVAL '1 minute'
+                FROM generate_series(1, 20000) AS i
+            """)
+            conn.execute("ANALYZE santiago_munoz_read.todos")
+            yield conn
+
+def _node_types(plan):
+    yield plan["Node Type"]
+    for child in plan.get("Plans", []):
+        yield from _node_types(child)
+
+def _plan_nodes(conn, sql, params):
+    # Sorting is priced out so the planner takes an ordered index path
+    # whenever one exists; a Sort left in the plan means no index can serve it.
+    with conn.transaction():
+        conn.execute("SET LOCAL enable_seqscan = off")
+        conn.execute("SET LOCAL enable_sort = off")
+        conn.execute("SET LOCAL enable_incremental_sort = off")
+        plan = conn.execute("EXPLAIN (FORMAT JSON) " + sql, params).fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return set(_node_types(plan[0]["Plan"]))
+
+@pytest.mark.parametrize("sort_by,order,keyset", [
+    (sort_by, order, keyset)
+    for sort_by, order, keyset in itertools.product(("created_at", "due_date", "priority"), ("asc", "desc"), (False, True))
+    if not (keyset and sort_by == "priority")
+])
+def test_every_filter_and_sort_is_served_by_an_index(plan_db, sort_by, order, keyset):
+    repo = TodoReadRepository()
+    after = (NOW, uuid4()) if keyset else None
+    offenders = []
+    for status, filters in itertools.product((None, "pending", "completed"), FILTERS):
+        sql, params, _, _ = repo._list_statements(
+            page=3, limit=20, status=status, sort_by=sort_by, order=order, keyset=keyset, after=after, **filters
+        )
+        nodes = _plan_nodes(plan_db, sql, params)
+        if nodes & {"Sort", "Incremental Sort", "Seq Scan"}:
+            offenders.append((status, sorted(filters), sorted(nodes)))
+
+    assert offenders == []
+
+@pytest.mark.parametrize("since", [None, NOW - timedelta(hours=1)])
+def test_exports_stream_in_index_order(plan_db, since):
+    repo = TodoReadRepository()
+    offenders = []
+    for status, filters in itertools.product((None, "pending", "completed"), FILTERS):
+        sql, params = repo._export_statement(
+            since, status, None, filters.get("priority"), filters.get("due_before"), filters.get("due_after"),
+            filters.get("overdue"), filters.get("now")
+        )
+        nodes = _plan_nodes(plan_db, sql, params)
+        if nodes & {"Sort", "Incremental Sort", "Seq Scan"}:
+            offenders.append((status, sorted(filters), sorted(nodes)))
+
+    assert offenders == []
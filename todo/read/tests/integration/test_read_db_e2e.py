@@ -5,6 +5,7 @@ from unittest.mock import MagicMock
 from datetime import datetime
 from todo.read.src.entrypoints.consume_events import lambda_handler as projection_handler
 from todo.read.src.entrypoints.api import lambda_handler as query_handler
+from todo.read.src.entrypoints.routes import cache as query_cache
 
 @pytest.fixture(scope="function")
 def mock_context():
@@ -28,6 +29,15 @@ def mock_db(mocker):
     
     return mock_cursor
 
+@pytest.fixture(autouse=True)
+def empty_query_cache():
+    """
+    The list cache lives in module scope; start every test cold.
+    """
+    query_cache.clear()
+    yield
+    query_cache.clear()
+
 def test_read_side_e2e_flow(mock_db, mock_context):
     """
     Tests the flow: Event -> Projection -> Read Model (Mocked) -> Query API.
@@ -68,7 +78,7 @@ def test_read_side_e2e_flow(mock_db, mock_context):
             "updated_at": now
         }
     ]
-    mock_db.fetchone.return_value = {"total": 1}
+    mock_db.fetchone.return_value = {"total": 1, "version": 1}
     
     query_event = {
         "queryStringParameters": {
@@ -86,15 +96,21 @@ def test_read_side_e2e_flow(mock_db, mock_context):
     assert body["items"][0]["id"] == todo_id
     assert body["items"][0]["title"] == "Queryable Todo"
     
-    # Verify query table
-    assert "FROM santiago_munoz_read.todos" in mock_db.execute.call_args_list[3][0][0]
+    # Verify the cache checked the projection version before querying the table
+    assert "FROM santiago_munoz_read.projection_state" in mock_db.execute.call_args_list[3][0][0]
+    assert "FROM santiago_munoz_read.todos" in mock_db.execute.call_args_list[4][0][0]
+
+    # An identical request at the same version is served from the cache
+    executed = mock_db.execute.call_count
+    assert query_handler(query_event, mock_context)["body"] == response["body"]
+    assert mock_db.execute.call_count == executed + 1
 
 def test_read_side_empty_list(mock_db, mock_context):
     """
     Tests the case where no todos are found.
     """
     mock_db.fetchall.return_value = []
-    mock_db.fetchone.return_value = {"total": 0}
+    mock_db.fetchone.return_value = {"total": 0, "version": 0}
     
     response = query_handler({"queryStringParameters": {}}, mock_context)
     
@@ -102,3 +118,60 @@ def test_read_side_empty_list(mock_db, mock_context):
     body = json.loads(response["body"])
     assert len(body["items"]) == 0
     assert body["metadata"]["total_count"] == 0
+
+def test_projection_batch_reports_partial_failures(mock_db, mock_context):
+    """
+    Tests that SQS batches are projected together and only bad records are reported.
+    """
+    mock_db.fetchall.return_value = [] # No event in the batch was processed before
+    good = {
+        "event_id": str(uuid4()),
+        "event_type": "TodoCreated",
+        "payload": {"id": str(uuid4()), "title": "Batched", "created_at": datetime.now().isoformat()}
+    }
+    bad = {"event_id": str(uuid4()), "event_type": "TodoCreated", "payload": {"title": "Missing id"}}
+
+    response = projection_handler({
+        "Records": [
+            {"messageId": "m-1", "body": json.dumps(good)},
+            {"messageId": "m-2", "body": json.dumps(bad)},
+            {"messageId": "m-3", "body": "not json"}
+        ]
+    }, mock_context)
+
+    assert response == {"batchItemFailures": [{"itemIdentifier": "m-3"}, {"itemIdentifier": "m-2"}]}
+    assert "= ANY(%s)" in mock_db.execute.call_args_list[0][0][0]
+    assert "INSERT INTO santiago_munoz_read.todos" in mock_db.execute.call_args_list[1][0][0]
+
+def test_conditional_get_returns_not_modified(mock_db, mock_context):
+    """
+    Tests that a matching If-None-Match is answered with 304 without querying todos.
+    """
+    mock_db.fetchall.return_value = []
+    mock_db.fetchone.return_value = {"total": 0, "version": 42}
+
+    first = query_handler({"queryStringParameters": {"limit": "5"}}, mock_context)
+    etag = first["headers"]["ETag"]
+    assert etag.startswith('"42-')
+
+    mock_db.reset_mock()
+    mock_db.fetchone.return_value = {"version": 42}
+    response = query_handler({
+        "queryStringParameters": {"limit": "5"},
+        "headers": {"If-None-Match": f'W/"other", {etag}'}
+    }, mock_context)
+
+    assert response["statusCode"] == 304
+    assert response["body"] == ""
+    assert response["headers"]["ETag"] == etag
+    assert mock_db.execute.call_count == 1
+    assert "projection_state" in mock_db.execute.call_args[0][0]
+
+    # New projection version: the tag no longer matches
+    mock_db.fetchone.return_value = {"total": 0, "version": 43}
+    response = query_handler({
+        "queryStringParameters": {"limit": "5"},
+        "headers": {"If-None-Match": etag}
+    }, mock_context)
+    assert response["statusCode"] == 200
+    assert response["headers"]["ETag"] != etag
@@ -0,0 +1,42 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock
+from todo.read.src.entrypoints import asgi
+
+def _request(method: str, path: str, query_string: bytes = b"", headers=()):
+    scope = {"type": "http", "method": method, "path": path, "headers": list(headers), "query_string": query_string}
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(asgi.app(scope, receive, send))
+    start, body_message = sent
+    return start["status"], dict(start["headers"]), body_message["body"]
+
+def test_get_todos_passes_query_and_headers_to_shared_route(mocker):
+    route = mocker.patch.dict(asgi.ROUTES["/todos"], {"GET": AsyncMock(return_value={
+        "statusCode": 200, "headers": {"Content-Type": "application/json", "ETag": '"1-abc"'}, "body": "{}"
+    })})["GET"]
+
+    status, headers, body = _request(
+        "GET", "/todos", b"page=2&status=completed&page=3", headers=[(b"if-none-match", b'"0-abc"')]
+    )
+
+    assert status == 200
+    assert headers[b"etag"] == b'"1-abc"'
+    params, request_headers = route.call_args[0]
+    assert params == {"page": "3", "status": "completed"}
+    assert request_headers == {"if-none-match": '"0-abc"'}
+
+def test_invalid_query_is_a_bad_request():
+    status, _, body = _request("GET", "/todos", b"limit=0")
+    assert status == 400
+    assert "error" in json.loads(body)
+
+def test_unknown_routes_and_methods():
+    assert _request("GET", "/nope")[0] == 404
+    assert _request("POST", "/todos")[0] == 405
@@ -0,0 +1,70 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+from todo.read.src.app.cache import QueryResultCache, CachedListTodosQueryHandler
+from todo.read.src.app.queries import ListTodosQuery, ListTodosQueryHandler
+from todo.read.src.infra.repo import AsyncTodoReadRepository, TodoReadRepository
+
+def _async_cursor_factory(cursors):
+    def get_async_db_cursor():
+        cursor = cursors.pop(0)
+        return MagicMock(__aenter__=AsyncMock(return_value=cursor), __aexit__=AsyncMock(return_value=False))
+    return get_async_db_cursor
+
+def test_page_and_count_run_concurrently_on_separate_connections(mocker):
+    started = []
+    both_started = asyncio.Event()
+
+    def cursor(name, result):
+        cur = MagicMock()
+
+        async def execute(sql, params):
+            started.append(name)
+            if len(started) == 2:
+                both_started.set()
+            # Neither query finishes until both have been sent
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+
+        cur.execute = execute
+        cur.fetchall = AsyncMock(return_value=result)
+        cur.fetchone = AsyncMock(return_value=result)
+        return cur
+
+    mocker.patch(
+        "todo.read.src.infra.repo.get_async_db_cursor",
+        side_effect=_async_cursor_factory([cursor("page", [{"id": 1}]), cursor("count", {"total": 41})])
+    )
+
+    result = asyncio.run(AsyncTodoReadRepository().list_todos(limit=10, status="pending"))
+
+    assert sorted(started) == ["count", "page"]
+    assert result == {"items": [{"id": 1}], "total_count": 41}
+
+def test_async_repository_issues_the_same_statements(mocker):
+    sync_cursor = MagicMock()
+    sync_cursor.fetchone.return_value = {"total": 0}
+    sync_cursor.fetchall.return_value = []
+    mocker.patch("todo.read.src.infra.repo.get_db_cursor", return_value=MagicMock(__enter__=lambda s: sync_cursor))
+    TodoReadRepository().list_todos(page=2, limit=5, sort_by="due_date", order="asc")
+
+    async_cursors = [MagicMock(execute=AsyncMock(), fetchall=AsyncMock(return_value=[])),
+                     MagicMock(execute=AsyncMock(), fetchone=AsyncMock(return_value={"total": 0}))]
+    mocker.patch("todo.read.src.infra.repo.get_async_db_cursor", side_effect=_async_cursor_factory(list(async_cursors)))
+    asyncio.run(AsyncTodoReadRepository().list_todos(page=2, limit=5, sort_by="due_date", order="asc"))
+
+    assert [c.args for c in sync_cursor.execute.call_args_list] == [
+        async_cursors[0].execute.await_args.args, async_cursors[1].execute.await_args.args
+    ]
+
+def test_async_handler_output_matches_blocking_handler():
+    rows = {"items": [], "total_count": 0}
+    sync_repo = MagicMock(list_todos=MagicMock(return_value=rows), get_projection_version=MagicMock(return_value=3))
+    async_repo = MagicMock(list_todos=AsyncMock(return_value=rows), get_projection_version=AsyncMock(return_value=3))
+    query = ListTodosQuery(limit=5)
+
+    expected = ListTodosQueryHandler(sync_repo).handle_json(query)
+    cached = CachedListTodosQueryHandler(ListTodosQueryHandler(async_repo), QueryResultCache())
+
+    assert asyncio.run(cached.handle_json_async(query)) == expected
+    assert asyncio.run(cached.handle_json_async(query)) == expected
+    assert async_repo.list_todos.await_count == 1
+    assert async_repo.list_todos.await_args.kwargs == sync_repo.list_todos.call_args.kwargs
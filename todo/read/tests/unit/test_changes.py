@@ -0,0 +1,95 @@
+import json
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+from uuid import uuid4
+from todo.read.src.app.changes import (
+    ListChangesQuery, ListChangesQueryHandler, encode_change_token, decode_change_token
+)
+from todo.read.src.entrypoints import routes
+from todo.read.src.infra.repo import TodoReadRepository, SELECT_CHANGES_STATE_SQL, UPSERT_TODOS_SQL
+
+def _row(change_seq: int):
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return {
+        "id": uuid4(), "title": "Todo", "description": None, "priority": None, "due_date": None,
+        "is_completed": False, "created_at": now, "updated_at": now, "change_seq": change_seq
+    }
+
+@pytest.fixture
+def mock_cursor(mocker):
+    cursor = MagicMock()
+    cursor.fetchone.return_value = {"version": 40, "changes_floor": 7}
+    mocker.patch("todo.read.src.infra.repo.get_db_cursor", return_value=MagicMock(__enter__=lambda s: cursor))
+    return cursor
+
+def test_projection_writes_stamp_rows_with_the_bumped_version():
+    assert "RETURNING version" in UPSERT_TODOS_SQL
+    assert "change_seq = EXCLUDED.change_seq" in UPSERT_TODOS_SQL
+
+def test_first_sync_reads_from_the_start_in_change_order(mock_cursor):
+    mock_cursor.fetchall.return_value = [_row(3), _row(5), _row(9)]
+
+    result = TodoReadRepository().list_changes(limit=2)
+
+    assert mock_cursor.execute.call_args_list[0][0] == (SELECT_CHANGES_STATE_SQL,)
+    sql, params = mock_cursor.execute.call_args_list[1][0]
+    assert "WHERE" not in sql
+    assert "ORDER BY change_seq, id" in sql
+    assert params == (3,)
+    assert len(result["items"]) == 2
+    assert (result["has_more"], result["version"], result["floor"]) == (True, 40, 7)
+
+def test_resuming_inside_a_version_compares_row_values(mock_cursor):
+    mock_cursor.fetchall.return_value = []
+    todo_id = uuid4()
+
+    TodoReadRepository().list_changes(after=(12, todo_id), limit=50)
+
+    sql, params = mock_cursor.execute.call_args_list[1][0]
+    assert "WHERE (change_seq, id) > (%s, %s)" in sql
+    assert params == (12, todo_id, 51)
+
+def test_caught_up_clients_cost_one_lookup(mock_cursor):
+    result = TodoReadRepository().list_changes(after=(40, None), limit=50)
+
+    assert mock_cursor.execute.call_count == 1
+    assert result["items"] == [] and result["has_more"] is False
+
+def test_token_continues_from_last_row_or_from_the_version():
+    rows = [_row(41), _row(41)]
+    repo = MagicMock()
+    handler = ListChangesQueryHandler(repo)
+
+    repo.list_changes.return_value = {"items": rows, "has_more": True, "version": 40, "floor": 7}
+    body = json.loads(handler.handle_json(ListChangesQuery(limit=2)))
+    assert decode_change_token(body["next_token"]) == (7, 41, rows[-1]["id"])
+    assert body["has_more"] is True
+    assert [item["id"] for item in body["items"]] == [str(r["id"]) for r in rows]
+
+    # The last page hands out the end of the newest version seen
+    repo.list_changes.return_value = {"items": rows[:1], "has_more": False, "version": 40, "floor": 7}
+    body = json.loads(handler.handle_json(ListChangesQuery(since=body["next_token"])))
+    assert decode_change_token(body["next_token"]) == (7, 41, None)
+    assert repo.list_changes.call_args.kwargs == {"after": (41, rows[-1]["id"]), "limit": 100}
+
+    # Idle polls keep their position
+    repo.list_changes.return_value = {"items": [], "has_more": False, "version": 40, "floor": 7}
+    body = json.loads(handler.handle_json(ListChangesQuery(since=encode_change_token(7, 41, None))))
+    assert decode_change_token(body["next_token"]) == (7, 41, None)
+
+def test_route_maps_reset_and_invalid_tokens(mocker):
+    repo = MagicMock()
+    repo.list_changes.return_value = {"items": [], "has_more": False, "version": 90, "floor": 60}
+    mocker.patch.object(routes, "_init_handlers")
+    mocker.patch.object(routes, "changes_handler", ListChangesQueryHandler(repo))
+
+    stale = routes.list_changes({"since": encode_change_token(7, 41, None)}, {})
+    assert stale["statusCode"] == 410
+
+    fresh = routes.list_changes({}, {})
+    assert fresh["statusCode"] == 200
+    assert decode_change_token(json.loads(fresh["body"])["next_token"]) == (60, 90, None)
+
+    assert routes.list_changes({"since": "not-a-token"}, {})["statusCode"] == 400
+    assert routes.list_changes({"limit": "5000"}, {})["statusCode"] == 400
@@ -0,0 +1,67 @@
+import pytest
+from unittest.mock import MagicMock
+from psycopg_pool import PoolTimeout
+from todo.read.src.infra import db
+
+@pytest.fixture(autouse=True)
+def routed_env(monkeypatch):
+    monkeypatch.setenv("DATABASE_URL", "postgresql://primary/todo")
+    monkeypatch.setenv("READ_DATABASE_URL", "postgresql://replica/todo")
+    monkeypatch.delenv("READ_REPLICA_MAX_LAG_SECONDS", raising=False)
+    monkeypatch.setattr(db, "_replica_down_until", 0.0)
+    monkeypatch.setattr(db, "_replica_lag_checked_at", 0.0)
+    monkeypatch.setattr(db, "_replica_lagging", False)
+
+@pytest.fixture
+def pools(mocker):
+    primary, replica = MagicMock(name="primary"), MagicMock(name="replica")
+    mocker.patch("todo.read.src.infra.db.get_primary_pool", return_value=primary)
+    mocker.patch("todo.read.src.infra.db.get_replica_pool", return_value=replica)
+    return primary, replica
+
+def test_queries_use_replica_and_projections_use_primary(pools):
+    primary, replica = pools
+
+    with db.get_db_cursor():
+        pass
+    replica.getconn.assert_called_once()
+    replica.putconn.assert_called_once_with(replica.getconn.return_value)
+    primary.getconn.assert_not_called()
+
+    with db.get_db_transaction():
+        pass
+    primary.getconn.assert_called_once()
+    primary.putconn.assert_called_once_with(primary.getconn.return_value)
+
+def test_unreachable_replica_fails_over_to_primary(pools):
+    primary, replica = pools
+    replica.getconn.side_effect = PoolTimeout("replica down")
+
+    with db.get_db_cursor():
+        pass
+    primary.getconn.assert_called_once()
+
+    # The replica is skipped while it is marked down
+    with db.get_db_cursor():
+        pass
+    assert replica.getconn.call_count == 1
+    assert primary.getconn.call_count == 2
+
+def test_lagging_replica_routes_reads_to_primary(pools, monkeypatch):
+    primary, replica = pools
+    monkeypatch.setenv("READ_REPLICA_MAX_LAG_SECONDS", "1")
+    replica_conn = replica.getconn.return_value
+    replica_conn.execute.return_value.fetchone.return_value = {"lag": 12.5}
+
+    with db.get_db_cursor():
+        pass
+
+    replica.putconn.assert_called_once_with(replica_conn)
+    primary.getconn.assert_called_once()
+
+def test_single_url_shares_primary_pool(mocker, monkeypatch):
+    monkeypatch.delenv("READ_DATABASE_URL")
+    primary = MagicMock()
+    mocker.patch("todo.read.src.infra.db.get_primary_pool", return_value=primary)
+
+    assert db.get_replica_pool() is primary
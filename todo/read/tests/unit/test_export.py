@@ -0,0 +1,112 @@
+import asyncio
+import json
+from datetime import datetime, timezone, timedelta
+from unittest.mock import MagicMock
+from uuid import uuid4
+from todo.read.src.app.export import ExportTodosQuery, ExportTodosQueryHandler
+from todo.read.src.app.queries import ListTodosQuery, ListTodosQueryHandler
+from todo.read.src.entrypoints import asgi, routes
+from todo.read.src.infra.repo import TodoReadRepository, EXPORT_CURSOR
+
+def _row(minutes: int = 0):
+    created = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return {
+        "id": uuid4(), "title": "Todo", "description": None, "priority": "High", "due_date": None,
+        "is_completed": False, "created_at": created, "updated_at": created + timedelta(minutes=minutes)
+    }
+
+def _mock_connection(mocker, cursor):
+    conn = MagicMock()
+    conn.cursor.return_value = MagicMock(__enter__=lambda s: cursor)
+    connect = mocker.patch("todo.read.src.infra.repo.get_db_connection", return_value=MagicMock(__enter__=lambda s: conn))
+    return conn, connect
+
+def test_export_streams_batches_from_a_server_side_cursor(mocker):
+    cursor = MagicMock()
+    cursor.fetchmany.side_effect = [[_row(), _row()], [_row()], []]
+    conn, connect = _mock_connection(mocker, cursor)
+    since = datetime(2026, 1, 2, tzinfo=timezone.utc)
+
+    batches = list(TodoReadRepository().export_rows(batch_size=2, since=since, status="pending", priority="High"))
+
+    assert [len(b) for b in batches] == [2, 1]
+    connect.assert_called_once_with(readonly=True)
+    conn.cursor.assert_called_once_with(name=EXPORT_CURSOR)
+    cursor.fetchmany.assert_called_with(2)
+    sql, params = cursor.execute.call_args[0]
+    assert "is_completed = %s AND priority = %s AND updated_at >= %s" in sql
+    assert "ORDER BY updated_at, id" in sql
+    assert "LIMIT" not in sql and "OFFSET" not in sql
+    assert params == (False, "High", since)
+
+def test_csv_export_is_formatted_by_copy(mocker):
+    cursor = MagicMock()
+    copy = MagicMock()
+    copy.__iter__.return_value = iter([memoryview(b"id,title\n"), memoryview(b"1,Todo\n")])
+    cursor.copy.return_value = MagicMock(__enter__=lambda s: copy)
+    _mock_connection(mocker, cursor)
+
+    chunks = list(TodoReadRepository().export_csv(search="milk"))
+
+    assert chunks == [b"id,title\n", b"1,Todo\n"]
+    sql, params = cursor.copy.call_args[0]
+    assert sql.startswith("COPY (") and sql.endswith(") TO STDOUT WITH (FORMAT csv, HEADER)")
+    assert params == ("milk:*", "%milk%")
+
+def test_incremental_export_reaches_back_by_the_overlap():
+    repo = MagicMock()
+    repo.export_rows.return_value = iter([])
+    since = datetime(2026, 1, 2, tzinfo=timezone.utc)
+
+    list(ExportTodosQueryHandler(repo, since_overlap=timedelta(minutes=2)).handle(ExportTodosQuery(since=since.isoformat())))
+
+    # A row projected late, stamped before `since`, is still picked up
+    assert repo.export_rows.call_args.kwargs["since"] == since - timedelta(minutes=2)
+
+def test_ndjson_lines_match_list_items():
+    rows = [_row(), _row(minutes=5)]
+    repo = MagicMock()
+    repo.export_rows.return_value = iter([rows])
+    repo.list_todos.return_value = {"items": rows, "total_count": 2}
+
+    lines = b"".join(ExportTodosQueryHandler(repo, batch_size=7).handle(ExportTodosQuery(overdue="true"))).splitlines()
+
+    listed = json.loads(ListTodosQueryHandler(repo).handle_json(ListTodosQuery()))["items"]
+    assert [json.loads(line) for line in lines] == listed
+    kwargs = repo.export_rows.call_args.kwargs
+    assert kwargs["batch_size"] == 7 and kwargs["overdue"] is True and kwargs["now"] is not None
+
+def _stream(method: str, path: str, query_string: bytes = b""):
+    scope = {"type": "http", "method": method, "path": path, "headers": [], "query_string": query_string}
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(asgi.app(scope, receive, send))
+    return sent
+
+def test_asgi_export_streams_chunks(mocker):
+    async def chunks(query):
+        yield b'{"id": 1}\n'
+        yield b'{"id": 2}\n'
+
+    handler = MagicMock(handle_async=chunks)
+    mocker.patch.object(routes, "_init_async_export_handler")
+    mocker.patch.object(routes, "async_export_handler", handler)
+
+    start, *bodies = _stream("GET", "/todos/export", b"format=ndjson")
+
+    assert start["status"] == 200
+    assert dict(start["headers"])[b"content-type"] == b"application/x-ndjson"
+    assert b"content-length" not in dict(start["headers"])
+    assert [b["body"] for b in bodies] == [b'{"id": 1}\n', b'{"id": 2}\n', b""]
+    assert [b.get("more_body", False) for b in bodies] == [True, True, False]
+
+def test_asgi_export_rejects_invalid_parameters():
+    start, body = _stream("GET", "/todos/export", b"format=xml")
+    assert start["status"] == 400
+    assert "error" in json.loads(body["body"])
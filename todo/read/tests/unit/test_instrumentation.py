@@ -0,0 +1,87 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from todo.read.src.app.cache import CachedListTodosQueryHandler, QueryResultCache
+from todo.read.src.app.queries import ListTodosQueryHandler
+from todo.read.src.entrypoints import routes
+from todo.read.src.infra import instrumentation
+
+@pytest.fixture
+def collected():
+    metrics = []
+    instrumentation.set_sink(metrics.append)
+    yield metrics
+    instrumentation.set_sink(None)
+
+def _repo(repo):
+    repo.list_todos.return_value = {"items": [], "total_count": 0}
+    repo.get_projection_version.return_value = 1
+    return repo
+
+def test_list_reports_every_stage(mocker, collected):
+    repo = _repo(MagicMock())
+    mocker.patch.object(routes, "repo", repo)
+    mocker.patch.object(routes, "cached_handler", CachedListTodosQueryHandler(ListTodosQueryHandler(repo), QueryResultCache()))
+
+    assert routes.list_todos({"limit": "5"}, {})["statusCode"] == 200
+
+    [metrics] = collected
+    assert metrics.operation == "ListTodos"
+    assert {"stage_validate", "stage_version", "stage_fetch", "stage_serialize", "total"} <= set(metrics.timings)
+
+def test_async_list_reports_into_the_request_scope(mocker, collected):
+    repo = _repo(AsyncMock())
+    mocker.patch.object(routes, "async_repo", repo)
+    mocker.patch.object(routes, "async_cached_handler", CachedListTodosQueryHandler(ListTodosQueryHandler(repo), QueryResultCache()))
+
+    assert asyncio.run(routes.list_todos_async({}, {}))["statusCode"] == 200
+
+    [metrics] = collected
+    assert {"stage_fetch", "stage_serialize"} <= set(metrics.timings)
+
+def test_export_metrics_cover_the_streamed_body(mocker, collected):
+    async def chunks(query):
+        assert instrumentation.current() is not None
+        yield b'{"id": 1}\n'
+
+    mocker.patch.object(routes, "_init_async_export_handler")
+    mocker.patch.object(routes, "async_export_handler", MagicMock(handle_async=chunks))
+
+    async def serve():
+        response = await routes.export_todos_async({}, {})
+        # The scope stays open until the body has been sent
+        assert collected == []
+        body = [chunk async for chunk in response["stream"]]
+        await response["stream"].aclose()
+        return body
+
+    assert asyncio.run(serve()) == [b'{"id": 1}\n']
+    [metrics] = collected
+    assert (metrics.operation, metrics.service) == ("ExportTodos", "todo-read")
+    assert {"stage_stream", "total"} <= set(metrics.timings)
+
+def test_export_rejections_are_measured(collected):
+    assert asyncio.run(routes.export_todos_async({"format": "xml"}, {}))["statusCode"] == 400
+
+    [metrics] = collected
+    assert metrics.operation == "ExportTodos"
+
+def test_gathered_tasks_share_the_request_metrics(collected):
+    async def acquire():
+        instrumentation.record_acquire(0.0)
+
+    async def serve():
+        with instrumentation.request("ListTodos"):
+            await asyncio.gather(acquire(), acquire())
+
+    asyncio.run(serve())
+
+    [metrics] = collected
+    assert metrics.timings["db_acquire"] > 0
+
+def test_nothing_is_recorded_without_a_sink():
+    instrumentation.set_sink(None)
+    instrumentation.record_acquire(0.0)
+
+    with instrumentation.request("ListTodos"):
+        assert instrumentation.current() is None
@@ -0,0 +1,164 @@
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+from uuid import uuid4
+from todo.read.src.infra.repo import TodoReadRepository, PRIORITY_RANK_SQL
+
+@pytest.fixture
+def mock_cursor(mocker):
+    cursor = MagicMock()
+    cursor.fetchone.return_value = {"total": 3}
+    mocker.patch("todo.read.src.infra.repo.get_db_cursor", return_value=MagicMock(__enter__=lambda s: cursor))
+    return cursor
+
+def test_offset_mode_is_unchanged(mock_cursor):
+    mock_cursor.fetchall.return_value = []
+
+    TodoReadRepository().list_todos(page=3, limit=10, sort_by="due_date", order="asc")
+
+    sql, params = mock_cursor.execute.call_args_list[0][0]
+    assert "ORDER BY due_date asc, id asc" in sql
+    assert "LIMIT %s OFFSET %s" in sql
+    assert params == (10, 20)
+
+def test_keyset_mode_uses_row_value_comparison(mock_cursor):
+    mock_cursor.fetchall.return_value = [{"id": i} for i in range(3)]
+    after = (datetime.now(timezone.utc), uuid4())
+
+    result = TodoReadRepository().list_todos(limit=2, status="pending", keyset=True, after=after)
+
+    sql, params = mock_cursor.execute.call_args_list[0][0]
+    assert "(created_at, id) < (%s::timestamptz, %s)" in sql
+    assert "ORDER BY created_at desc, id desc" in sql
+    assert "OFFSET" not in sql
+    assert params == (False, after[0], after[1], 3)
+    assert result["has_more"] is True
+    assert len(result["items"]) == 2
+
+def test_keyset_due_date_sorts_nulls_as_infinity(mock_cursor):
+    mock_cursor.fetchall.return_value = []
+
+    result = TodoReadRepository().list_todos(sort_by="due_date", order="asc", keyset=True, after=(None, uuid4()))
+
+    sql = mock_cursor.execute.call_args_list[0][0][0]
+    assert "(COALESCE(due_date, 'infinity'::timestamptz), id) > (COALESCE(%s::timestamptz, 'infinity'::timestamptz), %s)" in sql
+    assert result["has_more"] is False
+
+def test_total_count_reads_status_counters(mock_cursor):
+    mock_cursor.fetchall.return_value = []
+
+    result = TodoReadRepository().list_todos(status="completed")
+
+    sql, params = mock_cursor.execute.call_args_list[1][0]
+    assert "FROM santiago_munoz_read.todo_counts WHERE is_completed = %s" in sql
+    assert "COUNT(*)" not in sql
+    assert params == (True,)
+    assert result["total_count"] == 3
+
+def test_count_none_skips_counting(mock_cursor):
+    mock_cursor.fetchall.return_value = []
+
+    result = TodoReadRepository().list_todos(count="none")
+
+    assert mock_cursor.execute.call_count == 1
+    assert result["total_count"] is None
+
+def test_search_matches_word_prefixes_or_substrings(mock_cursor):
+    mock_cursor.fetchall.return_value = []
+
+    TodoReadRepository().list_todos(status="pending", search="buy mil", sort_by="relevance")
+
+    sql, params = mock_cursor.execute.call_args_list[0][0]
+    assert "WHERE is_completed = %s AND (search_vector @@ to_tsquery('simple', %s) OR (title || ' ' || COALESCE(description, '')) ILIKE %s)" in sql
+    assert "ORDER BY ts_rank(search_vector, to_tsquery('simple', %s)) DESC, created_at DESC, id ASC" in sql
+    assert params == (False, "buy:* & mil:*", "%buy mil%", "buy:* & mil:*", 10, 0)
+
+def test_short_search_skips_substring_matching(mock_cursor):
+    mock_cursor.fetchall.return_value = []
+
+    TodoReadRepository().list_todos(search="go")
+
+    sql, params = mock_cursor.execute.call_args_list[0][0]
+    assert "ILIKE" not in sql
+    assert params == ("go:*", 10, 0)
+
+def test_search_without_words_matches_nothing(mock_cursor):
+    mock_cursor.fetchall.return_value = []
+
+    TodoReadRepository().list_todos(search="?!", sort_by="relevance")
+
+    sql, params = mock_cursor.execute.call_args_list[0][0]
+    assert "WHERE FALSE" in sql
+    assert "ts_rank" not in sql
+    assert params == (10, 0)
+
+def test_substring_pattern_escapes_like_wildcards(mock_cursor):
+    mock_cursor.fetchall.return_value = []
+
+    TodoReadRepository().list_todos(search="100%_done")
+
+    assert mock_cursor.execute.call_args_list[0][0][1][1] == "%100\\%\\_done%"
+
+def test_search_counts_matches_exactly(mock_cursor):
+    mock_cursor.fetchall.return_value = []
+
+    result = TodoReadRepository().list_todos(search="milk")
+
+    sql, params = mock_cursor.execute.call_args_list[1][0]
+    assert sql.strip().startswith("SELECT COUNT(*) AS total FROM santiago_munoz_read.todos WHERE")
+    assert params == ("milk:*", "%milk%")
+    assert result["total_count"] == 3
+
+def test_search_estimate_reads_planner_rows(mock_cursor):
+    mock_cursor.fetchall.return_value = []
+    mock_cursor.fetchone.return_value = {"QUERY PLAN": '[{"Plan": {"Node Type": "Bitmap Heap Scan", "Plan Rows": 1234}}]'}
+
+    result = TodoReadRepository().list_todos(search="milk", count="estimate")
+
+    sql = mock_cursor.execute.call_args_list[1][0][0]
+    assert sql.startswith("EXPLAIN (FORMAT JSON) SELECT 1 FROM santiago_munoz_read.todos WHERE")
+    assert result["total_count"] == 1234
+
+def test_relevance_needs_a_search(mock_cursor):
+    mock_cursor.fetchall.return_value = []
+
+    TodoReadRepository().list_todos(sort_by="relevance")
+
+    assert "ORDER BY created_at desc, id desc" in mock_cursor.execute.call_args_list[0][0][0]
+
+def test_filters_combine_and_fall_back_to_exact_count(mock_cursor):
+    mock_cursor.fetchall.return_value = []
+    due_after = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    due_before = datetime(2026, 2, 1, tzinfo=timezone.utc)
+
+    TodoReadRepository().list_todos(
+        status="pending", priority="High", due_after=due_after, due_before=due_before, sort_by="priority"
+    )
+
+    sql, params = mock_cursor.execute.call_args_list[0][0]
+    assert "WHERE is_completed = %s AND priority = %s AND due_date >= %s AND due_date < %s" in sql
+    assert f"ORDER BY {PRIORITY_RANK_SQL} desc, id desc" in sql
+    assert params == (False, "High", due_after, due_before, 10, 0)
+    count_sql, count_params = mock_cursor.execute.call_args_list[1][0]
+    assert count_sql.strip().startswith("SELECT COUNT(*) AS total FROM santiago_munoz_read.todos WHERE")
+    assert count_params == (False, "High", due_after, due_before)
+
+def test_overdue_compares_open_todos_with_reference_time(mock_cursor):
+    mock_cursor.fetchall.return_value = []
+    now = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+    TodoReadRepository().list_todos(overdue=True, now=now, sort_by="due_date", order="asc")
+    TodoReadRepository().list_todos(overdue=False, now=now, count="none")
+
+    overdue_sql, overdue_params = mock_cursor.execute.call_args_list[0][0]
+    assert "WHERE is_completed = FALSE AND due_date < %s" in overdue_sql
+    assert overdue_params == (now, 10, 0)
+    not_overdue_sql, _ = mock_cursor.execute.call_args_list[2][0]
+    assert "WHERE (is_completed OR due_date IS NULL OR due_date >= %s)" in not_overdue_sql
+
+def test_priority_sort_is_offset_only(mock_cursor):
+    mock_cursor.fetchall.return_value = []
+
+    TodoReadRepository().list_todos(sort_by="priority", keyset=True)
+
+    assert "ORDER BY created_at desc, id desc" in mock_cursor.execute.call_args_list[0][0][0]
@@ -0,0 +1,76 @@
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+from uuid import uuid4
+from todo.read.src.app.projections import TodoProjectionHandler
+from todo.read.src.infra.repo import TodoReadRepository
+
+def _event(todo_id=None, event_id=None, **payload):
+    return {
+        "event_id": event_id or str(uuid4()),
+        "event_type": "TodoCreated",
+        "payload": {
+            "id": todo_id or str(uuid4()),
+            "title": "Task",
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            **payload
+        }
+    }
+
+def test_handle_batch_applies_valid_events_together():
+    repo = MagicMock()
+    bad = _event(created_at="yesterday")
+    events = [_event(), bad, _event(), {"event_id": "x", "event_type": "TodoArchived", "payload": {}}]
+
+    failed = TodoProjectionHandler(repo).handle_batch(events)
+
+    assert failed == [bad["event_id"]]
+    rows = repo.upsert_many.call_args[0][0]
+    assert [str(r["event_id"]) for r in rows] == [events[0]["event_id"], events[2]["event_id"]]
+    assert not repo.upsert.called
+
+def test_handle_batch_isolates_rows_when_batch_write_fails():
+    repo = MagicMock()
+    repo.upsert_many.side_effect = RuntimeError("constraint violation")
+    events = [_event(), _event()]
+    repo.upsert.side_effect = [None, RuntimeError("constraint violation")]
+
+    failed = TodoProjectionHandler(repo).handle_batch(events)
+
+    assert failed == [events[1]["event_id"]]
+    assert repo.upsert.call_count == 2
+
+@pytest.fixture
+def mock_cursor(mocker):
+    cursor = MagicMock()
+    mocker.patch("todo.read.src.infra.repo.get_db_transaction", return_value=MagicMock(__enter__=lambda s: cursor))
+    return cursor
+
+def test_upsert_many_dedupes_against_processed_events(mock_cursor):
+    handler = TodoProjectionHandler(MagicMock())
+    todo_id = str(uuid4())
+    processed, first, second = _event(), _event(todo_id, title="Old"), _event(todo_id, title="New")
+    rows = [handler._to_row(e["event_id"], e["event_type"], e["payload"]) for e in (processed, first, second)]
+    mock_cursor.fetchall.return_value = [{"event_id": rows[0]["event_id"]}]
+
+    applied = TodoReadRepository().upsert_many(rows)
+
+    assert applied == 2
+    assert mock_cursor.execute.call_count == 3
+    assert "= ANY(%s)" in mock_cursor.execute.call_args_list[0][0][0]
+    upsert_sql, columns = mock_cursor.execute.call_args_list[1][0]
+    assert "unnest" in upsert_sql and "ON CONFLICT (id)" in upsert_sql
+    # The same todo appears once, with the latest event's values
+    assert columns["titles"] == ["New"]
+    # Status counters are maintained by the same statement
+    assert "UPDATE santiago_munoz_read.todo_counts" in upsert_sql
+    assert mock_cursor.execute.call_args_list[2][0][1] == ([rows[1]["event_id"], rows[2]["event_id"]],)
+
+def test_upsert_many_skips_fully_processed_batches(mock_cursor):
+    handler = TodoProjectionHandler(MagicMock())
+    event = _event()
+    row = handler._to_row(event["event_id"], event["event_type"], event["payload"])
+    mock_cursor.fetchall.return_value = [{"event_id": row["event_id"]}]
+
+    assert TodoReadRepository().upsert_many([row]) == 0
+    assert mock_cursor.execute.call_count == 1
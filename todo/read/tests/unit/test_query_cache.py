@@ -0,0 +1,79 @@
+from unittest.mock import MagicMock
+from todo.read.src.app.cache import QueryResultCache, CachedListTodosQueryHandler, cache_key, list_etag, etag_matches
+from todo.read.src.app.queries import ListTodosQuery
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = QueryResultCache(max_entries=10, ttl_seconds=5, clock=clock)
+    cache.put("k", 1, "body")
+
+    assert cache.get("k", 1) == "body"
+    clock.now = 5.0
+    assert cache.get("k", 1) is None
+    assert cache.stats() == {"hits": 1, "misses": 1, "stale": 1, "evictions": 0, "size": 0}
+
+def test_version_change_invalidates_entry():
+    cache = QueryResultCache(max_entries=10, ttl_seconds=60)
+    cache.put("k", 1, "body")
+
+    assert cache.get("k", 2) is None
+    assert cache.stats()["stale"] == 1
+
+def test_least_recently_used_entry_is_evicted():
+    cache = QueryResultCache(max_entries=2, ttl_seconds=60)
+    cache.put("a", 1, "A")
+    cache.put("b", 1, "B")
+    cache.get("a", 1)
+    cache.put("c", 1, "C")
+
+    assert cache.get("b", 1) is None
+    assert cache.get("a", 1) == "A"
+    assert cache.stats()["evictions"] == 1
+
+def test_cache_key_normalizes_order():
+    assert cache_key(ListTodosQuery(order="DESC")) == cache_key(ListTodosQuery(order="desc"))
+    assert cache_key(ListTodosQuery(page=2)) != cache_key(ListTodosQuery(page=1))
+
+def test_cached_handler_recomputes_only_when_version_moves():
+    inner = MagicMock()
+    inner.handle_json.side_effect = ["v1", "v2"]
+    inner.repo.get_projection_version.side_effect = [7, 7, 8]
+    handler = CachedListTodosQueryHandler(inner, QueryResultCache(max_entries=10, ttl_seconds=60))
+    query = ListTodosQuery()
+
+    assert [handler.handle_json(query) for _ in range(3)] == ["v1", "v1", "v2"]
+    assert inner.handle_json.call_count == 2
+
+def test_disabled_cache_skips_version_lookup():
+    inner = MagicMock()
+    inner.handle_json.return_value = "body"
+    handler = CachedListTodosQueryHandler(inner, QueryResultCache(ttl_seconds=0))
+
+    assert handler.handle_json(ListTodosQuery()) == "body"
+    assert not inner.repo.get_projection_version.called
+
+def test_etag_depends_on_version_and_query():
+    query = ListTodosQuery(limit=5)
+    etag = list_etag(query, 3)
+
+    assert etag == list_etag(ListTodosQuery(limit=5), 3)
+    assert etag != list_etag(query, 4)
+    assert etag != list_etag(ListTodosQuery(limit=6), 3)
+    assert etag_matches(f"W/{etag}", etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+
+def test_overdue_queries_are_keyed_by_reference_minute():
+    query = ListTodosQuery(overdue=True)
+    later = ListTodosQuery(overdue=True)
+    later._as_of = query.as_of.replace(minute=(query.as_of.minute + 1) % 60)
+
+    assert cache_key(query) != cache_key(later)
+    assert list_etag(query, 1) != list_etag(later, 1)
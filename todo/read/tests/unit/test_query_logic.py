@@ -1,7 +1,10 @@
 from hypothesis import given, strategies as st
-from todo.read.src.app.queries import ListTodosQueryHandler, ListTodosQuery
+from todo.read.src.app.queries import ListTodosQueryHandler, ListTodosQuery, encode_cursor
 import pytest
 from unittest.mock import MagicMock
+from datetime import datetime, timezone
+from uuid import uuid4
+import json
 import math
 
 @given(
@@ -51,3 +54,143 @@ def test_query_validation_errors():
 
     with pytest.raises(ValueError):
         ListTodosQuery(limit=101) # Max 100
+
+def _row(created_at, due_date=None):
+    return {
+        "id": uuid4(), "title": "Task", "description": None, "priority": None,
+        "due_date": due_date, "is_completed": False,
+        "created_at": created_at, "updated_at": created_at
+    }
+
+@given(
+    sort=st.sampled_from(["created_at", "due_date"]),
+    order=st.sampled_from(["asc", "desc"]),
+    moment=st.one_of(st.none(), st.datetimes(timezones=st.just(timezone.utc)))
+)
+def test_cursor_round_trip(sort, order, moment):
+    row = _row(moment or datetime.now(timezone.utc), due_date=moment)
+    token = encode_cursor(sort, order, row)
+
+    query = ListTodosQuery(sort=sort, order=order, cursor=token)
+
+    assert query.after == (row[sort], row["id"])
+
+def test_keyset_mode_fetches_after_cursor_and_returns_next_cursor():
+    mock_repo = MagicMock()
+    now = datetime.now(timezone.utc)
+    rows = [_row(now), _row(now)]
+    mock_repo.list_todos.return_value = {"items": rows, "total_count": 5, "has_more": True}
+    handler = ListTodosQueryHandler(repo=mock_repo)
+
+    first = handler.handle(ListTodosQuery(limit=2, cursor=""))
+
+    assert mock_repo.list_todos.call_args.kwargs["keyset"] is True
+    assert mock_repo.list_todos.call_args.kwargs["after"] is None
+    assert first.next_cursor is not None
+
+    handler.handle(ListTodosQuery(limit=2, cursor=first.next_cursor))
+    assert mock_repo.list_todos.call_args.kwargs["after"] == (now, rows[-1]["id"])
+
+def test_offset_mode_has_no_next_cursor():
+    mock_repo = MagicMock()
+    mock_repo.list_todos.return_value = {"items": [_row(datetime.now(timezone.utc))], "total_count": 50}
+
+    response = ListTodosQueryHandler(repo=mock_repo).handle(ListTodosQuery())
+
+    assert response.next_cursor is None
+    assert "keyset" not in mock_repo.list_todos.call_args.kwargs
+
+def test_cursor_validation_errors():
+    token = encode_cursor("created_at", "desc", _row(datetime.now(timezone.utc)))
+
+    with pytest.raises(ValueError):
+        ListTodosQuery(cursor="not-a-cursor")
+
+    with pytest.raises(ValueError):
+        ListTodosQuery(cursor=token, sort="due_date") # Cursor from another sort
+
+    with pytest.raises(ValueError):
+        ListTodosQuery(cursor="", sort="title")
+
+def test_count_mode_is_forwarded_and_none_skips_totals():
+    mock_repo = MagicMock()
+    mock_repo.list_todos.return_value = {"items": [], "total_count": None}
+
+    response = ListTodosQueryHandler(repo=mock_repo).handle(ListTodosQuery(count="none"))
+
+    assert mock_repo.list_todos.call_args.kwargs["count"] == "none"
+    assert response.metadata.total_count is None
+    assert response.metadata.total_pages is None
+
+    with pytest.raises(ValueError):
+        ListTodosQuery(count="approximate")
+
+@given(
+    rows=st.lists(
+        st.fixed_dictionaries({
+            "id": st.uuids(),
+            "title": st.text(min_size=1, max_size=50),
+            "description": st.one_of(st.none(), st.text(max_size=50)),
+            "priority": st.sampled_from(["Low", "Medium", "High", None]),
+            "due_date": st.one_of(st.none(), st.datetimes(timezones=st.just(timezone.utc))),
+            "is_completed": st.booleans(),
+            "created_at": st.datetimes(timezones=st.just(timezone.utc)),
+            "updated_at": st.datetimes(timezones=st.just(timezone.utc))
+        }),
+        max_size=10
+    ),
+    total_count=st.one_of(st.none(), st.integers(min_value=0, max_value=1000)),
+    has_more=st.booleans()
+)
+def test_fast_serialization_matches_model_output(rows, total_count, has_more):
+    mock_repo = MagicMock()
+    mock_repo.list_todos.return_value = {"items": rows, "total_count": total_count, "has_more": has_more}
+    handler = ListTodosQueryHandler(repo=mock_repo)
+    query = ListTodosQuery(limit=10, cursor="")
+
+    assert handler.handle_json(query) == json.dumps(handler.handle(query).model_dump())
+
+def test_search_defaults_to_relevance_and_is_forwarded():
+    repo = MagicMock()
+    repo.list_todos.return_value = {"items": [], "total_count": 0}
+    handler = ListTodosQueryHandler(repo)
+
+    handler.handle(ListTodosQuery(q="  milk "))
+    assert repo.list_todos.call_args.kwargs["search"] == "milk"
+    assert repo.list_todos.call_args.kwargs["sort_by"] == "relevance"
+
+    handler.handle(ListTodosQuery(q="milk", sort="due_date"))
+    assert repo.list_todos.call_args.kwargs["sort_by"] == "due_date"
+
+    handler.handle(ListTodosQuery(q="   "))
+    assert "search" not in repo.list_todos.call_args.kwargs
+    assert repo.list_todos.call_args.kwargs["sort_by"] == "created_at"
+
+def test_relevance_cannot_be_keyset_paginated():
+    with pytest.raises(ValueError):
+        ListTodosQuery(q="milk", sort="relevance", cursor="")
+    assert ListTodosQuery(q="milk", cursor="").sort == "created_at"
+
+def test_filters_are_forwarded_only_when_set():
+    repo = MagicMock()
+    repo.list_todos.return_value = {"items": [], "total_count": 0}
+    handler = ListTodosQueryHandler(repo)
+
+    handler.handle(ListTodosQuery())
+    assert not {"priority", "due_before", "due_after", "overdue", "now"} & set(repo.list_todos.call_args.kwargs)
+
+    query = ListTodosQuery(priority="Low", due_after="2026-01-01T00:00:00Z", overdue="true", sort="priority")
+    handler.handle(query)
+    kwargs = repo.list_todos.call_args.kwargs
+    assert kwargs["priority"] == "Low"
+    assert kwargs["due_after"] == datetime(2026, 1, 1, tzinfo=timezone.utc)
+    assert kwargs["overdue"] is True
+    assert kwargs["now"] == query.as_of
+    assert query.as_of.second == 0 and query.as_of.microsecond == 0
+    assert kwargs["sort_by"] == "priority"
+
+def test_filter_validation_errors():
+    with pytest.raises(ValueError):
+        ListTodosQuery(priority="Urgent")
+    with pytest.raises(ValueError):
+        ListTodosQuery(due_before="2026-01-01T00:00:00")  # timezone required
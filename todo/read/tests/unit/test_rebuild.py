@@ -0,0 +1,160 @@
+import pytest
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from uuid import uuid4
+from unittest.mock import MagicMock
+from todo.read.src.app.projections import read_model_row
+from todo.read.src.infra import rebuild as rebuild_module
+from todo.read.src.infra.rebuild import ProjectionRebuild, RebuildError, shadow_index_sql
+
+def _event(outbox_id, event_type="TodoCreated"):
+    return {
+        "id": outbox_id,
+        "event_type": event_type,
+        "payload": {"id": str(uuid4()), "title": f"Todo {outbox_id}", "created_at": datetime.now(timezone.utc).isoformat()}
+    }
+
+class FakeConnection:
+    """
+    Records statements; `results` maps a SQL constant to what its fetch returns.
+    """
+    def __init__(self, results=None, events=()):
+        self.results = results or {}
+        self.events = list(events)
+        self.statements = []
+        self.copied = []
+        self.transactions = 0
+
+    @contextmanager
+    def transaction(self):
+        self.transactions += 1
+        yield
+
+    def execute(self, sql, params=None):
+        self.statements.append(sql)
+        result = MagicMock()
+        result.fetchone.return_value = self.results.get(sql)
+        result.fetchall.return_value = self.results.get(sql, [])
+        return result
+
+    @contextmanager
+    def cursor(self, name=None):
+        conn = self
+        cur = MagicMock()
+
+        def execute(sql, params):
+            after_id, up_to_id = params
+            cur.pending = [e for e in conn.events if after_id < e["id"] <= up_to_id]
+
+        def fetchmany(size):
+            batch, cur.pending = cur.pending[:size], cur.pending[size:]
+            return batch
+
+        @contextmanager
+        def copy(sql):
+            conn.statements.append(sql)
+            yield MagicMock(write_row=conn.copied.append)
+
+        cur.execute = execute
+        cur.fetchmany = fetchmany
+        cur.copy = copy
+        yield cur
+
+def _rebuild(checkpoint, first_id, events, live_indexes=(), issued_id=None):
+    last_id = events[-1]["id"] if events else 0
+    bounds = {"first_id": first_id, "last_id": last_id, "issued_id": last_id if issued_id is None else issued_id}
+    source = FakeConnection(
+        results={rebuild_module.SELECT_OUTBOX_BOUNDS_SQL: bounds},
+        events=events
+    )
+    target = FakeConnection(results={
+        rebuild_module.SELECT_CHECKPOINT_SQL: {"checkpoint": checkpoint},
+        rebuild_module.SELECT_LIVE_INDEXES_SQL: list(live_indexes),
+    })
+    return ProjectionRebuild(source, target, read_model_row, batch_size=2, catch_up_overlap=1), target
+
+def test_shadow_index_definition_targets_shadow_table():
+    name, sql = shadow_index_sql(
+        "idx_read_todos_due_date_id",
+        "CREATE INDEX idx_read_todos_due_date_id ON santiago_munoz_read.todos USING btree (due_date, id)"
+    )
+
+    assert name == "idx_read_todos_due_date_id_rebuild"
+    assert sql == "CREATE INDEX idx_read_todos_due_date_id_rebuild ON santiago_munoz_read.todos_rebuild USING btree (due_date, id)"
+    with pytest.raises(RebuildError):
+        shadow_index_sql("other", "CREATE INDEX other ON public.elsewhere USING btree (x)")
+
+def test_streaming_resumes_after_checkpoint_and_commits_each_batch():
+    events = [_event(i) for i in range(1, 6)]
+    events[3]["event_type"] = "SomethingElse"
+    rebuild, target = _rebuild(checkpoint=1, first_id=1, events=events)
+
+    read = rebuild.stream(1, 5)
+
+    assert read == 4
+    assert [row[0] for row in target.copied] == [2, 3, 5]
+    assert target.copied[0][1:3] == (read_model_row("TodoCreated", events[1]["payload"])["todo_id"], "Todo 2")
+    assert rebuild.stats["batches"] == 2
+    assert target.transactions == 2
+
+def test_refuses_when_retention_purged_history():
+    rebuild, _ = _rebuild(checkpoint=0, first_id=40, events=[_event(40)])
+
+    with pytest.raises(RebuildError):
+        rebuild.run()
+
+def test_swap_adjusts_shadow_counts_by_the_catch_up_delta():
+    rebuild, target = _rebuild(checkpoint=10, first_id=1, events=[_event(11)])
+    rebuild.shadow_counts = {False: 7, True: 3}
+    counts = iter([
+        [{"is_completed": False, "total": 1}],
+        [{"is_completed": True, "total": 1}, {"is_completed": False, "total": 1}],
+    ])
+    params = []
+    execute = target.execute
+
+    def counting_execute(sql, args=None):
+        result = execute(sql, args)
+        if sql == rebuild_module.COUNT_CAUGHT_UP_SQL:
+            result.fetchall.return_value = next(counts)
+        if sql == rebuild_module.SET_COUNTS_SQL:
+            params.append(args)
+        return result
+
+    target.execute = counting_execute
+
+    rebuild.swap(10)
+
+    # One row was completed and one created by the events caught up
+    assert params == [{"pending": 7, "completed": 4}]
+
+def test_refuses_when_retention_emptied_the_outbox():
+    rebuild, target = _rebuild(checkpoint=0, first_id=None, events=[], issued_id=120)
+
+    with pytest.raises(RebuildError):
+        rebuild.run()
+    assert not any("DROP TABLE santiago_munoz_read.todos" == s.strip() for s in target.statements)
+
+def test_run_swaps_under_lock_and_restores_index_names():
+    primary = {"name": "todos_pkey", "definition": "CREATE UNIQUE INDEX todos_pkey ON santiago_munoz_read.todos USING btree (id)", "is_primary": True}
+    rebuild, target = _rebuild(checkpoint=0, first_id=1, events=[_event(1), _event(2), _event(3)], live_indexes=[primary])
+
+    result = rebuild.run()
+
+    statements = [s.strip() for s in target.statements]
+    lock = statements.index("LOCK TABLE santiago_munoz_read.todos IN ACCESS EXCLUSIVE MODE")
+    drop = statements.index("DROP TABLE santiago_munoz_read.todos")
+    assert statements.index("CREATE UNIQUE INDEX todos_pkey_rebuild ON santiago_munoz_read.todos_rebuild USING btree (id)") < lock < drop
+    assert "ALTER TABLE santiago_munoz_read.todos_rebuild ADD CONSTRAINT todos_pkey_rebuild PRIMARY KEY USING INDEX todos_pkey_rebuild" in statements
+    assert statements[drop + 1:drop + 3] == [
+        "ALTER TABLE santiago_munoz_read.todos_rebuild RENAME TO todos",
+        "ALTER INDEX santiago_munoz_read.todos_pkey_rebuild RENAME TO todos_pkey",
+    ]
+    assert rebuild_module.SET_COUNTS_SQL.strip() in statements[drop:]
+    # Full counts are taken before the lock; under it only the caught-up rows
+    assert statements.index(rebuild_module.COUNT_SHADOW_SQL) < lock
+    assert statements.count(rebuild_module.COUNT_SHADOW_SQL) == 1
+    assert rebuild_module.BUMP_VERSION_SQL in statements[drop:]
+    # The final pass re-read the overlap (id 3) before the swap
+    assert [row[0] for row in target.copied] == [1, 2, 3, 3]
+    assert result["last_outbox_id"] == 3
@@ -0,0 +1,16 @@
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+from todo.read.src.entrypoints import maintenance
+
+def test_processed_events_are_deleted_in_batches_until_short(mocker):
+    cursor = MagicMock()
+    mocker.patch("todo.read.src.infra.retention.get_db_transaction", return_value=MagicMock(__enter__=lambda s: cursor))
+    type(cursor).rowcount = property(MagicMock(side_effect=[1000, 1000, 3]))
+
+    result = maintenance.run_maintenance(datetime(2026, 10, 18, tzinfo=timezone.utc))
+
+    assert result == {"processed_events_deleted": 2003}
+    sql, params = cursor.execute.call_args[0]
+    assert "FOR UPDATE SKIP LOCKED" in sql
+    assert params["cutoff"] == datetime(2026, 9, 18, tzinfo=timezone.utc)
+    assert params["limit"] == 1000
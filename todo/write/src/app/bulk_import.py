@@ -0,0 +1,121 @@
+import csv
+import json
+import time
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+from uuid import UUID, uuid4, uuid5
+from .create_todo_command import todo_from_payload
+from ..domain.model import Todo
+from ..domain.events import TodoCreated
+
+DEFAULT_CHUNK_SIZE = 5000
+
+# Input records are (line number, payload) pairs. A line that cannot be
+# parsed carries a ValueError in place of its payload, so it is rejected
+# like any other invalid row instead of stopping the stream.
+Record = Tuple[int, Any]
+
+def ndjson_records(stream: Iterable[str]) -> Iterator[Record]:
+    """
+    One JSON object per line; blank lines are skipped.
+    """
+    for line_no, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield line_no, json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_no, ValueError(f"Invalid JSON: {e.msg}")
+
+def csv_records(stream: Iterable[str]) -> Iterator[Record]:
+    """
+    CSV with a header row naming the payload fields (title, description,
+    priority, due_date). Empty cells are treated as missing values.
+    """
+    reader = csv.DictReader(stream)
+    for row in reader:
+        if None in row:
+            yield reader.line_num, ValueError("Row has more fields than the header")
+            continue
+        yield reader.line_num, {k: v if v != "" else None for k, v in row.items()}
+
+def _chunks(items: Iterator[Any], size: int) -> Iterator[List[Any]]:
+    while True:
+        chunk = list(islice(items, size))
+        if not chunk:
+            return
+        yield chunk
+
+class BulkImport:
+    """
+    Reads records `chunk_size` input rows at a time, runs them through the
+    same validation as POST /todos and hands the valid ones to `writer` (a
+    BulkTodoWriter), so at most one chunk of rows and their rejects is held
+    in memory however large the input is. Invalid rows are written to
+    `rejects` as NDJSON lines of {"line", "error", "record"}.
+
+    Chunk ids derive from `import_id`, so running the same input again with
+    the same id resumes after the last committed chunk. Every chunk is
+    claimed, even one with no valid rows, and its rejects are written once
+    the claim commits and dropped when it was claimed already, so a resumed
+    run can append to the rejects of the interrupted one without repeating
+    them.
+    """
+    def __init__(
+        self,
+        writer,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        rejects: Optional[TextIO] = None,
+        import_id: Optional[UUID] = None
+    ):
+        self.writer = writer
+        self.chunk_size = chunk_size
+        self.rejects = rejects
+        self.import_id = import_id or uuid4()
+        self.stats = {"read": 0, "imported": 0, "skipped": 0, "rejected": 0}
+        self._pending_rejects: List[str] = []
+
+    def _reject(self, line_no: int, payload: Any, error: str) -> None:
+        self.stats["rejected"] += 1
+        if self.rejects is not None:
+            record = payload if isinstance(payload, dict) else None
+            self._pending_rejects.append(json.dumps({"line": line_no, "error": error, "record": record}) + "\n")
+
+    def _settle_rejects(self, write: bool) -> None:
+        if write and self._pending_rejects:
+            self.rejects.writelines(self._pending_rejects)
+        self._pending_rejects = []
+
+    def _valid(self, records: Iterable[Record]) -> Iterator[Tuple[Todo, TodoCreated]]:
+        for line_no, payload in records:
+            self.stats["read"] += 1
+            try:
+                if isinstance(payload, ValueError):
+                    raise payload
+                if not isinstance(payload, dict):
+                    raise ValueError("Each todo must be a JSON object")
+                todo = todo_from_payload(payload)
+            except (ValueError, TypeError, AttributeError) as e:
+                # Non-string fields fail inside the domain rules with TypeError/AttributeError
+                self._reject(line_no, payload, str(e))
+                continue
+            yield todo, TodoCreated.from_todo(todo)
+
+    def run(self, records: Iterable[Record]) -> Dict[str, Any]:
+        start = time.perf_counter()
+        for index, chunk in enumerate(_chunks(iter(records), self.chunk_size)):
+            items = list(self._valid(chunk))
+            written = self.writer.write_chunk(items, uuid5(self.import_id, str(index)))
+            if written:
+                self.stats["imported"] += len(items)
+            else:
+                self.stats["skipped"] += len(items)
+            self._settle_rejects(written)
+
+        elapsed = time.perf_counter() - start
+        return {
+            "import_id": str(self.import_id),
+            **self.stats,
+            "seconds": round(elapsed, 3),
+            "rows_per_second": round(self.stats["read"] / elapsed, 1) if elapsed else 0.0
+        }
@@ -12,10 +12,12 @@ class CommandResult(BaseModel):
     status_code: int
     body: Optional[Any] = None
     error: Optional[str] = None
+    # `body` already serialized, when the handler has it at hand
+    body_json: Optional[str] = None
 
     @classmethod
-    def success(cls, body: Any = None, status_code: int = 200) -> 'CommandResult':
-        return cls(status_code=status_code, body=body)
+    def success(cls, body: Any = None, status_code: int = 200, body_json: Optional[str] = None) -> 'CommandResult':
+        return cls(status_code=status_code, body=body, body_json=body_json)
 
     @classmethod
     def failure(cls, error: str, status_code: int = 400) -> 'CommandResult':
@@ -1,70 +1,94 @@
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from datetime import datetime
 from .commands import CommandEnvelope, CommandResult
 from ..domain.model import Todo, Priority
 from ..domain.events import TodoCreated
 from ..infra.repo import AlreadyProcessedError
+from ..infra.instrumentation import stage
+
+def todo_from_payload(payload: Dict[str, Any]) -> Todo:
+    """
+    Builds a Todo from a raw request payload, applying the API-level parsing
+    (priority enum, ISO-8601 due date) before the domain rules.
+    Raises ValueError with a client-facing message on invalid input.
+    """
+    # Map string priority to Enum if provided
+    priority = None
+    if payload.get("priority"):
+        try:
+            priority = Priority(payload["priority"])
+        except ValueError:
+            raise ValueError(f"Invalid priority: {payload['priority']}. Must be one of Low, Medium, High")
+
+    # Handle due_date string to datetime
+    due_date = payload.get("due_date")
+    if isinstance(due_date, str):
+        try:
+            due_date = datetime.fromisoformat(due_date.replace('Z', '+00:00'))
+        except ValueError:
+            raise ValueError("due_date must be a valid ISO-8601 string")
+
+    return Todo.create(
+        title=payload.get("title"),
+        description=payload.get("description"),
+        priority=priority,
+        due_date=due_date
+    )
+
+def todo_response_body(todo: Todo) -> Dict[str, Any]:
+    return todo.to_dict()
 
 class CreateTodoCommandHandler:
+    """
+    Works with either repository flavour: `handle` with TodoRepository,
+    `handle_async` with AsyncTodoRepository.
+    """
     def __init__(self, repo):
         self.repo = repo
 
+    def _prepare(self, payload: Dict[str, Any]) -> Tuple[Todo, TodoCreated]:
+        """
+        Validates the payload and builds the todo and its event. Raises
+        ValueError on invalid input.
+        """
+        with stage("domain"):
+            todo = todo_from_payload(payload)
+            return todo, TodoCreated.from_todo(todo)
+
+    def _created(self, todo: Todo) -> CommandResult:
+        return CommandResult.success(body=todo_response_body(todo), status_code=201, body_json=todo.to_json())
+
+    def _failed(self, e: Exception) -> CommandResult:
+        if isinstance(e, ValueError):
+            return CommandResult.failure(error=str(e), status_code=400)
+        # In a real app, we'd log this exception
+        return CommandResult.failure(error=f"Unexpected error: {str(e)}", status_code=500)
+
     def handle(self, envelope: CommandEnvelope[Dict[str, Any]]) -> CommandResult:
         try:
-            payload = envelope.payload
-            
-            # Map string priority to Enum if provided
-            priority = None
-            if payload.get("priority"):
-                try:
-                    priority = Priority(payload["priority"])
-                except ValueError:
-                    return CommandResult.failure(
-                        error=f"Invalid priority: {payload['priority']}. Must be one of Low, Medium, High", 
-                        status_code=400
-                    )
-            
-            # Handle due_date string to datetime
-            due_date = payload.get("due_date")
-            if isinstance(due_date, str):
-                try:
-                    due_date = datetime.fromisoformat(due_date.replace('Z', '+00:00'))
-                except ValueError:
-                    return CommandResult.failure(
-                        error="due_date must be a valid ISO-8601 string", 
-                        status_code=400
-                    )
+            todo, event = self._prepare(envelope.payload)
 
-            todo = Todo.create(
-                title=payload.get("title"),
-                description=payload.get("description"),
-                priority=priority,
-                due_date=due_date
-            )
-            
-            event = TodoCreated.from_todo(todo)
-            
             # The repo will handle the transaction (idempotency, todo, outbox)
             try:
-                self.repo.save(todo, event, envelope.command_id)
+                with stage("persist"):
+                    self.repo.save(todo, event, envelope.command_id)
             except AlreadyProcessedError as e:
                 return CommandResult.success(body=e.body, status_code=e.status_code)
-            
-            return CommandResult.success(
-                body={
-                    "id": str(todo.id),
-                    "title": todo.title,
-                    "description": todo.description,
-                    "priority": todo.priority.value if todo.priority else None,
-                    "due_date": todo.due_date.isoformat().replace('+00:00', 'Z') if todo.due_date else None,
-                    "is_completed": todo.is_completed,
-                    "created_at": todo.created_at.isoformat().replace('+00:00', 'Z'),
-                    "updated_at": todo.updated_at.isoformat().replace('+00:00', 'Z')
-                },
-                status_code=201
-            )
-        except ValueError as e:
-            return CommandResult.failure(error=str(e), status_code=400)
+
+            return self._created(todo)
+        except Exception as e:
+            return self._failed(e)
+
+    async def handle_async(self, envelope: CommandEnvelope[Dict[str, Any]]) -> CommandResult:
+        try:
+            todo, event = self._prepare(envelope.payload)
+
+            try:
+                with stage("persist"):
+                    await self.repo.save(todo, event, envelope.command_id)
+            except AlreadyProcessedError as e:
+                return CommandResult.success(body=e.body, status_code=e.status_code)
+
+            return self._created(todo)
         except Exception as e:
-            # In a real app, we'd log this exception
-            return CommandResult.failure(error=f"Unexpected error: {str(e)}", status_code=500)
+            return self._failed(e)
@@ -0,0 +1,93 @@
+from typing import List, Dict, Any, Optional, Tuple
+from .commands import CommandEnvelope, CommandResult
+from .create_todo_command import todo_from_payload, todo_response_body
+from ..domain.model import Todo
+from ..domain.events import TodoCreated
+from ..infra.repo import AlreadyProcessedError
+from ..infra.instrumentation import stage
+
+MAX_BATCH_SIZE = 500
+
+class CreateTodosBatchCommandHandler:
+    """
+    Creates many todos under a single command id. Every item is validated
+    with the same rules as a single create; valid items are persisted in one
+    transaction and invalid ones are reported back by their index.
+    """
+    def __init__(self, repo):
+        self.repo = repo
+
+    def _prepare(self, payloads: Any) -> Tuple[Optional[CommandResult], List[Tuple[Todo, TodoCreated]], int, Dict[str, Any]]:
+        """
+        Validates the batch. Returns (early result, valid items, status code,
+        body); the early result is set when there is nothing to persist.
+        """
+        if not isinstance(payloads, list) or not payloads:
+            return CommandResult.failure(error="Batch payload must be a non-empty array of todos", status_code=400), [], 400, {}
+        if len(payloads) > MAX_BATCH_SIZE:
+            return CommandResult.failure(error=f"Batch cannot contain more than {MAX_BATCH_SIZE} todos", status_code=400), [], 400, {}
+
+        items = []
+        valid = []
+        for index, payload in enumerate(payloads):
+            try:
+                if not isinstance(payload, dict):
+                    raise ValueError("Each todo must be a JSON object")
+                todo = todo_from_payload(payload)
+            except ValueError as e:
+                items.append({"index": index, "status_code": 400, "error": str(e)})
+                continue
+            valid.append((todo, TodoCreated.from_todo(todo)))
+            items.append({"index": index, "status_code": 201, "todo": todo_response_body(todo)})
+
+        body = {
+            "created": len(valid),
+            "failed": len(payloads) - len(valid),
+            "items": items
+        }
+        if not valid:
+            # Nothing to persist: report per-item errors without claiming the command id
+            body["error"] = "No valid todos in batch"
+            return CommandResult(status_code=400, body=body, error=body["error"]), [], 400, body
+
+        # 201 when everything was created, 207 Multi-Status on partial success
+        status_code = 201 if len(valid) == len(payloads) else 207
+        return None, valid, status_code, body
+
+    def handle(self, envelope: CommandEnvelope[List[Dict[str, Any]]]) -> CommandResult:
+        try:
+            with stage("domain"):
+                rejected, valid, status_code, body = self._prepare(envelope.payload)
+            if rejected is not None:
+                return rejected
+
+            try:
+                with stage("persist"):
+                    self.repo.save_batch(valid, envelope.command_id, status_code, body)
+            except AlreadyProcessedError as e:
+                return CommandResult.success(body=e.body, status_code=e.status_code)
+
+            return CommandResult.success(body=body, status_code=status_code)
+        except Exception as e:
+            # In a real app, we'd log this exception
+            return CommandResult.failure(error=f"Unexpected error: {str(e)}", status_code=500)
+
+    async def handle_async(self, envelope: CommandEnvelope[List[Dict[str, Any]]]) -> CommandResult:
+        """
+        `handle` for an AsyncTodoRepository.
+        """
+        try:
+            with stage("domain"):
+                rejected, valid, status_code, body = self._prepare(envelope.payload)
+            if rejected is not None:
+                return rejected
+
+            try:
+                with stage("persist"):
+                    await self.repo.save_batch(valid, envelope.command_id, status_code, body)
+            except AlreadyProcessedError as e:
+                return CommandResult.success(body=e.body, status_code=e.status_code)
+
+            return CommandResult.success(body=body, status_code=status_code)
+        except Exception as e:
+            return CommandResult.failure(error=f"Unexpected error: {str(e)}", status_code=500)
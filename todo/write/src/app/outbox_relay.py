@@ -0,0 +1,98 @@
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any
+from ..infra.outbox import OutboxPublisher, EventSink, ListenerLost
+
+class OutboxRelay:
+    """
+    Drains the outbox into a sink, batch by batch.
+
+    Any number of relays can run side by side: each batch is claimed with
+    FOR UPDATE SKIP LOCKED, so they never publish the same row twice. Events
+    are published in id order within a relay; across relays batches may
+    interleave, which consumers tolerate because projections are idempotent.
+    """
+    def __init__(self, publisher: OutboxPublisher, sink: EventSink, batch_size: int = 100):
+        self.publisher = publisher
+        self.sink = sink
+        self.batch_size = batch_size
+        self.stats: Dict[str, Any] = {
+            "relayed": 0,
+            "batches": 0,
+            "events_per_second": 0.0,
+            "lag_seconds": 0.0,
+            "listen_reconnects": 0
+        }
+
+    def relay_once(self) -> int:
+        """
+        Relays a single batch and updates the throughput and lag metrics.
+        Lag is the age of the oldest event in the batch when it was published.
+        """
+        started = time.perf_counter()
+        events = self.publisher.relay_batch(self.sink, limit=self.batch_size)
+        if not events:
+            return 0
+
+        elapsed = time.perf_counter() - started
+        oldest = min(row["created_at"] for row in events)
+        self.stats["relayed"] += len(events)
+        self.stats["batches"] += 1
+        self.stats["events_per_second"] = len(events) / elapsed if elapsed > 0 else 0.0
+        self.stats["lag_seconds"] = (datetime.now(timezone.utc) - oldest).total_seconds()
+        return len(events)
+
+    def drain(self, max_batches: Optional[int] = None) -> int:
+        """
+        Relays batches until the outbox has no more pending rows for this
+        relay (a short batch) or `max_batches` is reached.
+        """
+        relayed = 0
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            count = self.relay_once()
+            relayed += count
+            batches += 1
+            if count < self.batch_size:
+                break
+        return relayed
+
+    def run(self, poll_interval: float = 1.0, stop: Optional[threading.Event] = None) -> None:
+        """
+        Polls forever (or until `stop` is set), draining whenever rows appear.
+        """
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            if self.drain() == 0:
+                stop.wait(poll_interval)
+
+    def run_listening(self, fallback_interval: float = 30.0, stop: Optional[threading.Event] = None,
+                      reconnect_delay: float = 1.0) -> None:
+        """
+        Low-latency mode: sleeps on the outbox LISTEN channel and drains as
+        soon as a write commits. Polling every `fallback_interval` seconds
+        only guards against missed notifications (e.g. rows written while
+        the listener was reconnecting), so an idle relay issues no queries.
+        A dropped listen connection is reopened after `reconnect_delay`
+        seconds, draining once to pick up anything missed meanwhile.
+        """
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            try:
+                self._listen(fallback_interval, stop)
+            except ListenerLost:
+                self.stats["listen_reconnects"] += 1
+                stop.wait(reconnect_delay)
+
+    def _listen(self, fallback_interval: float, stop: threading.Event) -> None:
+        with self.publisher.listen() as wait:
+            # Catch up on anything committed before LISTEN took effect
+            self.drain()
+            last_drain = time.monotonic()
+            while not stop.is_set():
+                # Short waits keep shutdown responsive without adding queries
+                notified = wait(min(1.0, fallback_interval))
+                if notified or time.monotonic() - last_drain >= fallback_interval:
+                    self.drain()
+                    last_drain = time.monotonic()
@@ -1,10 +1,14 @@
-from dataclasses import dataclass
+import json
+from dataclasses import dataclass, field
 from uuid import UUID
 from datetime import datetime
-from .model import Priority
+from .model import Priority, Todo, iso
 from typing import Optional
 
-@dataclass(frozen=True)
+# Keys of the TodoCreated outbox payload, a subset of Todo.to_dict()
+_PAYLOAD_KEYS = ("id", "title", "description", "priority", "due_date", "created_at")
+
+@dataclass(frozen=True, slots=True)
 class TodoCreated:
     id: UUID
     title: str
@@ -12,14 +16,34 @@ class TodoCreated:
     priority: Optional[Priority]
     due_date: Optional[datetime]
     created_at: datetime
+    # The todo the event was raised for, and the cached payload
+    _todo: Optional[Todo] = field(default=None, init=False, repr=False, compare=False)
+    _payload: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     @classmethod
-    def from_todo(cls, todo) -> 'TodoCreated':
-        return cls(
-            id=todo.id,
-            title=todo.title,
-            description=todo.description,
-            priority=todo.priority,
-            due_date=todo.due_date,
-            created_at=todo.created_at
-        )
+    def from_todo(cls, todo: Todo) -> 'TodoCreated':
+        event = cls(todo.id, todo.title, todo.description, todo.priority, todo.due_date, todo.created_at)
+        object.__setattr__(event, "_todo", todo)
+        return event
+
+    def payload_json(self) -> str:
+        """
+        Outbox payload, serialized once. Events raised from a Todo reuse its
+        to_dict() values instead of formatting them again.
+        """
+        payload = self._payload
+        if payload is None:
+            if self._todo is not None:
+                source = self._todo.to_dict()
+            else:
+                source = {
+                    "id": str(self.id),
+                    "title": self.title,
+                    "description": self.description,
+                    "priority": self.priority.value if self.priority else None,
+                    "due_date": iso(self.due_date) if self.due_date else None,
+                    "created_at": iso(self.created_at)
+                }
+            payload = json.dumps({key: source[key] for key in _PAYLOAD_KEYS})
+            object.__setattr__(self, "_payload", payload)
+        return payload
@@ -1,15 +1,29 @@
+import json
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from uuid import UUID, uuid4
 from enum import Enum
-from typing import Optional
+from typing import Any, Dict, Optional
 
 class Priority(str, Enum):
     LOW = "Low"
     MEDIUM = "Medium"
     HIGH = "High"
 
-@dataclass(frozen=True)
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+def iso(value: datetime) -> str:
+    """
+    ISO-8601 rendering used on the wire, with UTC written as 'Z'.
+    """
+    return value.isoformat().replace('+00:00', 'Z')
+
+# Slotted: a command creates one Todo and one event, and neither needs a
+# per-instance __dict__. The serialized forms are cached in their own slots
+# (set once, bypassing the frozen __setattr__) so the outbox payload, the
+# stored command result and the response body all reuse one rendering.
+@dataclass(frozen=True, slots=True)
 class Todo:
     id: UUID
     title: str
@@ -17,12 +31,14 @@ class Todo:
     priority: Optional[Priority] = None
     due_date: Optional[datetime] = None
     is_completed: bool = False
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = field(default_factory=_utcnow)
+    updated_at: datetime = field(default_factory=_utcnow)
+    _dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    _json: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     @classmethod
-    def create(cls, title: str, description: Optional[str] = None, 
-               priority: Optional[Priority] = None, 
+    def create(cls, title: str, description: Optional[str] = None,
+               priority: Optional[Priority] = None,
                due_date: Optional[datetime] = None) -> 'Todo':
         if not title or not title.strip():
             raise ValueError("Title is required")
@@ -30,7 +46,7 @@ class Todo:
             raise ValueError("Title must be 500 characters or less")
         if description and len(description) > 500:
              raise ValueError("Description must be 500 characters or less")
-        
+
         now = datetime.now(timezone.utc)
         return cls(
             id=uuid4(),
@@ -42,3 +58,36 @@ class Todo:
             created_at=now,
             updated_at=now
         )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        JSON-ready representation: the API response body and the stored
+        command result. Built on first use and shared; do not mutate it.
+        """
+        data = self._dict
+        if data is None:
+            created_at = iso(self.created_at)
+            # create() stamps both times with the same object
+            updated_at = created_at if self.updated_at is self.created_at else iso(self.updated_at)
+            data = {
+                "id": str(self.id),
+                "title": self.title,
+                "description": self.description,
+                "priority": self.priority.value if self.priority else None,
+                "due_date": iso(self.due_date) if self.due_date else None,
+                "is_completed": self.is_completed,
+                "created_at": created_at,
+                "updated_at": updated_at
+            }
+            object.__setattr__(self, "_dict", data)
+        return data
+
+    def to_json(self) -> str:
+        """
+        `to_dict()` serialized, also built once.
+        """
+        text = self._json
+        if text is None:
+            text = json.dumps(self.to_dict())
+            object.__setattr__(self, "_json", text)
+        return text
@@ -0,0 +1,92 @@
+import argparse
+from typing import Awaitable, Callable, Dict, List, Tuple
+from aws_lambda_powertools import Logger
+from . import routes
+from ..infra.db import get_async_pool, close_async_pool
+
+logger = Logger()
+
+# path -> method -> route. Routes run on the async pool, so one worker keeps
+# up to DB_POOL_MAX_SIZE commands in flight while the event loop stays free.
+ROUTES: Dict[str, Dict[str, Callable[[Dict[str, str], str], Awaitable[dict]]]] = {
+    "/todos": {"POST": routes.create_todo_async},
+    "/todos:batch": {"POST": routes.create_todos_batch_async},
+}
+
+def _headers(scope: dict) -> Dict[str, str]:
+    return {k.decode("latin-1"): v.decode("latin-1") for k, v in scope["headers"]}
+
+async def _read_body(receive) -> str:
+    chunks = []
+    while True:
+        message = await receive()
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body"):
+            return b"".join(chunks).decode()
+
+async def _send_response(send, response: dict) -> None:
+    body = response["body"].encode()
+    headers: List[Tuple[bytes, bytes]] = [
+        (k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in response["headers"].items()
+    ]
+    headers.append((b"content-length", str(len(body)).encode()))
+    await send({"type": "http.response.start", "status": response["statusCode"], "headers": headers})
+    await send({"type": "http.response.body", "body": body})
+
+async def _lifespan(receive, send) -> None:
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            # Open the pool before the first request instead of during it
+            try:
+                await get_async_pool()
+            except Exception as e:
+                logger.exception("Failed to open connection pool")
+                await send({"type": "lifespan.startup.failed", "message": str(e)})
+                return
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await close_async_pool()
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+async def app(scope, receive, send) -> None:
+    """
+    ASGI application for the write API: POST /todos and POST /todos:batch.
+    """
+    if scope["type"] == "lifespan":
+        await _lifespan(receive, send)
+        return
+
+    methods = ROUTES.get(scope["path"])
+    if methods is None:
+        await _send_response(send, routes.response(404, {"error": "Not found"}))
+        return
+    route = methods.get(scope["method"])
+    if route is None:
+        await _send_response(send, routes.response(405, {"error": "Method not allowed"}))
+        return
+
+    body = await _read_body(receive)
+    response = await route(_headers(scope), body)
+    await _send_response(send, response)
+
+def main() -> None:
+    """
+    Long-running HTTP server. Each worker process keeps its own pool.
+    """
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Serve the write API over HTTP")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    uvicorn.run(
+        "todo.write.src.entrypoints.asgi:app",
+        host=args.host, port=args.port, workers=args.workers, log_level="warning"
+    )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+import argparse
+import os
+import sys
+from contextlib import ExitStack
+from typing import Dict, Any, Optional
+from uuid import UUID, uuid4
+from aws_lambda_powertools import Logger
+from ..app.bulk_import import BulkImport, csv_records, ndjson_records, DEFAULT_CHUNK_SIZE
+from ..infra.bulk_import import BulkTodoWriter
+
+logger = Logger()
+
+READERS = {"csv": csv_records, "ndjson": ndjson_records}
+
+def _format_of(path: str) -> str:
+    extension = os.path.splitext(path)[1].lower().lstrip(".")
+    if extension == "jsonl":
+        return "ndjson"
+    if extension not in READERS:
+        raise ValueError(f"Cannot tell the format of {path}. Pass --format csv or --format ndjson")
+    return extension
+
+def run_import(
+    path: str,
+    fmt: Optional[str] = None,
+    rejects_path: Optional[str] = None,
+    import_id: Optional[UUID] = None
+) -> Dict[str, Any]:
+    """
+    Imports the CSV or NDJSON file at `path` ("-" for stdin) in chunks of
+    BULK_IMPORT_CHUNK_SIZE input rows (default 5000). Invalid rows go to
+    `rejects_path`, by default next to the input as <path>.rejects.ndjson.
+    Resuming (`import_id` given) appends to the rejects of the earlier run.
+    """
+    fmt = fmt or _format_of(path)
+    if rejects_path is None:
+        rejects_path = "rejects.ndjson" if path == "-" else f"{path}.rejects.ndjson"
+    resuming = import_id is not None
+    import_id = import_id or uuid4()
+    # Reported up front: it is what an interrupted import is resumed with
+    logger.info("Bulk import starting", extra={"import_id": str(import_id), "resuming": resuming, "path": path})
+
+    with ExitStack() as stack:
+        source = sys.stdin if path == "-" else stack.enter_context(open(path, newline="", encoding="utf-8"))
+        rejects = stack.enter_context(open(rejects_path, "a" if resuming else "w", encoding="utf-8"))
+        bulk = BulkImport(
+            BulkTodoWriter(),
+            chunk_size=int(os.environ.get("BULK_IMPORT_CHUNK_SIZE", DEFAULT_CHUNK_SIZE)),
+            rejects=rejects,
+            import_id=import_id
+        )
+        result = bulk.run(READERS[fmt](source))
+    return {**result, "rejects_path": rejects_path}
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bulk-load todos and their outbox events from CSV or NDJSON")
+    parser.add_argument("path", help="Input file, or - for stdin")
+    parser.add_argument("--format", choices=sorted(READERS), help="Defaults to the file extension")
+    parser.add_argument("--rejects", help="Where to write invalid rows (NDJSON)")
+    parser.add_argument(
+        "--import-id", type=UUID,
+        help="Id of an interrupted import to resume; chunks it already committed are skipped"
+    )
+    args = parser.parse_args()
+    result = run_import(args.path, fmt=args.format, rejects_path=args.rejects, import_id=args.import_id)
+    logger.info("Bulk import finished", extra=result)
+
+if __name__ == "__main__":
+    main()
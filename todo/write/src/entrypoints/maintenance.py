@@ -0,0 +1,78 @@
+import argparse
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Any
+from aws_lambda_powertools import Logger
+from todo.common.retention import purge_in_batches
+from ..infra.retention import WriteRetention
+
+logger = Logger()
+
+def _retention_window(name: str, default_days: float) -> timedelta:
+    return timedelta(days=float(os.environ.get(name, default_days)))
+
+def run_maintenance(now: datetime, keep_going: Callable[[], bool] = lambda: True) -> Dict[str, Any]:
+    """
+    One maintenance pass over the write schema:
+
+    - makes sure upcoming outbox partitions exist (OUTBOX_PARTITIONS_AHEAD
+      months, default 2), moving any rows that fell into the default
+      partition into their month;
+    - drops whole outbox months older than OUTBOX_RETENTION_DAYS (default 7)
+      once every event in them was published, then deletes the remaining
+      published events past that window in batches;
+    - deletes idempotency records older than PROCESSED_COMMANDS_RETENTION_DAYS
+      (default 30), which bounds how late a client may safely retry.
+
+    Partition changes wait at most OUTBOX_PARTITION_LOCK_TIMEOUT_MS (default
+    2000) for their locks; a busy month is left for the next run. Batches
+    hold RETENTION_BATCH_SIZE rows (default 1000).
+    """
+    retention = WriteRetention()
+    batch_size = int(os.environ.get("RETENTION_BATCH_SIZE", "1000"))
+    outbox_cutoff = now - _retention_window("OUTBOX_RETENTION_DAYS", 7)
+    commands_cutoff = now - _retention_window("PROCESSED_COMMANDS_RETENTION_DAYS", 30)
+
+    lock_timeout_ms = int(os.environ.get("OUTBOX_PARTITION_LOCK_TIMEOUT_MS", "2000"))
+
+    created = retention.create_outbox_partitions(
+        now, months_ahead=int(os.environ.get("OUTBOX_PARTITIONS_AHEAD", "2")), lock_timeout_ms=lock_timeout_ms
+    )
+    dropped = retention.drop_outbox_partitions(outbox_cutoff, lock_timeout_ms=lock_timeout_ms)
+    outbox_deleted = purge_in_batches(
+        lambda limit: retention.delete_published_outbox(outbox_cutoff, limit), batch_size, keep_going
+    )
+    commands_deleted = purge_in_batches(
+        lambda limit: retention.delete_processed_commands(commands_cutoff, limit), batch_size, keep_going
+    )
+    return {
+        "partitions_created": created,
+        "partitions_dropped": dropped,
+        "outbox_deleted": outbox_deleted,
+        "processed_commands_deleted": commands_deleted
+    }
+
+@logger.inject_lambda_context
+def lambda_handler(event: dict, context) -> dict:
+    """
+    Scheduled AWS Lambda entrypoint. Deleting stops early, leaving the rest
+    for the next run, when the invocation is about to run out of time.
+    """
+    result = run_maintenance(
+        datetime.now(timezone.utc),
+        keep_going=lambda: context.get_remaining_time_in_millis() > 5000
+    )
+    logger.info("Write-side maintenance finished", extra=result)
+    return result
+
+def main() -> None:
+    """
+    Runs a single maintenance pass, e.g. from cron.
+    """
+    parser = argparse.ArgumentParser(description="Apply retention to the write schema")
+    parser.parse_args()
+    result = run_maintenance(datetime.now(timezone.utc))
+    logger.info("Write-side maintenance finished", extra=result)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+import argparse
+import importlib
+import os
+import signal
+import threading
+from typing import List, Dict, Any
+from aws_lambda_powertools import Logger
+from ..app.outbox_relay import OutboxRelay
+from ..infra.outbox import OutboxPublisher, EventSink
+
+logger = Logger()
+
+def projection_sink() -> EventSink:
+    """
+    In-process sink that applies events straight to the read projection.
+    Intended for local runs where both schemas live in the same database.
+    """
+    from todo.read.src.app.projections import TodoProjectionHandler
+    from todo.read.src.infra.repo import TodoReadRepository
+
+    projection = TodoProjectionHandler(TodoReadRepository())
+
+    def publish(messages: List[Dict[str, Any]]) -> None:
+        failed = projection.handle_batch(messages)
+        if failed:
+            raise RuntimeError(f"Failed to project events: {', '.join(failed)}")
+
+    return publish
+
+def load_sink(spec: str) -> EventSink:
+    """
+    Resolves OUTBOX_SINK: either "projection" or a "package.module:factory"
+    path to a callable returning a sink.
+    """
+    if spec == "projection":
+        return projection_sink()
+    module_name, _, factory_name = spec.partition(":")
+    if not factory_name:
+        raise ValueError(f"Invalid OUTBOX_SINK: {spec}. Expected 'projection' or 'module:factory'")
+    return getattr(importlib.import_module(module_name), factory_name)()
+
+def build_relay() -> OutboxRelay:
+    return OutboxRelay(
+        publisher=OutboxPublisher(),
+        sink=load_sink(os.environ.get("OUTBOX_SINK", "projection")),
+        batch_size=int(os.environ.get("OUTBOX_BATCH_SIZE", "100"))
+    )
+
+relay = None
+
+@logger.inject_lambda_context
+def lambda_handler(event: dict, context) -> dict:
+    """
+    Scheduled AWS Lambda entrypoint: drains the outbox until it is empty or
+    the invocation is about to run out of time.
+    """
+    global relay
+    if relay is None:
+        relay = build_relay()
+
+    relayed = 0
+    # Keep a safety margin so an in-flight batch can commit before the timeout
+    while context.get_remaining_time_in_millis() > 5000:
+        count = relay.drain(max_batches=1)
+        relayed += count
+        if count < relay.batch_size:
+            break
+
+    logger.info("Outbox relay run finished", extra={"relayed": relayed, **relay.stats})
+    return {"relayed": relayed}
+
+def main() -> None:
+    """
+    Long-running relay process. Start several to scale out.
+    """
+    parser = argparse.ArgumentParser(description="Relay pending outbox events to a sink")
+    parser.add_argument("--poll-interval", type=float, default=1.0)
+    parser.add_argument("--listen", action="store_true", help="Wake on outbox NOTIFY instead of polling")
+    parser.add_argument(
+        "--listen-fallback-interval", type=float, default=30.0,
+        help="With --listen, seconds between safety-net drains that catch missed notifications"
+    )
+    args = parser.parse_args()
+
+    relay = build_relay()
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+
+    def report() -> None:
+        while not stop.wait(10.0):
+            logger.info("Outbox relay metrics", extra=relay.stats)
+
+    threading.Thread(target=report, daemon=True).start()
+    if args.listen:
+        relay.run_listening(fallback_interval=args.listen_fallback_interval, stop=stop)
+    else:
+        relay.run(poll_interval=args.poll_interval, stop=stop)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+import json
+from typing import Optional, Dict
+from uuid import UUID
+from aws_lambda_powertools import Logger
+from ..app.commands import CommandEnvelope, CommandResult
+from ..app.create_todo_command import CreateTodoCommandHandler
+from ..app.create_todos_batch_command import CreateTodosBatchCommandHandler
+from ..infra.repo import TodoRepository, AsyncTodoRepository
+from ..infra.db import get_pool_stats
+from ..infra import instrumentation
+from ..infra.instrumentation import stage
+
+# Transport-independent request handling shared by the Lambda (api.py) and
+# ASGI (asgi.py) adapters. Routes take headers and the raw body and return a
+# response dict in the API Gateway proxy shape.
+
+logger = Logger(child=True)
+
+# Singleton-like instantiation for warmed-up performance, deferred to the
+# first request so that loading the module does as little as possible.
+# The repository draws from the process-wide pool in infra.db, so warm
+# requests reuse open connections instead of reconnecting per command.
+handler: Optional[CreateTodoCommandHandler] = None
+batch_handler: Optional[CreateTodosBatchCommandHandler] = None
+
+def _init_handlers() -> None:
+    global handler, batch_handler
+    if handler is None:
+        repo = TodoRepository()
+        handler = CreateTodoCommandHandler(repo)
+        batch_handler = CreateTodosBatchCommandHandler(repo)
+
+# The same handlers over the async repository, used by the ASGI server
+async_handler: Optional[CreateTodoCommandHandler] = None
+async_batch_handler: Optional[CreateTodosBatchCommandHandler] = None
+
+def _init_async_handlers() -> None:
+    global async_handler, async_batch_handler
+    if async_handler is None:
+        repo = AsyncTodoRepository()
+        async_handler = CreateTodoCommandHandler(repo)
+        async_batch_handler = CreateTodosBatchCommandHandler(repo)
+
+class _BadRequest(Exception):
+    pass
+
+def _parse_command_id(headers: Dict[str, str]) -> UUID:
+    headers = {k.lower(): v for k, v in headers.items()}
+    command_id_str = headers.get("x-command-id")
+
+    if not command_id_str:
+        raise _BadRequest("Missing X-Command-ID header")
+
+    try:
+        return UUID(command_id_str)
+    except ValueError:
+        raise _BadRequest("Invalid X-Command-ID format. Must be a UUID")
+
+def _envelope(headers: Dict[str, str], body: str) -> CommandEnvelope:
+    with stage("parse"):
+        payload = json.loads(body)
+        command_id = _parse_command_id(headers)
+    with stage("validate"):
+        return CommandEnvelope(command_id=command_id, payload=payload)
+
+def _error_response(e: Exception, action: str) -> dict:
+    if isinstance(e, _BadRequest):
+        return response(400, {"error": str(e)})
+    if isinstance(e, json.JSONDecodeError):
+        return response(400, {"error": "Invalid JSON body"})
+    logger.exception(f"Failed to process {action} request")
+    return response(500, {"error": "Internal server error"})
+
+def _create_response(result: CommandResult) -> dict:
+    with stage("serialize"):
+        if result.body_json is not None:
+            return json_response(result.status_code, result.body_json)
+        return response(
+            result.status_code,
+            result.body if result.status_code < 400 else {"error": result.error}
+        )
+
+def _batch_response(result: CommandResult) -> dict:
+    # Batch results carry per-item errors, so the body is returned even on 400
+    with stage("serialize"):
+        return response(
+            result.status_code,
+            result.body if result.body is not None else {"error": result.error}
+        )
+
+def create_todo(headers: Dict[str, str], body: str) -> dict:
+    """
+    POST /todos
+    """
+    with instrumentation.request("CreateTodo"):
+        try:
+            envelope = _envelope(headers, body)
+            _init_handlers()
+            result = handler.handle(envelope)
+            logger.debug("Connection pool stats", extra={"pool": get_pool_stats()})
+            return _create_response(result)
+        except Exception as e:
+            return _error_response(e, "create todo")
+
+def create_todos_batch(headers: Dict[str, str], body: str) -> dict:
+    """
+    POST /todos:batch
+    Accepts a JSON array of todo payloads under one X-Command-ID.
+    """
+    with instrumentation.request("CreateTodosBatch"):
+        try:
+            envelope = _envelope(headers, body)
+            _init_handlers()
+            return _batch_response(batch_handler.handle(envelope))
+        except Exception as e:
+            return _error_response(e, "batch create todo")
+
+async def create_todo_async(headers: Dict[str, str], body: str) -> dict:
+    """
+    POST /todos on the async repository.
+    """
+    with instrumentation.request("CreateTodo"):
+        try:
+            envelope = _envelope(headers, body)
+            _init_async_handlers()
+            return _create_response(await async_handler.handle_async(envelope))
+        except Exception as e:
+            return _error_response(e, "create todo")
+
+async def create_todos_batch_async(headers: Dict[str, str], body: str) -> dict:
+    """
+    POST /todos:batch on the async repository.
+    """
+    with instrumentation.request("CreateTodosBatch"):
+        try:
+            envelope = _envelope(headers, body)
+            _init_async_handlers()
+            return _batch_response(await async_batch_handler.handle_async(envelope))
+        except Exception as e:
+            return _error_response(e, "batch create todo")
+
+def response(status_code: int, body: dict) -> dict:
+    return json_response(status_code, json.dumps(body))
+
+def json_response(status_code: int, body: str) -> dict:
+    return {
+        "statusCode": status_code,
+        "headers": {
+            "Content-Type": "application/json",
+            "Access-Control-Allow-Origin": "*"
+        },
+        "body": body
+    }
@@ -0,0 +1,67 @@
+import json
+from typing import List, Tuple
+from uuid import UUID
+from ..domain.model import Todo
+from ..domain.events import TodoCreated
+from .db import get_db_transaction, OUTBOX_CHANNEL
+
+# Each chunk claims its own id in processed_commands, in the same transaction
+# that loads it. Re-running an interrupted import under the same import id
+# finds the committed chunks already claimed and skips them.
+CLAIM_CHUNK_SQL = """
+    INSERT INTO santiago_munoz_write.processed_commands (command_id, result_status, result_body)
+    VALUES (%s, 201, %s::jsonb)
+    ON CONFLICT (command_id) DO NOTHING
+    RETURNING command_id
+"""
+
+COPY_TODOS_SQL = """
+    COPY santiago_munoz_write.todos (id, title, description, priority, due_date, is_completed, created_at, updated_at)
+    FROM STDIN
+"""
+
+# Outbox ids come from the sequence in COPY order, so events are relayed in
+# the order the rows were read
+COPY_OUTBOX_SQL = "COPY santiago_munoz_write.outbox (aggregate_id, event_type, payload) FROM STDIN"
+
+NOTIFY_SQL = "SELECT pg_notify(%s, '')"
+
+def _todo_row(todo: Todo) -> tuple:
+    return (
+        todo.id,
+        todo.title,
+        todo.description,
+        todo.priority.value if todo.priority else None,
+        todo.due_date,
+        todo.is_completed,
+        todo.created_at,
+        todo.updated_at
+    )
+
+class BulkTodoWriter:
+    """
+    Loads todos and their TodoCreated events with COPY, one transaction per
+    chunk, bypassing the per-row INSERT path of TodoRepository.
+    """
+    def write_chunk(self, items: List[Tuple[Todo, TodoCreated]], chunk_id: UUID) -> bool:
+        """
+        Returns False without writing anything when `chunk_id` was already
+        loaded by an earlier run. A chunk with no items is only claimed.
+        """
+        with get_db_transaction() as cur:
+            cur.execute(CLAIM_CHUNK_SQL, (chunk_id, json.dumps({"imported": len(items)})))
+            if cur.fetchone() is None:
+                return False
+            if not items:
+                return True
+
+            with cur.copy(COPY_TODOS_SQL) as copy:
+                for todo, _ in items:
+                    copy.write_row(_todo_row(todo))
+            with cur.copy(COPY_OUTBOX_SQL) as copy:
+                for _, event in items:
+                    copy.write_row((event.id, "TodoCreated", event.payload_json()))
+
+            # Wakes listening relays once the chunk commits
+            cur.execute(NOTIFY_SQL, (OUTBOX_CHANNEL,))
+        return True
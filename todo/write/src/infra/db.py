@@ -1,8 +1,23 @@
 import os
-from contextlib import contextmanager
-from typing import Generator
-import psycopg
-from psycopg.rows import dict_row
+import time
+from contextlib import contextmanager, asynccontextmanager
+from typing import TYPE_CHECKING, AsyncGenerator, Generator, Optional, Dict, Any
+from . import instrumentation
+
+# psycopg is imported on first use rather than with this module: the driver
+# accounts for a good share of cold-start import time and requests that fail
+# validation never need it.
+if TYPE_CHECKING:
+    import psycopg
+    from psycopg_pool import ConnectionPool, AsyncConnectionPool
+
+# Process-wide pool, created lazily on first use so that importing the
+# module (and warm Lambda containers) never pay for a connection up front.
+_pool: Optional["ConnectionPool"] = None
+
+# Async counterpart for the ASGI server; it belongs to the event loop that
+# opened it.
+_async_pool: Optional["AsyncConnectionPool"] = None
 
 def get_db_url() -> str:
     url = os.environ.get("DATABASE_URL")
@@ -10,15 +25,157 @@ def get_db_url() -> str:
         raise ValueError("DATABASE_URL environment variable is not set")
     return url
 
+def _env_int(name: str, default: int) -> int:
+    value = os.environ.get(name)
+    return int(value) if value else default
+
+def _env_float(name: str, default: float) -> float:
+    value = os.environ.get(name)
+    return float(value) if value else default
+
+def _pool_settings() -> Dict[str, Any]:
+    return dict(
+        min_size=_env_int("DB_POOL_MIN_SIZE", 1),
+        max_size=_env_int("DB_POOL_MAX_SIZE", 5),
+        timeout=_env_float("DB_POOL_TIMEOUT", 10.0),
+        max_lifetime=_env_float("DB_POOL_MAX_LIFETIME", 1800.0),
+        max_idle=_env_float("DB_POOL_MAX_IDLE", 300.0),
+    )
+
+def get_pool() -> "ConnectionPool":
+    """
+    Returns the process-wide connection pool, opening it on first call.
+
+    Sizing and recycling are configured through the environment:
+    DB_POOL_MIN_SIZE, DB_POOL_MAX_SIZE, DB_POOL_TIMEOUT (seconds to wait
+    for a checkout), DB_POOL_MAX_LIFETIME and DB_POOL_MAX_IDLE (seconds).
+    Connections are health-checked on checkout so a connection dropped
+    by the server while the container was frozen is replaced transparently.
+    """
+    global _pool
+    if _pool is None:
+        from psycopg.rows import dict_row
+        from psycopg_pool import ConnectionPool
+
+        _pool = ConnectionPool(
+            get_db_url(),
+            **_pool_settings(),
+            check=ConnectionPool.check_connection,
+            kwargs={"row_factory": dict_row},
+            name="todo-write",
+            open=True,
+        )
+    return _pool
+
+def close_pool() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.close()
+        _pool = None
+
+async def get_async_pool() -> "AsyncConnectionPool":
+    """
+    Async pool with the same settings as get_pool(), opened on first call.
+    A single async worker can then have up to DB_POOL_MAX_SIZE queries in
+    flight at once.
+    """
+    global _async_pool
+    if _async_pool is None:
+        from psycopg.rows import dict_row
+        from psycopg_pool import AsyncConnectionPool
+
+        _async_pool = AsyncConnectionPool(
+            get_db_url(),
+            **_pool_settings(),
+            check=AsyncConnectionPool.check_connection,
+            kwargs={"row_factory": dict_row},
+            name="todo-write-async",
+            open=False,
+        )
+        await _async_pool.open()
+    return _async_pool
+
+async def close_async_pool() -> None:
+    global _async_pool
+    if _async_pool is not None:
+        await _async_pool.close()
+        _async_pool = None
+
+def get_pool_stats() -> Dict[str, Any]:
+    """
+    Pool counters (connections in use, waiting requests, checkout times...)
+    suitable for logging as metrics. Empty until the pool has been opened.
+    """
+    if _pool is None:
+        return {}
+    return _pool.get_stats()
+
 @contextmanager
-def get_db_connection() -> Generator[psycopg.Connection, None, None]:
-    url = get_db_url()
-    with psycopg.connect(url, row_factory=dict_row) as conn:
-        yield conn
+def get_db_connection() -> Generator["psycopg.Connection", None, None]:
+    start = time.perf_counter()
+    with get_pool().connection() as conn:
+        instrumentation.record_acquire(start)
+        with instrumentation.timed_cursors(conn):
+            yield conn
 
 @contextmanager
-def get_db_transaction() -> Generator[psycopg.Cursor, None, None]:
+def get_db_transaction() -> Generator["psycopg.Cursor", None, None]:
     with get_db_connection() as conn:
         with conn.transaction():
             with conn.cursor() as cur:
                 yield cur
+
+@contextmanager
+def get_db_pipeline() -> Generator["psycopg.Connection", None, None]:
+    """
+    Pooled connection in pipeline mode. Statements (and the BEGIN/COMMIT of a
+    `conn.transaction()` block) are queued client-side and only sent when a
+    result is fetched or the pipeline is synced, so a whole transaction can
+    cost a single network round trip.
+    """
+    with get_db_connection() as conn:
+        with conn.pipeline():
+            yield conn
+
+@asynccontextmanager
+async def get_async_db_connection() -> AsyncGenerator["psycopg.AsyncConnection", None]:
+    start = time.perf_counter()
+    pool = await get_async_pool()
+    async with pool.connection() as conn:
+        instrumentation.record_acquire(start)
+        with instrumentation.timed_cursors(conn):
+            yield conn
+
+@asynccontextmanager
+async def get_async_db_transaction() -> AsyncGenerator["psycopg.AsyncCursor", None]:
+    async with get_async_db_connection() as conn:
+        async with conn.transaction():
+            async with conn.cursor() as cur:
+                yield cur
+
+@asynccontextmanager
+async def get_async_db_pipeline() -> AsyncGenerator["psycopg.AsyncConnection", None]:
+    """
+    Async form of get_db_pipeline().
+    """
+    async with get_async_db_connection() as conn:
+        async with conn.pipeline():
+            yield conn
+
+# Channel notified by every transaction that writes to the outbox. Postgres
+# only delivers the notification once that transaction commits.
+OUTBOX_CHANNEL = "santiago_munoz_write_outbox"
+
+@contextmanager
+def get_listen_connection(channel: str) -> Generator["psycopg.Connection", None, None]:
+    """
+    Dedicated (unpooled) autocommit connection subscribed to `channel`.
+    It stays checked out for the lifetime of the listener, so it must not
+    come from the shared pool.
+    """
+    import psycopg
+    from psycopg import sql
+
+    with psycopg.connect(get_db_url(), autocommit=True) as conn:
+        conn.execute(sql.SQL("LISTEN {}").format(sql.Identifier(channel)))
+        yield conn
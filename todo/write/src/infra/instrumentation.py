@@ -0,0 +1,12 @@
+from todo.common import instrumentation as _instrumentation
+# The rest of the API is shared as is; only request scopes carry the service
+from todo.common.instrumentation import RequestMetrics, Sink, current, record_acquire, set_sink, stage, timed_cursors
+
+SERVICE = "todo-write"
+
+def request(operation: str):
+    """
+    Opens the measurement scope for one todo-write request, see
+    todo.common.instrumentation.request.
+    """
+    return _instrumentation.request(operation, SERVICE)
@@ -1,5 +1,39 @@
-from .db import get_db_transaction
-from typing import List
+import psycopg
+from contextlib import contextmanager
+from .db import get_db_transaction, get_async_db_transaction, get_listen_connection, OUTBOX_CHANNEL
+from typing import List, Dict, Any, Callable, Generator
+from uuid import UUID, uuid5
+
+# Outbox ids are BIGSERIALs while consumers deduplicate on UUIDs, so each row
+# is given a stable UUID derived from its id.
+OUTBOX_EVENT_NAMESPACE = UUID("6f1c3c2e-9a53-4c1e-8f6b-2d0f6e8b7a41")
+
+# A sink receives a batch of event messages and must raise if any of them
+# could not be delivered, which leaves the whole batch pending.
+EventSink = Callable[[List[Dict[str, Any]]], None]
+
+class ListenerLost(Exception):
+    """
+    The LISTEN connection could not be opened or was dropped; subscribing
+    again is safe.
+    """
+
+def outbox_event_message(row: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Converts an outbox row into the message shape expected by consumers.
+    """
+    return {
+        "event_id": str(uuid5(OUTBOX_EVENT_NAMESPACE, str(row["id"]))),
+        "event_type": row["event_type"],
+        "payload": row["payload"]
+    }
+
+MARK_PUBLISHED_SQL = "UPDATE santiago_munoz_write.outbox SET published_at = NOW() WHERE id = ANY(%s)"
+
+SELECT_PENDING_SQL = """
+    SELECT id, aggregate_id, event_type, payload FROM santiago_munoz_write.outbox
+    WHERE published_at IS NULL ORDER BY id LIMIT %s
+"""
 
 class OutboxPublisher:
     """
@@ -7,15 +41,66 @@ class OutboxPublisher:
     """
     def mark_as_published(self, event_ids: List[int]) -> None:
         with get_db_transaction() as cur:
-            cur.execute(
-                "UPDATE outbox SET published_at = NOW() WHERE id = ANY(%s)",
-                (event_ids,)
-            )
+            cur.execute(MARK_PUBLISHED_SQL, (event_ids,))
 
     def get_pending_events(self, limit: int = 100):
+        with get_db_transaction() as cur:
+            cur.execute(SELECT_PENDING_SQL, (limit,))
+            return cur.fetchall()
+
+    def relay_batch(self, sink: EventSink, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        Claims up to `limit` pending events in id order, hands them to `sink`
+        and marks them published, all in one transaction. Rows are locked with
+        SKIP LOCKED, so concurrent relays claim disjoint batches instead of
+        double-publishing. If the sink raises, the transaction rolls back and
+        the batch stays pending for the next attempt.
+        """
         with get_db_transaction() as cur:
             cur.execute(
-                "SELECT id, aggregate_id, event_type, payload FROM outbox WHERE published_at IS NULL LIMIT %s",
+                """
+                SELECT id, aggregate_id, event_type, payload, created_at FROM santiago_munoz_write.outbox
+                WHERE published_at IS NULL
+                ORDER BY id
+                LIMIT %s
+                FOR UPDATE SKIP LOCKED
+                """,
                 (limit,)
             )
-            return cur.fetchall()
+            events = cur.fetchall()
+            if not events:
+                return []
+
+            sink([outbox_event_message(row) for row in events])
+
+            cur.execute(MARK_PUBLISHED_SQL, ([row["id"] for row in events],))
+            return events
+
+    @contextmanager
+    def listen(self) -> Generator[Callable[[float], bool], None, None]:
+        """
+        Subscribes to OUTBOX_CHANNEL and yields a `wait(timeout)` function that
+        blocks until a commit notifies the channel (True) or the timeout
+        expires (False). Waiting is client-side and issues no queries.
+        Raises ListenerLost when the connection cannot be opened or drops.
+        """
+        try:
+            with get_listen_connection(OUTBOX_CHANNEL) as conn:
+                def wait(timeout: float) -> bool:
+                    return any(True for _ in conn.notifies(timeout=timeout, stop_after=1))
+                yield wait
+        except psycopg.OperationalError as e:
+            raise ListenerLost(str(e)) from e
+
+class AsyncOutboxPublisher:
+    """
+    OutboxPublisher on the async pool.
+    """
+    async def mark_as_published(self, event_ids: List[int]) -> None:
+        async with get_async_db_transaction() as cur:
+            await cur.execute(MARK_PUBLISHED_SQL, (event_ids,))
+
+    async def get_pending_events(self, limit: int = 100):
+        async with get_async_db_transaction() as cur:
+            await cur.execute(SELECT_PENDING_SQL, (limit,))
+            return await cur.fetchall()
@@ -1,72 +1,152 @@
 import json
 from uuid import UUID
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple, Union
 from ..domain.model import Todo
 from ..domain.events import TodoCreated
-from .db import get_db_transaction
+from .db import get_db_pipeline, get_async_db_pipeline, OUTBOX_CHANNEL
+
+# Claims the command id and writes the todos, their outbox events and the
+# command result in one statement. The claim is the primary-key insert into
+# processed_commands: a replay (or a concurrent duplicate, which blocks on
+# the claimer's uncommitted row until it commits) gets no row back from
+# `claim`, so nothing else is written and no relay is woken. Todos and events
+# arrive as parallel arrays, which serves single commands and batches alike.
+CREATE_TODOS_SQL = """
+    WITH claim AS (
+        INSERT INTO santiago_munoz_write.processed_commands (command_id, result_status, result_body)
+        VALUES (%(command_id)s::uuid, %(result_status)s::integer, %(result_body)s::jsonb)
+        ON CONFLICT (command_id) DO NOTHING
+        RETURNING command_id
+    ), inserted_todos AS (
+        INSERT INTO santiago_munoz_write.todos (id, title, description, priority, due_date, is_completed, created_at, updated_at)
+        SELECT t.* FROM unnest(
+            %(ids)s::uuid[], %(titles)s::varchar[], %(descriptions)s::varchar[],
+            %(priorities)s::santiago_munoz_write.todo_priority[], %(due_dates)s::timestamptz[],
+            %(completed)s::boolean[], %(created)s::timestamptz[], %(updated)s::timestamptz[]
+        ) AS t
+        WHERE EXISTS (SELECT 1 FROM claim)
+    ), inserted_events AS (
+        INSERT INTO santiago_munoz_write.outbox (aggregate_id, event_type, payload)
+        SELECT e.* FROM unnest(%(aggregate_ids)s::uuid[], %(event_types)s::varchar[], %(payloads)s::jsonb[]) AS e
+        WHERE EXISTS (SELECT 1 FROM claim)
+    )
+    -- Wakes listening relays once the transaction commits, only if it wrote anything
+    SELECT c.command_id
+    FROM claim c CROSS JOIN LATERAL (SELECT pg_notify(%(channel)s, '')) n
+"""
+
+SELECT_COMMAND_RESULT_SQL = """
+    SELECT result_status, result_body FROM santiago_munoz_write.processed_commands WHERE command_id = %s
+"""
 
 class AlreadyProcessedError(Exception):
     def __init__(self, status_code: int, body: Dict[str, Any]):
         self.status_code = status_code
         self.body = body
 
+def _already_processed(existing: Dict[str, Any]) -> AlreadyProcessedError:
+    return AlreadyProcessedError(
+        status_code=existing["result_status"],
+        body=existing["result_body"]
+    )
+
+def _create_params(
+    items: List[Tuple[Todo, TodoCreated]],
+    command_id: UUID,
+    status_code: int,
+    result_body: Union[Dict[str, Any], str]
+) -> Dict[str, Any]:
+    """
+    `result_body` may be passed already serialized.
+    """
+    todos = [todo for todo, _ in items]
+    events = [event for _, event in items]
+    return {
+        "command_id": command_id,
+        "result_status": status_code,
+        "result_body": result_body if isinstance(result_body, str) else json.dumps(result_body),
+        "ids": [t.id for t in todos],
+        "titles": [t.title for t in todos],
+        "descriptions": [t.description for t in todos],
+        "priorities": [t.priority.value if t.priority else None for t in todos],
+        "due_dates": [t.due_date for t in todos],
+        "completed": [t.is_completed for t in todos],
+        "created": [t.created_at for t in todos],
+        "updated": [t.updated_at for t in todos],
+        "aggregate_ids": [e.id for e in events],
+        "event_types": ["TodoCreated"] * len(events),
+        "payloads": [e.payload_json() for e in events],
+        "channel": OUTBOX_CHANNEL,
+    }
+
 class TodoRepository:
+    def _create(
+        self,
+        items: List[Tuple[Todo, TodoCreated]],
+        command_id: UUID,
+        status_code: int,
+        result_body: Union[Dict[str, Any], str]
+    ) -> None:
+        params = _create_params(items, command_id, status_code, result_body)
+        with get_db_pipeline() as conn, conn.cursor() as cur:
+            with conn.transaction():
+                cur.execute(CREATE_TODOS_SQL, params)
+            # BEGIN, the statement and COMMIT all leave in this one flush
+            if cur.fetchone() is not None:
+                return
+
+            # Duplicate: replay the result stored by whoever claimed the command
+            cur.execute(SELECT_COMMAND_RESULT_SQL, (command_id,))
+            raise _already_processed(cur.fetchone())
+
     def save(self, todo: Todo, event: TodoCreated, command_id: UUID) -> None:
-        with get_db_transaction() as cur:
-            # 1. Idempotency Check
-            cur.execute(
-                "SELECT result_status, result_body FROM santiago_munoz_write.processed_commands WHERE command_id = %s",
-                (command_id,)
-            )
-            existing = cur.fetchone()
-            if existing:
-                raise AlreadyProcessedError(
-                    status_code=existing["result_status"],
-                    body=existing["result_body"]
-                )
+        # Stored result and response body are the same serialized todo
+        self._create([(todo, event)], command_id, 201, todo.to_json())
+
+    def save_batch(
+        self,
+        items: List[Tuple[Todo, TodoCreated]],
+        command_id: UUID,
+        status_code: int,
+        result_body: Dict[str, Any]
+    ) -> None:
+        """
+        Persists many todos and their events in one transaction, with the same
+        single statement as `save`: its cost does not grow with one round trip
+        per todo. The whole batch shares a single command record.
+        """
+        self._create(items, command_id, status_code, result_body)
+
+class AsyncTodoRepository:
+    """
+    TodoRepository on an async pool, for the ASGI server: same statements,
+    same semantics, but waiting on the database never blocks the event loop.
+    """
+    async def _create(
+        self,
+        items: List[Tuple[Todo, TodoCreated]],
+        command_id: UUID,
+        status_code: int,
+        result_body: Union[Dict[str, Any], str]
+    ) -> None:
+        params = _create_params(items, command_id, status_code, result_body)
+        async with get_async_db_pipeline() as conn, conn.cursor() as cur:
+            async with conn.transaction():
+                await cur.execute(CREATE_TODOS_SQL, params)
+            if await cur.fetchone() is not None:
+                return
 
-            # 2. Insert Todo
-            cur.execute(
-                """
-                INSERT INTO santiago_munoz_write.todos (id, title, description, priority, due_date, is_completed, created_at, updated_at)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                """,
-                (
-                    todo.id, todo.title, todo.description, 
-                    todo.priority.value if todo.priority else None, 
-                    todo.due_date, todo.is_completed, todo.created_at, todo.updated_at
-                )
-            )
+            await cur.execute(SELECT_COMMAND_RESULT_SQL, (command_id,))
+            raise _already_processed(await cur.fetchone())
 
-            # 3. Insert Outbox Event
-            event_payload = {
-                "id": str(event.id),
-                "title": event.title,
-                "description": event.description,
-                "priority": event.priority.value if event.priority else None,
-                "due_date": event.due_date.isoformat() if event.due_date else None,
-                "created_at": event.created_at.isoformat()
-            }
-            cur.execute(
-                """
-                INSERT INTO santiago_munoz_write.outbox (aggregate_id, event_type, payload)
-                VALUES (%s, %s, %s)
-                """,
-                (todo.id, "TodoCreated", json.dumps(event_payload))
-            )
+    async def save(self, todo: Todo, event: TodoCreated, command_id: UUID) -> None:
+        await self._create([(todo, event)], command_id, 201, todo.to_json())
 
-            # 4. Record Command
-            result_body = {
-                "id": str(todo.id),
-                "title": todo.title,
-                "description": todo.description,
-                "priority": todo.priority.value if todo.priority else None,
-                "due_date": todo.due_date.isoformat() if todo.due_date else None,
-                "is_completed": todo.is_completed,
-                "created_at": todo.created_at.isoformat(),
-                "updated_at": todo.updated_at.isoformat()
-            }
-            cur.execute(
-                "INSERT INTO santiago_munoz_write.processed_commands (command_id, result_status, result_body) VALUES (%s, %s, %s)",
-                (command_id, 201, json.dumps(result_body))
-            )
+    async def save_batch(
+        self,
+        items: List[Tuple[Todo, TodoCreated]],
+        command_id: UUID,
+        status_code: int,
+        result_body: Dict[str, Any]
+    ) -> None:
+        await self._create(items, command_id, status_code, result_body)
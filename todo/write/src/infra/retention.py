@@ -0,0 +1,211 @@
+import re
+from datetime import datetime, timezone
+from typing import List, Tuple
+import psycopg
+from aws_lambda_powertools import Logger
+from psycopg import errors, sql
+from .db import get_db_transaction
+
+logger = Logger(child=True)
+
+# Outbox partitions are named after the UTC month they hold, see the
+# partition_outbox migration.
+OUTBOX_PARTITION_PATTERN = re.compile(r"^outbox_p(\d{4})(\d{2})$")
+
+DELETE_PUBLISHED_OUTBOX_SQL = """
+    DELETE FROM santiago_munoz_write.outbox o
+    USING (
+        SELECT id, created_at FROM santiago_munoz_write.outbox
+        WHERE created_at < %(cutoff)s AND published_at < %(cutoff)s
+        LIMIT %(limit)s
+        FOR UPDATE SKIP LOCKED
+    ) expired
+    WHERE o.id = expired.id AND o.created_at = expired.created_at
+"""
+
+DELETE_PROCESSED_COMMANDS_SQL = """
+    DELETE FROM santiago_munoz_write.processed_commands
+    WHERE command_id IN (
+        SELECT command_id FROM santiago_munoz_write.processed_commands
+        WHERE processed_at < %(cutoff)s
+        ORDER BY processed_at
+        LIMIT %(limit)s
+        FOR UPDATE SKIP LOCKED
+    )
+"""
+
+# Rows land in outbox_default only when their month had no partition yet
+SELECT_DEFAULT_PARTITION_MONTHS_SQL = """
+    SELECT DISTINCT date_trunc('month', created_at, 'UTC') AS month
+    FROM santiago_munoz_write.outbox_default
+"""
+
+SELECT_DEFAULT_HAS_MONTH_SQL = """
+    SELECT EXISTS (
+        SELECT 1 FROM santiago_munoz_write.outbox_default
+        WHERE created_at >= %(start)s AND created_at < %(end)s
+    ) AS misplaced
+"""
+
+DETACH_DEFAULT_PARTITION_SQL = "ALTER TABLE santiago_munoz_write.outbox DETACH PARTITION santiago_munoz_write.outbox_default"
+
+ATTACH_DEFAULT_PARTITION_SQL = "ALTER TABLE santiago_munoz_write.outbox ATTACH PARTITION santiago_munoz_write.outbox_default DEFAULT"
+
+MOVE_FROM_DEFAULT_SQL = """
+    WITH moved AS (
+        DELETE FROM santiago_munoz_write.outbox_default
+        WHERE created_at >= %(start)s AND created_at < %(end)s
+        RETURNING id, aggregate_id, event_type, payload, created_at, published_at
+    )
+    INSERT INTO {} (id, aggregate_id, event_type, payload, created_at, published_at)
+    SELECT id, aggregate_id, event_type, payload, created_at, published_at FROM moved
+"""
+
+def month_start(moment: datetime) -> datetime:
+    moment = moment.astimezone(timezone.utc)
+    return datetime(moment.year, moment.month, 1, tzinfo=timezone.utc)
+
+def add_months(month: datetime, months: int) -> datetime:
+    index = month.year * 12 + month.month - 1 + months
+    return datetime(index // 12, index % 12 + 1, 1, tzinfo=timezone.utc)
+
+def outbox_partition_name(month: datetime) -> str:
+    return f"outbox_p{month.year:04d}{month.month:02d}"
+
+class WriteRetention:
+    """
+    Housekeeping for the write schema. Every delete runs in its own short
+    transaction over at most `limit` rows and skips rows locked by the relay
+    or by another maintenance run, so it never blocks the hot path for long.
+    """
+    def delete_published_outbox(self, cutoff: datetime, limit: int) -> int:
+        """
+        Deletes up to `limit` outbox events published before `cutoff`. Pending
+        events are never touched; the created_at bound lets Postgres prune
+        partitions that are entirely newer than the cutoff.
+        """
+        with get_db_transaction() as cur:
+            cur.execute(DELETE_PUBLISHED_OUTBOX_SQL, {"cutoff": cutoff, "limit": limit})
+            return cur.rowcount
+
+    def delete_processed_commands(self, cutoff: datetime, limit: int) -> int:
+        """
+        Deletes up to `limit` idempotency records older than `cutoff`, oldest
+        first. A command retried after its record is gone is processed again.
+        """
+        with get_db_transaction() as cur:
+            cur.execute(DELETE_PROCESSED_COMMANDS_SQL, {"cutoff": cutoff, "limit": limit})
+            return cur.rowcount
+
+    def list_outbox_partitions(self) -> List[Tuple[str, datetime]]:
+        """
+        Monthly outbox partitions as (name, month start), oldest first. The
+        default partition is not included.
+        """
+        with get_db_transaction() as cur:
+            cur.execute(
+                """
+                SELECT c.relname FROM pg_inherits i
+                JOIN pg_class c ON c.oid = i.inhrelid
+                WHERE i.inhparent = 'santiago_munoz_write.outbox'::regclass
+                """
+            )
+            partitions = []
+            for row in cur.fetchall():
+                match = OUTBOX_PARTITION_PATTERN.match(row["relname"])
+                if match:
+                    month = datetime(int(match.group(1)), int(match.group(2)), 1, tzinfo=timezone.utc)
+                    partitions.append((row["relname"], month))
+            return sorted(partitions, key=lambda p: p[1])
+
+    def create_outbox_partitions(self, now: datetime, months_ahead: int = 2, lock_timeout_ms: int = 2000) -> List[str]:
+        """
+        Makes sure partitions exist from the current month through
+        `months_ahead` months later, so inserts do not land in the default
+        partition, and for any earlier month that already has rows there.
+        Returns the names of the partitions created.
+
+        Postgres refuses to create a partition whose range has rows in the
+        default partition, so those rows are moved into the new partition in
+        the same transaction. A month that cannot be created (e.g. its locks
+        are busy past `lock_timeout_ms`) is logged and retried next run.
+        """
+        existing = {name for name, _ in self.list_outbox_partitions()}
+        current = month_start(now)
+        months = {add_months(current, offset) for offset in range(months_ahead + 1)}
+        months.update(self._default_partition_months())
+
+        created = []
+        for month in sorted(months):
+            name = outbox_partition_name(month)
+            if name in existing:
+                continue
+            try:
+                self._create_outbox_partition(name, month, lock_timeout_ms)
+            except psycopg.Error as e:
+                logger.warning("Could not create outbox partition", extra={"partition": name, "error": str(e)})
+                continue
+            created.append(name)
+        return created
+
+    def _default_partition_months(self) -> List[datetime]:
+        with get_db_transaction() as cur:
+            cur.execute(SELECT_DEFAULT_PARTITION_MONTHS_SQL)
+            return [month_start(row["month"]) for row in cur.fetchall()]
+
+    def _create_outbox_partition(self, name: str, month: datetime, lock_timeout_ms: int) -> None:
+        bounds = {"start": month, "end": add_months(month, 1)}
+        partition = sql.SQL("santiago_munoz_write.{}").format(sql.Identifier(name))
+        with get_db_transaction() as cur:
+            cur.execute(sql.SQL("SET LOCAL lock_timeout = {}").format(sql.Literal(f"{lock_timeout_ms}ms")))
+            # Parent first, the order the relay locks in
+            cur.execute("LOCK TABLE ONLY santiago_munoz_write.outbox IN ACCESS EXCLUSIVE MODE")
+            cur.execute(SELECT_DEFAULT_HAS_MONTH_SQL, bounds)
+            misplaced = cur.fetchone()["misplaced"]
+            if misplaced:
+                cur.execute(DETACH_DEFAULT_PARTITION_SQL)
+            cur.execute(
+                sql.SQL(
+                    "CREATE TABLE IF NOT EXISTS {} PARTITION OF santiago_munoz_write.outbox FOR VALUES FROM ({}) TO ({})"
+                ).format(partition, sql.Literal(bounds["start"]), sql.Literal(bounds["end"]))
+            )
+            if misplaced:
+                # Ids and published_at move with the rows, so pending events
+                # stay pending and the relay picks them up from the new month
+                cur.execute(sql.SQL(MOVE_FROM_DEFAULT_SQL).format(partition), bounds)
+                cur.execute(ATTACH_DEFAULT_PARTITION_SQL)
+
+    def drop_outbox_partitions(self, cutoff: datetime, lock_timeout_ms: int = 2000) -> List[str]:
+        """
+        Drops monthly partitions that end at or before `cutoff` and hold no
+        pending events. Dropping a partition frees its space at once, with no
+        dead rows left to vacuum. Returns the names of the partitions dropped.
+
+        DROP needs an exclusive lock on the parent outbox, which stalls every
+        outbox insert while it is held or awaited. Each drop therefore waits
+        at most `lock_timeout_ms` for its locks and leaves the partition for
+        the next run if the relay or a writer holds them. (DETACH ...
+        CONCURRENTLY is not an option while the default partition exists.)
+        """
+        dropped = []
+        for name, month in self.list_outbox_partitions():
+            if add_months(month, 1) > cutoff:
+                break
+            try:
+                with get_db_transaction() as cur:
+                    partition = sql.SQL("santiago_munoz_write.{}").format(sql.Identifier(name))
+                    cur.execute(sql.SQL("SET LOCAL lock_timeout = {}").format(sql.Literal(f"{lock_timeout_ms}ms")))
+                    # Parent before partition, the order the relay locks them in
+                    cur.execute("LOCK TABLE ONLY santiago_munoz_write.outbox IN ACCESS EXCLUSIVE MODE")
+                    # Hold the partition while checking so no event can be left pending
+                    cur.execute(sql.SQL("LOCK TABLE {} IN ACCESS EXCLUSIVE MODE").format(partition))
+                    cur.execute(
+                        sql.SQL("SELECT EXISTS (SELECT 1 FROM {} WHERE published_at IS NULL) AS pending").format(partition)
+                    )
+                    if cur.fetchone()["pending"]:
+                        continue
+                    cur.execute(sql.SQL("DROP TABLE {}").format(partition))
+            except errors.LockNotAvailable:
+                continue
+            dropped.append(name)
+        return dropped
@@ -2,7 +2,7 @@ import pytest
 import json
 from uuid import uuid4
 from unittest.mock import MagicMock, patch
-from todo.write.src.entrypoints.api import lambda_handler
+from todo.write.src.entrypoints.api import lambda_handler, batch_lambda_handler
 
 @pytest.fixture(scope="function")
 def mock_context():
@@ -25,7 +25,7 @@ def mock_db(mocker):
     mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
     
     # Patch where they are USED in the repository
-    mocker.patch("todo.write.src.infra.repo.get_db_transaction", return_value=MagicMock(__enter__=lambda s: mock_cursor))
+    mocker.patch("todo.write.src.infra.repo.get_db_pipeline", return_value=MagicMock(__enter__=lambda s: mock_conn))
     
     return mock_cursor
 
@@ -35,9 +35,9 @@ def test_create_todo_e2e_flow(mock_db, mock_context):
     """
     command_id = str(uuid4())
     
-    # Configure mock for idempotency check (not found)
+    # Configure mock for the command claim (won)
     mock_db.fetchone.side_effect = [
-        None, # First check: result_status from processed_commands
+        {"command_id": command_id},
     ]
     
     # 1. Initial Creation
@@ -61,17 +61,18 @@ def test_create_todo_e2e_flow(mock_db, mock_context):
     assert "id" in body
     
     # 2. Verify Database Calls
-    # Check if idempotency was checked
-    assert "SELECT result_status, result_body FROM santiago_munoz_write.processed_commands" in mock_db.execute.call_args_list[0][0][0]
-    
-    # Check if Todo was inserted
-    assert "INSERT INTO santiago_munoz_write.todos" in mock_db.execute.call_args_list[1][0][0]
-    
-    # Check if Outbox was inserted
-    assert "INSERT INTO santiago_munoz_write.outbox" in mock_db.execute.call_args_list[2][0][0]
-    
-    # Check if Command was recorded
-    assert "INSERT INTO santiago_munoz_write.processed_commands" in mock_db.execute.call_args_list[3][0][0]
+    # The claim, both inserts and the relay wake-up are a single statement
+    assert mock_db.execute.call_count == 1
+    sql, params = mock_db.execute.call_args_list[0][0]
+    assert "INSERT INTO santiago_munoz_write.processed_commands" in sql
+    assert "ON CONFLICT (command_id) DO NOTHING" in sql
+    assert "INSERT INTO santiago_munoz_write.todos" in sql
+    assert "INSERT INTO santiago_munoz_write.outbox" in sql
+    assert "pg_notify" in sql
+    assert str(params["command_id"]) == command_id
+    assert params["titles"] == ["Integration Test Task"]
+    assert params["priorities"] == ["High"]
+    assert json.loads(params["payloads"][0])["title"] == "Integration Test Task"
 
 def test_create_todo_idempotency_flow(mock_db, mock_context):
     """
@@ -80,11 +81,11 @@ def test_create_todo_idempotency_flow(mock_db, mock_context):
     command_id = str(uuid4())
     todo_id = str(uuid4())
     
-    # Configure mock for idempotency check (found)
-    mock_db.fetchone.return_value = {
-        "result_status": 201,
-        "result_body": {"id": todo_id, "title": "Already Exists"}
-    }
+    # Configure mock for the command claim (lost) and the stored result
+    mock_db.fetchone.side_effect = [
+        None,
+        {"result_status": 201, "result_body": {"id": todo_id, "title": "Already Exists"}}
+    ]
     
     event = {
         "body": json.dumps({"title": "Doesn't matter"}),
@@ -98,9 +99,9 @@ def test_create_todo_idempotency_flow(mock_db, mock_context):
     assert body["id"] == todo_id
     assert body["title"] == "Already Exists"
     
-    # Verify only the select was called, no inserts
-    assert mock_db.execute.call_count == 1
-    assert "SELECT" in mock_db.execute.call_args[0][0]
+    # The claim found the command, so only the stored result was read back
+    assert mock_db.execute.call_count == 2
+    assert "SELECT result_status, result_body FROM santiago_munoz_write.processed_commands" in mock_db.execute.call_args[0][0]
 
 def test_create_todo_validation_error(mock_db, mock_context):
     """
@@ -114,3 +115,35 @@ def test_create_todo_validation_error(mock_db, mock_context):
     response = lambda_handler(event, mock_context)
     assert response["statusCode"] == 400
     assert mock_db.execute.call_count == 0
+
+def test_create_todos_batch_flow(mock_db, mock_context):
+    """
+    Tests that a batch is validated per item and written with a single statement.
+    """
+    mock_db.fetchone.return_value = {"command_id": "claimed"}
+
+    event = {
+        "body": json.dumps([
+            {"title": "Imported 1"},
+            {"title": ""},
+            {"title": "Imported 2", "priority": "Low"}
+        ]),
+        "headers": {"X-Command-ID": str(uuid4())}
+    }
+
+    response = batch_lambda_handler(event, mock_context)
+
+    assert response["statusCode"] == 207
+    body = json.loads(response["body"])
+    assert body["created"] == 2
+    assert body["items"][1]["error"] == "Title is required"
+
+    # Todos and outbox rows travel as arrays in the claiming statement
+    assert mock_db.execute.call_count == 1
+    sql, params = mock_db.execute.call_args[0]
+    assert "INSERT INTO santiago_munoz_write.processed_commands" in sql
+    assert params["titles"] == ["Imported 1", "Imported 2"]
+    assert params["priorities"] == [None, "Low"]
+    assert len(params["payloads"]) == 2
+    assert params["result_status"] == 207
+    assert json.loads(params["result_body"])["created"] == 2
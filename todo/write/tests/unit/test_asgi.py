@@ -0,0 +1,65 @@
+import asyncio
+import json
+from uuid import uuid4
+from unittest.mock import AsyncMock
+from todo.write.src.app.create_todo_command import CreateTodoCommandHandler
+from todo.write.src.entrypoints import asgi, routes
+from todo.write.src.infra.repo import AlreadyProcessedError
+
+def _request(method: str, path: str, body: bytes = b"", headers=()):
+    scope = {"type": "http", "method": method, "path": path, "headers": list(headers), "query_string": b""}
+    # The body arrives in two chunks to exercise reassembly
+    messages = [
+        {"type": "http.request", "body": body[:3], "more_body": True},
+        {"type": "http.request", "body": body[3:], "more_body": False},
+    ]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(asgi.app(scope, receive, send))
+    start, body_message = sent
+    return start["status"], dict(start["headers"]), body_message["body"]
+
+def test_post_todos_goes_through_async_repository(mocker):
+    repo = AsyncMock()
+    mocker.patch.object(routes, "async_handler", CreateTodoCommandHandler(repo))
+    command_id = str(uuid4())
+
+    status, headers, body = _request(
+        "POST", "/todos", json.dumps({"title": "Over HTTP"}).encode(),
+        headers=[(b"x-command-id", command_id.encode())]
+    )
+
+    assert status == 201
+    assert json.loads(body)["title"] == "Over HTTP"
+    assert headers[b"content-type"] == b"application/json"
+    assert headers[b"content-length"] == str(len(body)).encode()
+    todo, event, saved_command_id = repo.save.await_args[0]
+    assert str(saved_command_id) == command_id
+    assert todo.title == "Over HTTP"
+
+def test_replayed_command_returns_stored_result(mocker):
+    repo = AsyncMock()
+    repo.save.side_effect = AlreadyProcessedError(201, {"id": "stored"})
+    mocker.patch.object(routes, "async_handler", CreateTodoCommandHandler(repo))
+
+    status, _, body = _request(
+        "POST", "/todos", b'{"title": "Again"}', headers=[(b"x-command-id", str(uuid4()).encode())]
+    )
+
+    assert status == 201
+    assert json.loads(body) == {"id": "stored"}
+
+def test_unknown_routes_and_methods():
+    assert _request("GET", "/nope")[0] == 404
+    assert _request("GET", "/todos")[0] == 405
+
+def test_missing_command_id_is_rejected():
+    status, _, body = _request("POST", "/todos", b'{"title": "x"}')
+    assert status == 400
+    assert json.loads(body)["error"] == "Missing X-Command-ID header"
@@ -0,0 +1,76 @@
+from hypothesis import given, strategies as st
+from todo.write.src.app.create_todos_batch_command import CreateTodosBatchCommandHandler, MAX_BATCH_SIZE
+from todo.write.src.app.commands import CommandEnvelope
+from todo.write.src.infra.repo import AlreadyProcessedError
+import pytest
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+@pytest.fixture
+def mock_repo():
+    return MagicMock()
+
+@pytest.fixture
+def handler(mock_repo):
+    return CreateTodosBatchCommandHandler(repo=mock_repo)
+
+@given(titles=st.lists(st.one_of(st.just(""), st.text(min_size=1, max_size=50)), min_size=1, max_size=20))
+def test_batch_reports_each_item(titles):
+    mock_repo = MagicMock()
+    handler = CreateTodosBatchCommandHandler(repo=mock_repo)
+    envelope = CommandEnvelope(command_id=uuid4(), payload=[{"title": t} for t in titles])
+
+    result = handler.handle(envelope)
+
+    valid = [t for t in titles if t.strip()]
+    assert [item["index"] for item in result.body["items"]] == list(range(len(titles)))
+    assert result.body["created"] == len(valid)
+    assert result.body["failed"] == len(titles) - len(valid)
+    if not valid:
+        assert result.status_code == 400
+        assert not mock_repo.save_batch.called
+    else:
+        assert result.status_code == (201 if len(valid) == len(titles) else 207)
+        saved_items = mock_repo.save_batch.call_args[0][0]
+        assert [todo.title for todo, _ in saved_items] == [t.strip() for t in valid]
+
+def test_batch_persists_valid_items_once(handler, mock_repo):
+    command_id = uuid4()
+    envelope = CommandEnvelope(
+        command_id=command_id,
+        payload=[
+            {"title": "First", "priority": "High"},
+            {"title": "Second", "priority": "Urgent"},
+            "not an object"
+        ]
+    )
+
+    result = handler.handle(envelope)
+
+    assert result.status_code == 207
+    items = result.body["items"]
+    assert items[0]["status_code"] == 201
+    assert items[0]["todo"]["title"] == "First"
+    assert "Invalid priority" in items[1]["error"]
+    assert items[2]["error"] == "Each todo must be a JSON object"
+    mock_repo.save_batch.assert_called_once()
+    saved, saved_command_id, status_code, body = mock_repo.save_batch.call_args[0]
+    assert len(saved) == 1
+    assert saved_command_id == command_id
+    assert status_code == 207
+    assert body == result.body
+
+def test_batch_replays_processed_command(handler, mock_repo):
+    stored = {"created": 1, "failed": 0, "items": []}
+    mock_repo.save_batch.side_effect = AlreadyProcessedError(status_code=201, body=stored)
+
+    result = handler.handle(CommandEnvelope(command_id=uuid4(), payload=[{"title": "Task"}]))
+
+    assert result.status_code == 201
+    assert result.body == stored
+
+@pytest.mark.parametrize("payload", [[], {"title": "Task"}, [{"title": "Task"}] * (MAX_BATCH_SIZE + 1)])
+def test_batch_rejects_invalid_shapes(handler, mock_repo, payload):
+    result = handler.handle(CommandEnvelope(command_id=uuid4(), payload=payload))
+    assert result.status_code == 400
+    assert not mock_repo.save_batch.called
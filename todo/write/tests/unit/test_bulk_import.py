@@ -0,0 +1,183 @@
+import io
+import json
+from unittest.mock import MagicMock
+from uuid import uuid4, uuid5
+from todo.write.src.app.bulk_import import BulkImport, csv_records, ndjson_records
+from todo.write.src.infra.bulk_import import BulkTodoWriter, COPY_TODOS_SQL, COPY_OUTBOX_SQL
+
+class RecordingWriter:
+    def __init__(self, committed=()):
+        self.chunks = []
+        self.committed = set(committed)
+
+    def write_chunk(self, items, chunk_id):
+        self.chunks.append((chunk_id, items))
+        return chunk_id not in self.committed
+
+def test_csv_rows_are_validated_and_rejects_recorded():
+    source = io.StringIO(
+        "title,description,priority,due_date\n"
+        "Buy milk,,High,2026-01-01T00:00:00Z\n"
+        ",no title,,\n"
+        "Call mom,Sunday,Urgent,\n"
+        "Too,many,fields,,extra\n"
+        "Water plants,,,\n"
+    )
+    writer = RecordingWriter()
+    rejects = io.StringIO()
+
+    result = BulkImport(writer, chunk_size=10, rejects=rejects).run(csv_records(source))
+
+    assert (result["read"], result["imported"], result["rejected"]) == (5, 2, 3)
+    assert result["rows_per_second"] > 0
+    todos = [todo for todo, _ in writer.chunks[0][1]]
+    assert [t.title for t in todos] == ["Buy milk", "Water plants"]
+    assert todos[0].description is None and todos[0].priority.value == "High"
+    rejected = [json.loads(line) for line in rejects.getvalue().splitlines()]
+    assert [r["line"] for r in rejected] == [3, 4, 5]
+    assert rejected[0]["error"] == "Title is required"
+    assert "Invalid priority" in rejected[1]["error"]
+    assert rejected[1]["record"]["title"] == "Call mom"
+    assert rejected[2]["record"] is None
+
+def test_ndjson_rejects_unparseable_and_non_object_lines():
+    source = io.StringIO('{"title": "One"}\n\n{not json\n[1, 2]\n{"title": 5}\n{"title": "Two"}\n')
+    writer = RecordingWriter()
+    rejects = io.StringIO()
+
+    result = BulkImport(writer, rejects=rejects).run(ndjson_records(source))
+
+    assert (result["read"], result["imported"], result["rejected"]) == (5, 2, 3)
+    assert [json.loads(line)["line"] for line in rejects.getvalue().splitlines()] == [3, 4, 5]
+
+def test_input_is_consumed_one_chunk_at_a_time():
+    pulled = []
+
+    def records():
+        for i in range(10):
+            pulled.append(i)
+            yield i, {"title": f"Todo {i}"}
+
+    seen = []
+
+    class Writer:
+        def write_chunk(self, items, chunk_id):
+            # Only this chunk (and nothing beyond it) has been read so far
+            seen.append((len(items), len(pulled)))
+            return True
+
+    BulkImport(Writer(), chunk_size=4).run(records())
+
+    assert seen == [(4, 4), (4, 8), (2, 10)]
+
+def test_resume_skips_committed_chunks():
+    import_id = uuid4()
+    writer = RecordingWriter(committed={uuid5(import_id, "0")})
+    records = ((i, {"title": f"Todo {i}"}) for i in range(5))
+
+    result = BulkImport(writer, chunk_size=3, import_id=import_id).run(records)
+
+    assert [chunk_id for chunk_id, _ in writer.chunks] == [uuid5(import_id, "0"), uuid5(import_id, "1")]
+    assert (result["imported"], result["skipped"]) == (2, 3)
+    assert result["import_id"] == str(import_id)
+
+def test_resume_writes_rejects_only_for_new_chunks():
+    import_id = uuid4()
+    writer = RecordingWriter(committed={uuid5(import_id, "0")})
+    records = iter([(1, {"title": "One"}), (2, {"title": ""}), (3, {"title": "Two"}), (4, {"title": ""}), (5, {"title": "Three"}), (6, {})])
+    rejects = io.StringIO()
+
+    result = BulkImport(writer, chunk_size=2, rejects=rejects, import_id=import_id).run(records)
+
+    # Line 2 was rejected into the committed chunk by the interrupted run
+    assert result["rejected"] == 3
+    assert [json.loads(line)["line"] for line in rejects.getvalue().splitlines()] == [4, 6]
+
+def test_runs_of_invalid_rows_are_flushed_chunk_by_chunk():
+    rejects = io.StringIO()
+    written_before = []
+
+    class Writer:
+        def __init__(self):
+            self.chunks = []
+
+        def write_chunk(self, items, chunk_id):
+            self.chunks.append(len(items))
+            written_before.append(len(rejects.getvalue().splitlines()))
+            return True
+
+    records = [(i, {"title": ""}) for i in range(1, 10_001)] + [(10_001, {"title": "Last"})]
+    writer = Writer()
+
+    result = BulkImport(writer, chunk_size=1000, rejects=rejects).run(iter(records))
+
+    # Rows without a single valid todo still form (and claim) chunks, so
+    # no more than one chunk of rejects is ever held back
+    assert writer.chunks == [0] * 10 + [1]
+    assert written_before == [i * 1000 for i in range(11)]
+    assert (result["rejected"], result["imported"]) == (10_000, 1)
+    assert len(rejects.getvalue().splitlines()) == 10_000
+
+def test_writer_only_claims_an_empty_chunk(mocker):
+    cursor = MagicMock()
+    cursor.fetchone.return_value = {"command_id": "chunk"}
+    mocker.patch("todo.write.src.infra.bulk_import.get_db_transaction", return_value=MagicMock(__enter__=lambda s: cursor))
+
+    assert BulkTodoWriter().write_chunk([], uuid4()) is True
+    cursor.copy.assert_not_called()
+    assert cursor.execute.call_count == 1
+
+def test_run_import_reports_id_before_loading_and_appends_rejects_on_resume(mocker, tmp_path):
+    from todo.write.src.entrypoints import bulk_import as entrypoint
+
+    source = tmp_path / "todos.ndjson"
+    source.write_text('{"title": "One"}\n{"title": ""}\n')
+    rejects = tmp_path / "todos.ndjson.rejects.ndjson"
+    rejects.write_text('{"line": 9}\n')
+    logged = []
+    mocker.patch.object(entrypoint.logger, "info", side_effect=lambda msg, extra: logged.append(extra))
+    writer = mocker.patch.object(entrypoint, "BulkTodoWriter")
+    writer.return_value.write_chunk.side_effect = lambda items, chunk_id: logged.append("chunk") or True
+
+    import_id = uuid4()
+    result = entrypoint.run_import(str(source), import_id=import_id)
+
+    assert logged[0]["import_id"] == str(import_id) == result["import_id"]
+    assert logged[1] == "chunk"
+    assert rejects.read_text().splitlines()[0] == '{"line": 9}'
+    assert len(rejects.read_text().splitlines()) == 2
+
+    fresh = entrypoint.run_import(str(source))
+    assert logged[-2]["import_id"] == fresh["import_id"]
+    assert len(rejects.read_text().splitlines()) == 1
+
+def test_writer_copies_todos_and_events_after_claiming_the_chunk(mocker):
+    cursor = MagicMock()
+    cursor.fetchone.return_value = {"command_id": "claimed"}
+    copies = {}
+
+    def copy(sql):
+        copies[sql] = MagicMock()
+        return MagicMock(__enter__=lambda s: copies[sql])
+
+    cursor.copy.side_effect = copy
+    mocker.patch("todo.write.src.infra.bulk_import.get_db_transaction", return_value=MagicMock(__enter__=lambda s: cursor))
+    items = BulkImport(RecordingWriter())._valid([(1, {"title": "A", "priority": "Low"}), (2, {"title": "B"})])
+    items = list(items)
+
+    assert BulkTodoWriter().write_chunk(items, uuid4()) is True
+
+    todo_rows = [c.args[0] for c in copies[COPY_TODOS_SQL].write_row.call_args_list]
+    event_rows = [c.args[0] for c in copies[COPY_OUTBOX_SQL].write_row.call_args_list]
+    assert [(row[0], row[1], row[3]) for row in todo_rows] == [(items[0][0].id, "A", "Low"), (items[1][0].id, "B", None)]
+    assert [(row[0], row[1]) for row in event_rows] == [(items[0][0].id, "TodoCreated"), (items[1][0].id, "TodoCreated")]
+    assert json.loads(event_rows[0][2])["title"] == "A"
+    assert "pg_notify" in cursor.execute.call_args_list[-1].args[0]
+
+def test_writer_skips_chunk_claimed_by_earlier_run(mocker):
+    cursor = MagicMock()
+    cursor.fetchone.return_value = None
+    mocker.patch("todo.write.src.infra.bulk_import.get_db_transaction", return_value=MagicMock(__enter__=lambda s: cursor))
+
+    assert BulkTodoWriter().write_chunk([], uuid4()) is False
+    assert not cursor.copy.called
@@ -0,0 +1,30 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# The probe imports `todo` by package path, whatever directory pytest ran from
+REPO_ROOT = str(Path(__file__).resolve().parents[4])
+
+def _modules_loaded_by(module: str, candidates):
+    probe = f"import sys, {module}; print(','.join(m for m in {list(candidates)!r} if m in sys.modules))"
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [REPO_ROOT, os.environ.get("PYTHONPATH")]))}
+    result = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True, cwd=REPO_ROOT, env=env)
+    return [m for m in result.stdout.strip().split(",") if m]
+
+def test_api_import_defers_driver_and_tracer():
+    # The database driver and the X-Ray SDK load on first use, not at import
+    loaded = _modules_loaded_by("todo.write.src.entrypoints.api", ["psycopg", "psycopg_pool", "aws_xray_sdk"])
+    assert loaded == []
+
+def test_handlers_are_built_on_first_invocation(mocker):
+    from todo.write.src.entrypoints import routes
+    mocker.patch.object(routes, "handler", None)
+    mocker.patch.object(routes, "batch_handler", None)
+
+    routes._init_handlers()
+    first = routes.handler
+    routes._init_handlers()
+
+    assert first is not None and routes.handler is first
+    assert routes.batch_handler.repo is first.repo
@@ -0,0 +1,99 @@
+import json
+import threading
+import time
+from contextlib import contextmanager
+from uuid import uuid4
+from todo.write.src.app.create_todo_command import CreateTodoCommandHandler
+from todo.write.src.app.commands import CommandEnvelope
+from todo.write.src.infra.repo import TodoRepository, CREATE_TODOS_SQL
+
+class FakeDatabase:
+    """
+    Just enough of Postgres' behavior for the claiming statement: a claim on
+    a command id held by an uncommitted transaction blocks until it commits,
+    after which ON CONFLICT DO NOTHING returns no row.
+    """
+    def __init__(self):
+        self.lock = threading.Condition()
+        self.pending = set()
+        self.commands = {}
+        self.todos = []
+        self.notifies = 0
+
+    @contextmanager
+    def connection(self):
+        yield FakeConnection(self)
+
+class FakeConnection:
+    def __init__(self, db):
+        self.db = db
+        self.staged = None
+
+    @contextmanager
+    def transaction(self):
+        yield
+        if self.staged is not None:
+            command_id, result, todos = self.staged
+            # Widen the window in which duplicates hit the uncommitted claim
+            time.sleep(0.01)
+            with self.db.lock:
+                self.db.pending.discard(command_id)
+                self.db.commands[command_id] = result
+                self.db.todos.extend(todos)
+                self.db.notifies += 1
+                self.db.lock.notify_all()
+
+    @contextmanager
+    def cursor(self):
+        yield FakeCursor(self)
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.row = None
+
+    def execute(self, sql, params):
+        db = self.conn.db
+        with db.lock:
+            if sql == CREATE_TODOS_SQL:
+                command_id = params["command_id"]
+                while command_id in db.pending:
+                    db.lock.wait()
+                if command_id in db.commands:
+                    self.row = None
+                else:
+                    db.pending.add(command_id)
+                    result = {"result_status": params["result_status"], "result_body": json.loads(params["result_body"])}
+                    self.conn.staged = (command_id, result, params["ids"])
+                    self.row = {"command_id": command_id}
+            else:
+                self.row = db.commands.get(params[0])
+
+    def fetchone(self):
+        return self.row
+
+def test_concurrent_duplicate_commands_create_one_todo(mocker):
+    db = FakeDatabase()
+    mocker.patch("todo.write.src.infra.repo.get_db_pipeline", side_effect=db.connection)
+    handler = CreateTodoCommandHandler(repo=TodoRepository())
+    envelope = CommandEnvelope(command_id=uuid4(), payload={"title": "Submitted twice"})
+
+    workers = 8
+    start = threading.Barrier(workers)
+    results = []
+
+    def submit():
+        start.wait()
+        results.append(handler.handle(envelope))
+
+    threads = [threading.Thread(target=submit) for _ in range(workers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(db.todos) == 1
+    assert db.notifies == 1
+    assert len(results) == workers
+    assert {r.status_code for r in results} == {201}
+    assert {r.body["id"] for r in results} == {str(db.todos[0])}
@@ -0,0 +1,43 @@
+import pytest
+from unittest.mock import MagicMock
+from todo.write.src.infra import db
+
+@pytest.fixture(autouse=True)
+def reset_pool():
+    db._pool = None
+    yield
+    db._pool = None
+
+def test_pool_is_created_once_with_env_settings(mocker, monkeypatch):
+    monkeypatch.setenv("DATABASE_URL", "postgresql://localhost/todo")
+    monkeypatch.setenv("DB_POOL_MAX_SIZE", "8")
+    monkeypatch.setenv("DB_POOL_MAX_IDLE", "60")
+    pool_cls = mocker.patch("psycopg_pool.ConnectionPool")
+
+    first = db.get_pool()
+    second = db.get_pool()
+
+    assert first is second
+    assert pool_cls.call_count == 1
+    args, kwargs = pool_cls.call_args
+    assert args[0] == "postgresql://localhost/todo"
+    assert kwargs["max_size"] == 8
+    assert kwargs["max_idle"] == 60.0
+    assert kwargs["check"] is pool_cls.check_connection
+
+def test_transaction_checks_out_from_pool(mocker):
+    mock_cursor = MagicMock()
+    mock_conn = MagicMock()
+    mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+    mock_pool = MagicMock()
+    mock_pool.connection.return_value.__enter__.return_value = mock_conn
+    mocker.patch("todo.write.src.infra.db.get_pool", return_value=mock_pool)
+
+    with db.get_db_transaction() as cur:
+        assert cur is mock_cursor
+
+    mock_pool.connection.assert_called_once()
+    mock_conn.transaction.assert_called_once()
+
+def test_pool_stats_empty_before_first_use():
+    assert db.get_pool_stats() == {}
@@ -1,8 +1,11 @@
 from hypothesis import given, strategies as st
 from todo.write.src.domain.model import Todo, Priority
+from todo.write.src.domain.events import TodoCreated
+import json
 import pytest
+from dataclasses import FrozenInstanceError
 from uuid import UUID
-from datetime import datetime
+from datetime import datetime, timezone
 
 @given(
     title=st.text(min_size=1, max_size=500).map(lambda s: s.strip()).filter(lambda s: len(s) > 0),
@@ -41,3 +44,40 @@ def test_todo_creation_empty_title(empty_title):
 def test_todo_creation_invalid_description_length(long_desc):
     with pytest.raises(ValueError, match="Description must be 500 characters or less"):
         Todo.create(title="Valid Title", description=long_desc)
+
+@given(
+    title=st.text(min_size=1, max_size=500).map(lambda s: s.strip()).filter(lambda s: len(s) > 0),
+    description=st.one_of(st.none(), st.text(max_size=500)),
+    priority=st.one_of(st.none(), st.sampled_from(Priority)),
+    due_date=st.one_of(st.none(), st.datetimes(timezones=st.just(timezone.utc)))
+)
+def test_one_serialization_feeds_response_record_and_event(title, description, priority, due_date):
+    todo = Todo.create(title=title, description=description, priority=priority, due_date=due_date)
+    event = TodoCreated.from_todo(todo)
+
+    body = todo.to_dict()
+    assert body == {
+        "id": str(todo.id),
+        "title": todo.title,
+        "description": todo.description,
+        "priority": priority.value if priority else None,
+        "due_date": due_date.isoformat().replace("+00:00", "Z") if due_date else None,
+        "is_completed": False,
+        "created_at": todo.created_at.isoformat().replace("+00:00", "Z"),
+        "updated_at": todo.updated_at.isoformat().replace("+00:00", "Z")
+    }
+    assert todo.to_dict() is body
+    assert json.loads(todo.to_json()) == body
+    assert json.loads(event.payload_json()) == {k: body[k] for k in ("id", "title", "description", "priority", "due_date", "created_at")}
+
+def test_domain_objects_are_slotted_and_frozen():
+    todo = Todo.create(title="Slots")
+    event = TodoCreated.from_todo(todo)
+
+    for obj in (todo, event):
+        assert not hasattr(obj, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            obj.title = "Changed"
+    # Cached renderings take no part in equality
+    todo.to_json()
+    assert todo == Todo(**{f: getattr(todo, f) for f in ("id", "title", "description", "priority", "due_date", "is_completed", "created_at", "updated_at")})
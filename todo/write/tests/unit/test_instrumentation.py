@@ -0,0 +1,91 @@
+import json
+import pytest
+from types import SimpleNamespace
+from uuid import uuid4
+from unittest.mock import MagicMock
+from todo.write.src.app.create_todo_command import CreateTodoCommandHandler
+from todo.write.src.entrypoints import routes
+from todo.common import instrumentation as common
+from todo.write.src.infra import instrumentation
+
+@pytest.fixture
+def collected():
+    metrics = []
+    instrumentation.set_sink(metrics.append)
+    yield metrics
+    instrumentation.set_sink(None)
+
+class FakeCursor:
+    """
+    Stands in for psycopg.Cursor: records calls and reports the pipeline
+    status of its fake connection.
+    """
+    def __init__(self, pipeline: bool):
+        self.connection = SimpleNamespace(pgconn=SimpleNamespace(pipeline_status=1 if pipeline else 0))
+
+    def execute(self, query, params=None):
+        return self
+
+    def fetchone(self):
+        return {"ok": True}
+
+def test_disabled_instrumentation_is_a_shared_no_op():
+    instrumentation.set_sink(None)
+
+    assert instrumentation.request("CreateTodo") is instrumentation.stage("parse")
+    with instrumentation.request("CreateTodo"):
+        assert instrumentation.current() is None
+        assert instrumentation.timed_cursors(MagicMock()) is instrumentation.stage("persist")
+
+def test_create_reports_every_stage(mocker, collected):
+    mocker.patch.object(routes, "handler", CreateTodoCommandHandler(MagicMock()))
+
+    result = routes.create_todo({"X-Command-ID": str(uuid4())}, json.dumps({"title": "Measured"}))
+
+    assert result["statusCode"] == 201
+    [metrics] = collected
+    assert (metrics.operation, metrics.service) == ("CreateTodo", "todo-write")
+    assert {"stage_parse", "stage_validate", "stage_domain", "stage_persist", "stage_serialize", "total"} <= set(metrics.timings)
+    assert metrics.timings["total"] >= metrics.timings["stage_persist"]
+
+def test_round_trips_follow_pipeline_flushes(collected):
+    timed = common._timed_cursor(FakeCursor)
+
+    with instrumentation.request("Test"):
+        plain = timed(pipeline=False)
+        plain.execute("SELECT 1")
+        plain.execute("SELECT 2")
+        plain.fetchone()
+
+        pipelined = timed(pipeline=True)
+        pipelined.execute("INSERT 1")
+        pipelined.execute("INSERT 2")
+        pipelined.fetchone()
+        pipelined.fetchone()
+
+    [metrics] = collected
+    assert metrics.counts == {"db_queries": 4, "db_round_trips": 3}
+    assert "db_query" in metrics.timings
+
+def test_cursor_factory_is_restored_before_release(collected):
+    conn = SimpleNamespace(cursor_factory=FakeCursor)
+
+    with instrumentation.request("Test"):
+        with instrumentation.timed_cursors(conn):
+            assert issubclass(conn.cursor_factory, FakeCursor)
+            assert conn.cursor_factory is not FakeCursor
+
+    assert conn.cursor_factory is FakeCursor
+
+def test_emf_sink_writes_embedded_metric_format(capsys):
+    metrics = instrumentation.RequestMetrics("CreateTodo", instrumentation.SERVICE)
+    metrics.add_time("stage_persist", 0.004)
+    metrics.incr("db_round_trips")
+
+    common._emf_sink(metrics)
+
+    document = json.loads(capsys.readouterr().out.strip().splitlines()[-1])
+    assert document["operation"] == "CreateTodo"
+    assert document["service"] == "todo-write"
+    assert document["stage_persist"] == [4.0]
+    assert document["db_round_trips"] == [1.0]
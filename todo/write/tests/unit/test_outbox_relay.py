@@ -0,0 +1,129 @@
+import pytest
+import threading
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+from uuid import UUID
+from todo.write.src.app.outbox_relay import OutboxRelay
+from todo.write.src.infra.outbox import OutboxPublisher, ListenerLost, outbox_event_message
+
+def _rows(*ids):
+    created_at = datetime.now(timezone.utc) - timedelta(seconds=3)
+    return [
+        {"id": i, "aggregate_id": None, "event_type": "TodoCreated", "payload": {"id": str(i)}, "created_at": created_at}
+        for i in ids
+    ]
+
+@pytest.fixture
+def mock_cursor(mocker):
+    cursor = MagicMock()
+    mocker.patch("todo.write.src.infra.outbox.get_db_transaction", return_value=MagicMock(__enter__=lambda s: cursor))
+    return cursor
+
+def test_relay_batch_claims_publishes_and_marks_in_one_transaction(mock_cursor):
+    mock_cursor.fetchall.return_value = _rows(1, 2)
+    sink = MagicMock()
+
+    events = OutboxPublisher().relay_batch(sink, limit=10)
+
+    claim_sql = mock_cursor.execute.call_args_list[0][0][0]
+    assert "ORDER BY id" in claim_sql
+    assert "FOR UPDATE SKIP LOCKED" in claim_sql
+    messages = sink.call_args[0][0]
+    assert [m["payload"]["id"] for m in messages] == ["1", "2"]
+    update_sql, update_params = mock_cursor.execute.call_args_list[1][0]
+    assert "SET published_at = NOW()" in update_sql
+    assert update_params == ([1, 2],)
+    assert len(events) == 2
+
+def test_relay_batch_leaves_events_pending_when_sink_fails(mock_cursor):
+    mock_cursor.fetchall.return_value = _rows(1)
+    sink = MagicMock(side_effect=RuntimeError("sink down"))
+
+    with pytest.raises(RuntimeError):
+        OutboxPublisher().relay_batch(sink)
+
+    assert mock_cursor.execute.call_count == 1
+
+def test_event_ids_are_stable_uuids():
+    row = _rows(42)[0]
+    first = outbox_event_message(row)["event_id"]
+    assert UUID(first)
+    assert outbox_event_message(row)["event_id"] == first
+    assert outbox_event_message(_rows(43)[0])["event_id"] != first
+
+def test_drain_stops_on_short_batch_and_reports_metrics():
+    publisher = MagicMock()
+    publisher.relay_batch.side_effect = [_rows(1, 2), _rows(3), []]
+    relay = OutboxRelay(publisher, sink=MagicMock(), batch_size=2)
+
+    assert relay.drain() == 3
+    assert publisher.relay_batch.call_count == 2
+    assert relay.stats["relayed"] == 3
+    assert relay.stats["batches"] == 2
+    assert relay.stats["lag_seconds"] >= 3
+
+def test_listening_relay_drains_on_notification_only():
+    publisher = MagicMock()
+    publisher.relay_batch.return_value = []
+    stop = threading.Event()
+    notifications = iter([False, True, False])
+
+    def wait(timeout):
+        try:
+            return next(notifications)
+        except StopIteration:
+            stop.set()
+            return False
+
+    publisher.listen.return_value.__enter__.return_value = wait
+    relay = OutboxRelay(publisher, sink=MagicMock(), batch_size=10)
+
+    relay.run_listening(fallback_interval=3600, stop=stop)
+
+    # One catch-up drain on subscribe plus one for the notification
+    assert publisher.relay_batch.call_count == 2
+
+def test_listening_relay_reconnects_after_connection_loss():
+    publisher = MagicMock()
+    publisher.relay_batch.return_value = []
+    stop = threading.Event()
+
+    def lost(timeout):
+        raise ListenerLost("server closed the connection unexpectedly")
+
+    def idle(timeout):
+        stop.set()
+        return False
+
+    publisher.listen.return_value.__enter__.side_effect = [lost, idle]
+    relay = OutboxRelay(publisher, sink=MagicMock(), batch_size=10)
+
+    relay.run_listening(fallback_interval=3600, stop=stop, reconnect_delay=0)
+
+    # The listener was reopened and drained again on resubscribing
+    assert publisher.listen.call_count == 2
+    assert publisher.relay_batch.call_count == 2
+    assert relay.stats["listen_reconnects"] == 1
+
+def test_listen_reports_a_dropped_connection_as_listener_lost(mocker):
+    import psycopg
+
+    conn = MagicMock()
+    conn.notifies.side_effect = psycopg.OperationalError("server closed the connection unexpectedly")
+    mocker.patch("todo.write.src.infra.outbox.get_listen_connection", return_value=MagicMock(__enter__=lambda s: conn))
+
+    with pytest.raises(ListenerLost):
+        with OutboxPublisher().listen() as wait:
+            wait(1.0)
+
+def test_listen_reports_a_failed_connect_as_listener_lost(mocker):
+    import psycopg
+
+    mocker.patch(
+        "todo.write.src.infra.outbox.get_listen_connection",
+        side_effect=psycopg.OperationalError("connection refused")
+    )
+
+    with pytest.raises(ListenerLost):
+        with OutboxPublisher().listen():
+            pass
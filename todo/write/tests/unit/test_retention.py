@@ -0,0 +1,150 @@
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+from hypothesis import given, strategies as st
+from todo.common.retention import purge_in_batches
+from todo.write.src.infra.retention import WriteRetention, month_start, add_months, outbox_partition_name
+
+@pytest.fixture
+def mock_cursor(mocker):
+    cursor = MagicMock()
+    mocker.patch("todo.write.src.infra.retention.get_db_transaction", return_value=MagicMock(__enter__=lambda s: cursor))
+    return cursor
+
+def test_purge_stops_at_first_short_batch():
+    batches = iter([100, 100, 42, 100])
+    delete = MagicMock(side_effect=lambda limit: next(batches))
+
+    assert purge_in_batches(delete, 100) == 242
+    assert delete.call_count == 3
+
+def test_purge_stops_when_out_of_time():
+    delete = MagicMock(return_value=100)
+    budget = iter([True, True, False])
+
+    assert purge_in_batches(delete, 100, keep_going=lambda: next(budget)) == 200
+
+@given(year=st.integers(2000, 2100), month=st.integers(1, 12), months=st.integers(-36, 36))
+def test_add_months_matches_calendar(year, month, months):
+    start = datetime(year, month, 1, tzinfo=timezone.utc)
+    shifted = add_months(start, months)
+    assert shifted.day == 1
+    assert (shifted.year - year) * 12 + shifted.month - month == months
+    assert add_months(shifted, -months) == start
+
+def test_partition_names_follow_utc_months():
+    moment = datetime(2026, 11, 30, 23, 30, tzinfo=timezone.utc)
+    assert outbox_partition_name(month_start(moment)) == "outbox_p202611"
+    assert outbox_partition_name(add_months(month_start(moment), 2)) == "outbox_p202701"
+
+def test_delete_published_outbox_is_bounded_and_skips_locked_rows(mock_cursor):
+    mock_cursor.rowcount = 7
+    cutoff = datetime(2026, 10, 1, tzinfo=timezone.utc)
+
+    assert WriteRetention().delete_published_outbox(cutoff, limit=500) == 7
+
+    sql, params = mock_cursor.execute.call_args[0]
+    assert "published_at < %(cutoff)s" in sql
+    assert "FOR UPDATE SKIP LOCKED" in sql
+    assert params == {"cutoff": cutoff, "limit": 500}
+
+def _statements(cursor):
+    return [c[0][0] if isinstance(c[0][0], str) else c[0][0].as_string(None) for c in cursor.execute.call_args_list]
+
+def test_create_outbox_partitions_only_creates_missing_months(mocker, mock_cursor):
+    retention = WriteRetention()
+    mocker.patch.object(retention, "list_outbox_partitions", return_value=[
+        ("outbox_p202610", datetime(2026, 10, 1, tzinfo=timezone.utc))
+    ])
+    mock_cursor.fetchall.return_value = []
+    mock_cursor.fetchone.return_value = {"misplaced": False}
+
+    created = retention.create_outbox_partitions(datetime(2026, 10, 18, tzinfo=timezone.utc), months_ahead=2)
+
+    assert created == ["outbox_p202611", "outbox_p202612"]
+    assert not any("DETACH" in s for s in _statements(mock_cursor))
+
+def test_create_outbox_partitions_moves_rows_out_of_the_default_partition(mocker, mock_cursor):
+    from todo.write.src.infra import retention as retention_module
+
+    retention = WriteRetention()
+    mocker.patch.object(retention, "list_outbox_partitions", return_value=[])
+    # Maintenance fell behind: September's events are in the default partition
+    mock_cursor.fetchall.return_value = [{"month": datetime(2026, 9, 1, tzinfo=timezone.utc)}]
+    mock_cursor.fetchone.side_effect = [{"misplaced": True}, {"misplaced": False}]
+
+    created = retention.create_outbox_partitions(datetime(2026, 10, 18, tzinfo=timezone.utc), months_ahead=0)
+
+    assert created == ["outbox_p202609", "outbox_p202610"]
+    statements = _statements(mock_cursor)
+    september = statements[1:statements.index(retention_module.ATTACH_DEFAULT_PARTITION_SQL) + 1]
+    assert september[1] == "LOCK TABLE ONLY santiago_munoz_write.outbox IN ACCESS EXCLUSIVE MODE"
+    assert september[2:4] == [retention_module.SELECT_DEFAULT_HAS_MONTH_SQL, retention_module.DETACH_DEFAULT_PARTITION_SQL]
+    assert september[4].startswith('CREATE TABLE IF NOT EXISTS santiago_munoz_write."outbox_p202609" PARTITION OF')
+    assert "DELETE FROM santiago_munoz_write.outbox_default" in september[5]
+    assert 'INSERT INTO santiago_munoz_write."outbox_p202609"' in september[5]
+    assert statements.count(retention_module.DETACH_DEFAULT_PARTITION_SQL) == 1
+
+def test_create_outbox_partitions_carries_on_past_a_failing_month(mocker, mock_cursor):
+    from psycopg import errors
+
+    retention = WriteRetention()
+    mocker.patch.object(retention, "list_outbox_partitions", return_value=[])
+    mock_cursor.fetchall.return_value = []
+    mock_cursor.fetchone.return_value = {"misplaced": False}
+    failures = iter([errors.CheckViolation("partition constraint for default partition would be violated")])
+
+    def execute(query, params=None):
+        if not isinstance(query, str) and "CREATE TABLE" in query.as_string(None):
+            failure = next(failures, None)
+            if failure:
+                raise failure
+
+    mock_cursor.execute.side_effect = execute
+
+    created = retention.create_outbox_partitions(datetime(2026, 10, 18, tzinfo=timezone.utc), months_ahead=1)
+
+    assert created == ["outbox_p202611"]
+
+def test_drop_outbox_partitions_keeps_months_with_pending_events(mocker, mock_cursor):
+    retention = WriteRetention()
+    mocker.patch.object(retention, "list_outbox_partitions", return_value=[
+        ("outbox_p202607", datetime(2026, 7, 1, tzinfo=timezone.utc)),
+        ("outbox_p202608", datetime(2026, 8, 1, tzinfo=timezone.utc)),
+        ("outbox_p202609", datetime(2026, 9, 1, tzinfo=timezone.utc)),
+    ])
+    mock_cursor.fetchone.side_effect = [{"pending": True}, {"pending": False}]
+
+    dropped = retention.drop_outbox_partitions(datetime(2026, 9, 15, tzinfo=timezone.utc))
+
+    # July still has a pending event, August is dropped, September is not over yet
+    assert dropped == ["outbox_p202608"]
+    assert mock_cursor.fetchone.call_count == 2
+
+def test_drop_outbox_partitions_locks_parent_first_and_skips_when_busy(mocker, mock_cursor):
+    from psycopg import errors
+
+    retention = WriteRetention()
+    mocker.patch.object(retention, "list_outbox_partitions", return_value=[
+        ("outbox_p202607", datetime(2026, 7, 1, tzinfo=timezone.utc)),
+        ("outbox_p202608", datetime(2026, 8, 1, tzinfo=timezone.utc)),
+    ])
+    statements = []
+
+    def execute(query, params=None):
+        statements.append(query if isinstance(query, str) else query.as_string(None))
+        # The relay holds the outbox while the July drop waits
+        if len(statements) == 2:
+            raise errors.LockNotAvailable("canceling statement due to lock timeout")
+
+    mock_cursor.execute.side_effect = execute
+    mock_cursor.fetchone.return_value = {"pending": False}
+
+    dropped = retention.drop_outbox_partitions(datetime(2026, 9, 15, tzinfo=timezone.utc), lock_timeout_ms=500)
+
+    assert dropped == ["outbox_p202608"]
+    assert statements[0] == "SET LOCAL lock_timeout = '500ms'"
+    august = statements[2:]
+    assert august[1] == "LOCK TABLE ONLY santiago_munoz_write.outbox IN ACCESS EXCLUSIVE MODE"
+    assert august[2] == 'LOCK TABLE santiago_munoz_write."outbox_p202608" IN ACCESS EXCLUSIVE MODE'
+    assert august[-1] == 'DROP TABLE santiago_munoz_write."outbox_p202608"'